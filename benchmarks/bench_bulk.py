@@ -0,0 +1,93 @@
+"""
+Concurrency of bulk moderation within one guild
+
+Runs /bulk-moderate style mutes against a simulated REST layer: one room
+with BULK_ACTION_CONCURRENCY=1 (sequential) and with the configured limit,
+then several owners of the same guild at once while another owner kicks
+someone, to show that one guild's bulk actions overlap without starving
+other owners.
+
+Usage: python -m benchmarks.bench_bulk [--members N] [--rooms N] [--latency S]
+"""
+import argparse
+import asyncio
+import dataclasses
+import time
+
+from benchmarks.fakes import FakeRest
+from benchmarks.harness import HarnessBot, build_world, invoke, new_interaction
+
+
+async def bulk(cog, owner, action):
+    return await cog.bulk_moderate(owner, owner.voice.channel, action, list(owner.voice.channel.members))
+
+
+def show(label, elapsed, rest, extra=""):
+    print(f"  {label:<34} {elapsed * 1000:8.0f} ms  peak {rest.peak_in_flight:3d} REST calls in flight{extra}")
+
+
+async def run(args):
+    rest = FakeRest(latency=args.latency, jitter=0)
+    bot = HarnessBot(rest)
+    cog = await bot.start_harness()
+    guild = build_world(bot, rest, members_per_guild=(args.rooms + 1) * (args.members + 1), managers_per_guild=args.rooms + 1)[0]
+    members = list(guild.members.values())
+    owners = members[:args.rooms + 1]
+    guests = members[args.rooms + 1:]
+
+    # Every owner gets a room with its guests in it
+    for owner in owners:
+        await cog.create_gaming_channel(new_interaction(bot, guild, owner), "PC", "Valorant", "99")
+    await bot.settle()
+    for index, owner in enumerate(owners):
+        channel = guild.get_channel(next(iter(bot.temp_channels.channels_of(owner.id))))
+        for member in (owner, *guests[index * args.members:(index + 1) * args.members]):
+            guild.move(member, channel)
+    await bot.settle()
+
+    print(f"== bulk mute of {args.members} members in one room ({args.latency * 1000:.0f} ms per call)")
+    configured = bot.config
+    for label, limit, action in (
+        ("sequential (concurrency 1)", 1, "mute"),
+        (f"concurrent (concurrency {configured.BULK_ACTION_CONCURRENCY})", configured.BULK_ACTION_CONCURRENCY, "unmute"),
+    ):
+        bot.config = dataclasses.replace(configured, BULK_ACTION_CONCURRENCY=limit)
+        rest.peak_in_flight = 0
+        started = time.perf_counter()
+        await bulk(cog, owners[0], action)
+        show(label, time.perf_counter() - started, rest)
+    bot.config = configured
+
+    print(f"== {args.rooms} owners bulk muting at once, plus one kick by another owner")
+    kicker = owners[-1]
+    victim = next(member for member in kicker.voice.channel.members if member is not kicker)
+    kick_latency = None
+
+    async def kick():
+        nonlocal kick_latency
+        await asyncio.sleep(args.latency)  # Arrives once the bulk actions are queued
+        started = time.perf_counter()
+        await invoke(cog.kick_user, cog, new_interaction(bot, guild, kicker), victim)
+        kick_latency = time.perf_counter() - started
+
+    rest.peak_in_flight = 0
+    started = time.perf_counter()
+    await asyncio.gather(kick(), *(bulk(cog, owner, "mute") for owner in owners[:args.rooms]))
+    show(
+        f"{args.rooms * args.members} mutes", time.perf_counter() - started, rest,
+        f", kick took {kick_latency * 1000:.0f} ms (guild cap {bot.actions.guild_member_concurrency})"
+    )
+
+    await bot.stop_harness()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--members", type=int, default=25, help="members per room")
+    parser.add_argument("--rooms", type=int, default=4, help="owners bulk moderating at once")
+    parser.add_argument("--latency", type=float, default=0.05, help="simulated REST latency in seconds")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Drive the slash command handlers concurrently against a simulated REST layer
+
+Usage: python -m benchmarks.bench_commands [--users N] [--latency S] [--rate-limit P]
+"""
+import argparse
+import asyncio
+import time
+
+from benchmarks.fakes import FakeRest
+from benchmarks.harness import (
+    HarnessBot, MemoryTracker, TaskSampler, build_world, invoke, new_interaction, report,
+)
+
+
+async def timed(latencies, coro):
+    started = time.perf_counter()
+    await coro
+    latencies.append(time.perf_counter() - started)
+
+
+async def run(args):
+    rest = FakeRest(latency=args.latency, rate_limit_chance=args.rate_limit, seed=args.seed)
+    bot = HarnessBot(rest)
+    cog = await bot.start_harness()
+    guild = build_world(bot, rest, members_per_guild=args.users * 3, managers_per_guild=args.users)[0]
+    members = list(guild.members.values())
+    owners = members[:args.users]
+    guests = members[args.users:]
+    platforms = bot.config.PLATFORMS
+
+    results = {}
+    with MemoryTracker() as memory, TaskSampler() as tasks:
+        # Every owner creates a gaming channel at the same moment
+        latencies = []
+        started = time.perf_counter()
+        await asyncio.gather(*(
+            timed(latencies, cog.create_gaming_channel(
+                new_interaction(bot, guild, owner), platforms[index % len(platforms)], "Valorant", "10"
+            ))
+            for index, owner in enumerate(owners)
+        ))
+        results["create_gaming_channel"] = (len(owners), time.perf_counter() - started, latencies)
+
+        # Owners join their rooms and pull two guests each
+        for index, owner in enumerate(owners):
+            channel = guild.get_channel(next(iter(bot.temp_channels.channels_of(owner.id))))
+            guild.move(owner, channel)
+            for guest in guests[index * 2:index * 2 + 2]:
+                guild.move(guest, channel)
+        await bot.settle()
+
+        for name, command, pick in (
+            ("mute_user", cog.mute_user, 0),
+            ("ban_user", cog.ban_user, 1),
+            ("kick_user", cog.kick_user, 0),
+            ("transfer_owner", cog.transfer_owner, None),
+        ):
+            latencies = []
+            started = time.perf_counter()
+            calls = []
+            for index, owner in enumerate(owners):
+                room_guests = [guest for guest in guests[index * 2:index * 2 + 2]
+                               if guest.voice and owner.voice and guest.voice.channel == owner.voice.channel]
+                if pick is None:
+                    # Hand the room to the owner itself: exercises the edit path without moving anyone
+                    target = owner
+                elif len(room_guests) > pick:
+                    target = room_guests[pick]
+                elif room_guests:
+                    target = room_guests[0]
+                else:
+                    continue
+                calls.append(timed(latencies, invoke(command, cog, new_interaction(bot, guild, owner), target)))
+            await asyncio.gather(*calls)
+            await bot.settle()
+            results[name] = (len(calls), time.perf_counter() - started, latencies)
+
+        latencies = []
+        started = time.perf_counter()
+        await asyncio.gather(*(
+            timed(latencies, invoke(cog.list_temp_channels, cog, new_interaction(bot, guild, owner)))
+            for owner in owners
+        ))
+        results["list_temp_channels"] = (len(owners), time.perf_counter() - started, latencies)
+
+        latencies = []
+        started = time.perf_counter()
+        await asyncio.gather(*(
+            timed(latencies, invoke(cog.delete_voice_channel, cog, new_interaction(bot, guild, owner)))
+            for owner in owners
+        ))
+        await bot.settle()
+        results["delete_voice_channel"] = (len(owners), time.perf_counter() - started, latencies)
+
+    for name, (count, elapsed, latencies) in results.items():
+        report(name, count, elapsed, latencies)
+    report(
+        "totals",
+        sum(count for count, _, _ in results.values()),
+        sum(elapsed for _, elapsed, _ in results.values()),
+        [],
+        rest=rest,
+        tasks=tasks,
+        memory=memory.result,
+        extra={"actions": bot.actions.stats()},
+    )
+    await bot.stop_harness()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", type=int, default=200, help="concurrent channel owners")
+    parser.add_argument("--latency", type=float, default=0.05, help="simulated REST latency in seconds")
+    parser.add_argument("--rate-limit", type=float, default=0.02, help="chance of a simulated 429 per call")
+    parser.add_argument("--seed", type=int, default=1)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+Per-interaction cost of the /gaming-channel, room panel and /voice-help responses
+
+Compares building the embeds, select options and views on every call (as
+the commands did before) with the prebuilt ones from commands.voice_channels.
+Responses go through the fake interaction layer, which serializes them and
+stores views the way discord.py does after sending, so views that would stay
+alive waiting for their timeout show up in the retained memory and task count.
+
+Usage: python -m benchmarks.bench_interactions [--interactions N]
+"""
+import argparse
+import asyncio
+import gc
+import time
+import tracemalloc
+
+import discord
+
+from benchmarks.fakes import FakeRest
+from benchmarks.harness import HarnessBot, build_world, invoke, new_interaction
+from commands.voice_channels import RoomPanelButton
+
+
+class LegacyPlatformSelect(discord.ui.Select):
+    def __init__(self, platforms):
+        options = [
+            discord.SelectOption(label=platform, value=platform, emoji="🎮")
+            for platform in platforms
+        ]
+        super().__init__(placeholder="Choose your platform...", options=options)
+
+
+class LegacyChannelCreationView(discord.ui.View):
+    def __init__(self, platforms):
+        super().__init__(timeout=300)
+        self.add_item(LegacyPlatformSelect(platforms))
+
+
+class LegacyChannelCreationModal(discord.ui.Modal, title='Create Gaming Voice Channel'):
+    def __init__(self, platform):
+        super().__init__()
+        self.selected_platform = platform
+
+    game_name = discord.ui.TextInput(label='Game Name', required=True, max_length=50)
+    max_users = discord.ui.TextInput(label='Max Users (2-99)', required=False, max_length=2)
+
+
+async def legacy_room_flow(interaction, platforms):
+    """/gaming-channel then a platform pick: a view per user, then a modal per user"""
+    await legacy_gaming_setup(interaction, platforms)
+    interaction.response._done = False  # The pick is a second interaction
+    await interaction.response.send_modal(LegacyChannelCreationModal(platforms[0]))
+
+
+async def legacy_gaming_setup(interaction, platforms):
+    """/gaming-channel as it was: a new embed and a new 300s view per call"""
+    embed = discord.Embed(
+        title="🎮 Create Gaming Voice Channel",
+        description="Click the button below to set up your gaming voice channel with platform, game, and user limit options!",
+        color=discord.Color.blue()
+    )
+    embed.add_field(
+        name="📋 What you'll set:",
+        value="• Platform (PC, Mobile, Console)\n• Game name\n• Maximum users\n• Auto-cleanup when empty",
+        inline=False
+    )
+    embed.set_footer(text="Channel will be named: {Platform} - {Game} - {Your Name}")
+    view = LegacyChannelCreationView(platforms)
+    await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
+
+
+async def legacy_voice_help(interaction):
+    """/voice-help as it was: the whole embed rebuilt per call"""
+    embed = discord.Embed(
+        title="🔊 Voice Channel Bot Help",
+        description="Manage temporary voice channels with these commands:",
+        color=discord.Color.green()
+    )
+    for name, value in (
+        ("/create-voice [name]", "Create a temporary voice channel with an optional custom name. "
+                                 "The channel will be automatically deleted when empty."),
+        ("/delete-voice", "Delete a temporary voice channel you created."),
+        ("/list-temp-channels", "Show the active temporary voice channels in this server."),
+        ("/voice-help", "Show this help message."),
+        ("📋 Requirements", "• You must be in a voice channel OR have 'Manage Channels' permission\n"
+                           "• Channel names are automatically sanitized\n"
+                           "• Channels auto-delete when empty"),
+    ):
+        embed.add_field(name=name, value=value, inline=False)
+    embed.set_footer(text="Bot created for temporary voice channel management")
+    await interaction.response.send_message(embed=embed, ephemeral=True)
+
+
+async def measure(label, bot, handler, interactions):
+    """Run handler once per interaction, report CPU time, retained memory and the views/modals discord.py keeps"""
+    gc.collect()
+    views_before = bot.stored_views()
+    tasks_before = len(asyncio.all_tasks())
+    tracemalloc.start()
+    started = time.perf_counter()
+    for interaction in interactions:
+        await handler(interaction)
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    count = len(interactions)
+    kept = bot.stored_views() - views_before
+    print(
+        f"  {label:<28} {elapsed / count * 1e6:7.1f} us/call  "
+        f"{retained / count:7.0f} B retained/call  {peak / 1024:6.0f} KiB peak  "
+        f"{len(kept):5d} views kept  {len(asyncio.all_tasks()) - tasks_before:5d} timeout tasks"
+    )
+    for view in kept:
+        view.stop()  # Keep one run's views out of the next
+    await asyncio.sleep(0)
+    return elapsed
+
+
+async def run(args):
+    rest = FakeRest(latency=0, jitter=0)
+    bot = HarnessBot(rest)
+    cog = await bot.start_harness()
+    guild = build_world(bot, rest, members_per_guild=50)[0]
+    users = list(guild.members.values())
+    platforms = bot.config.PLATFORMS
+
+    def interactions():
+        return [new_interaction(bot, guild, users[index % len(users)]) for index in range(args.interactions)]
+
+    print(f"== /gaming-channel ({args.interactions} interactions)")
+    old = await measure("per-call embed + view", bot, lambda i: legacy_gaming_setup(i, platforms), interactions())
+    new = await measure("prebuilt + persistent view", bot, lambda i: invoke(cog.gaming_channel_setup, cog, i), interactions())
+    print(f"  speedup:                     {old / new:.1f}x")
+
+    print(f"== room form, from /gaming-channel vs a room panel button ({args.interactions} users)")
+    old = await measure("/gaming-channel + pick", bot, lambda i: legacy_room_flow(i, platforms), interactions())
+    button = RoomPanelButton(platforms[0])
+    new = await measure("panel button", bot, button.callback, interactions())
+    print(f"  speedup:                     {old / new:.1f}x")
+
+    print(f"== /voice-help ({args.interactions} interactions)")
+    old = await measure("per-call embed", bot, legacy_voice_help, interactions())
+    new = await measure("prebuilt embed", bot, lambda i: invoke(cog.voice_help, cog, i), interactions())
+    print(f"  speedup:                     {old / new:.1f}x")
+
+    await bot.stop_harness()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--interactions", type=int, default=5000)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+"""
+Compare the memory footprint of the default and lean runtime profiles
+
+Feeds synthetic gateway payloads for a large guild (channels, roles, voice
+churn, chat messages and typing events) straight into discord.py's
+connection state, the same way the gateway would. Events are filtered by
+the profile's intents first, as Discord only sends what was subscribed to.
+
+Usage: python -m benchmarks.bench_memory_profile [--members N] [--messages N] [--voice-events N]
+"""
+import argparse
+import asyncio
+import gc
+import itertools
+import os
+import random
+import time
+import tracemalloc
+
+os.environ.setdefault("REGISTRY_BACKEND", "memory")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import discord  # noqa: E402
+
+from bot import VoiceChannelBot  # noqa: E402
+
+# Gateway event -> intent required to receive it
+EVENT_INTENTS = {
+    "GUILD_CREATE": "guilds",
+    "VOICE_STATE_UPDATE": "voice_states",
+    "MESSAGE_CREATE": "guild_messages",
+    "TYPING_START": "guild_typing",
+}
+
+GUILD_ID = 900000000000000000
+TIMESTAMP = "2024-01-01T00:00:00.000000+00:00"
+
+
+def user_payload(user_id):
+    return {
+        "id": str(user_id),
+        "username": f"user{user_id % 1000000}",
+        "discriminator": "0",
+        "global_name": None,
+        "avatar": None,
+    }
+
+
+def member_payload(user_id):
+    return {
+        "user": user_payload(user_id),
+        "roles": [],
+        "joined_at": TIMESTAMP,
+        "deaf": False,
+        "mute": False,
+        "flags": 0,
+    }
+
+
+def voice_state_payload(user_id, channel_id):
+    return {
+        "guild_id": str(GUILD_ID),
+        "channel_id": str(channel_id) if channel_id else None,
+        "user_id": str(user_id),
+        "session_id": f"session-{user_id}",
+        "deaf": False,
+        "mute": False,
+        "self_deaf": False,
+        "self_mute": False,
+        "self_video": False,
+        "suppress": False,
+        "request_to_speak_timestamp": None,
+        "member": member_payload(user_id),
+    }
+
+
+def channel_payload(channel_id, channel_type, position):
+    payload = {
+        "id": str(channel_id),
+        "type": channel_type,
+        "guild_id": str(GUILD_ID),
+        "name": f"channel-{position}",
+        "position": position,
+        "permission_overwrites": [],
+        "nsfw": False,
+        "parent_id": None,
+    }
+    if channel_type == 2:
+        payload.update(bitrate=64000, user_limit=0, rtc_region=None)
+    else:
+        payload.update(topic=None, last_message_id=None, rate_limit_per_user=0)
+    return payload
+
+
+def guild_payload(members, text_channels, voice_channels, in_voice, bot_id):
+    """GUILD_CREATE for a large guild without the members intent.
+
+    Discord then only includes the bot and the members who are in voice.
+    """
+    voice_states = [voice_state_payload(user_id, channel_id) for user_id, channel_id in in_voice.items()]
+    return {
+        "id": str(GUILD_ID),
+        "name": "Synthetic Guild",
+        "icon": None,
+        "owner_id": str(bot_id),
+        "roles": [{
+            "id": str(GUILD_ID), "name": "@everyone", "permissions": "0", "position": 0,
+            "color": 0, "hoist": False, "managed": False, "mentionable": False,
+        }],
+        "emojis": [],
+        "stickers": [],
+        "features": [],
+        "channels": (
+            [channel_payload(channel_id, 0, index) for index, channel_id in enumerate(text_channels)]
+            + [channel_payload(channel_id, 2, index) for index, channel_id in enumerate(voice_channels)]
+        ),
+        "threads": [],
+        "stage_instances": [],
+        "guild_scheduled_events": [],
+        "voice_states": voice_states,
+        "members": [member_payload(bot_id)] + [member_payload(int(state["user_id"])) for state in voice_states],
+        "member_count": members,
+        "large": True,
+        "premium_tier": 0,
+        "system_channel_flags": 0,
+        "verification_level": 0,
+        "default_message_notifications": 0,
+        "explicit_content_filter": 0,
+        "mfa_level": 0,
+        "nsfw_level": 0,
+        "preferred_locale": "en-US",
+        "afk_timeout": 300,
+    }
+
+
+def message_payload(message_id, channel_id, user_id, rng):
+    return {
+        "id": str(message_id),
+        "channel_id": str(channel_id),
+        "guild_id": str(GUILD_ID),
+        "author": user_payload(user_id),
+        "member": {key: value for key, value in member_payload(user_id).items() if key != "user"},
+        "content": "gg " * rng.randint(1, 40),
+        "timestamp": TIMESTAMP,
+        "edited_timestamp": None,
+        "tts": False,
+        "mention_everyone": False,
+        "mentions": [],
+        "mention_roles": [],
+        "attachments": [],
+        "embeds": [],
+        "pinned": False,
+        "type": 0,
+    }
+
+
+def gateway_events(args, rng, text_channels, voice_channels, in_voice):
+    """Yield (event name, payload): voice churn interleaved with chat traffic"""
+    user_ids = [10 ** 17 + index for index in range(args.members)]
+    message_id = 10 ** 18
+    total = args.voice_events + args.messages * 2
+    for _ in range(total):
+        roll = rng.random() * total
+        user_id = rng.choice(user_ids)
+        if roll < args.voice_events:
+            if user_id in in_voice and rng.random() < 0.5:
+                in_voice.pop(user_id)
+                channel_id = None
+            else:
+                channel_id = in_voice[user_id] = rng.choice(voice_channels)
+            yield "VOICE_STATE_UPDATE", voice_state_payload(user_id, channel_id)
+        elif roll < args.voice_events + args.messages:
+            message_id += 1
+            yield "MESSAGE_CREATE", message_payload(message_id, rng.choice(text_channels), user_id, rng)
+        else:
+            yield "TYPING_START", {
+                "channel_id": str(rng.choice(text_channels)),
+                "guild_id": str(GUILD_ID),
+                "user_id": str(user_id),
+                "timestamp": int(time.time()),
+                "member": member_payload(user_id),
+            }
+
+
+async def run_profile(profile, args):
+    os.environ["RUNTIME_PROFILE"] = profile
+    rng = random.Random(args.seed)
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+
+    bot = VoiceChannelBot()
+    await bot._async_setup_hook()  # Binds the event loop without logging in
+    state = bot._connection
+    intents = state._intents
+    bot_id = 1
+    state.user = discord.ClientUser(state=state, data=user_payload(bot_id))
+
+    text_channels = [GUILD_ID + 1000 + index for index in range(args.text_channels)]
+    voice_channels = [GUILD_ID + 5000 + index for index in range(args.voice_channels)]
+    user_ids = [10 ** 17 + index for index in range(args.members)]
+    in_voice = {user_id: rng.choice(voice_channels) for user_id in rng.sample(user_ids, args.in_voice)}
+
+    received = 0
+    started = time.perf_counter()
+    events = itertools.chain(
+        [("GUILD_CREATE", guild_payload(args.members, text_channels, voice_channels, in_voice, bot_id))],
+        gateway_events(args, rng, text_channels, voice_channels, in_voice),
+    )
+    for event, payload in events:
+        if not getattr(intents, EVENT_INTENTS[event]):
+            continue  # Not subscribed, the gateway never sends it
+        state.parsers[event](payload)
+        received += 1
+        if received % 1000 == 0:
+            await asyncio.sleep(0)  # Let dispatched listeners run
+    await asyncio.sleep(0)
+    elapsed = time.perf_counter() - started
+
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    guild = bot.get_guild(GUILD_ID)
+    print(f"== {profile} profile")
+    print(f"  events:       {received} received")
+    print(f"  elapsed:      {elapsed:.3f}s")
+    print(f"  memory:       {(current - baseline) / 1024:.0f} KiB retained, {(peak - baseline) / 1024:.0f} KiB peak")
+    print(f"  members:      {len(guild.members)} cached ({len(in_voice)} in voice)")
+    print(f"  messages:     {len(state._messages or ())} cached")
+    print(f"  users:        {len(state._users)} cached")
+    await bot.close()
+    return current - baseline
+
+
+async def run(args):
+    default = await run_profile("default", args)
+    lean = await run_profile("lean", args)
+    saved = default - lean
+    print(f"== lean saves {saved / 1024:.0f} KiB ({saved / default * 100 if default else 0:.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--members", type=int, default=50000, help="Members in the synthetic guild")
+    parser.add_argument("--in-voice", type=int, default=500, help="Members in voice at startup")
+    parser.add_argument("--text-channels", type=int, default=100)
+    parser.add_argument("--voice-channels", type=int, default=100)
+    parser.add_argument("--messages", type=int, default=20000, help="Chat messages (and as many typing events)")
+    parser.add_argument("--voice-events", type=int, default=20000, help="Voice joins, switches and leaves")
+    parser.add_argument("--seed", type=int, default=1)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Microbenchmarks for channel name sanitization and game name normalization
+
+Compares the original per-call re.sub sanitizer with the cached one from
+utils.names on a repetitive workload (a few popular games typed many times)
+and on a cold workload of unique names.
+
+Usage: python -m benchmarks.bench_sanitize [--calls N] [--unique N]
+"""
+import argparse
+import random
+import re
+import timeit
+
+from utils.names import canonical_game_name, sanitize_name
+
+MAX_LENGTH = 50
+DEFAULT = "Temporary Channel"
+
+POPULAR = [
+    "Valorant", "valo", "Mobile Legends", "ML", "mlbb", "Minecraft", "Fortnite",
+    "League of Legends", "lol", "CS2", "Apex Legends", "Genshin Impact", "codm",
+    "PUBG Mobile", "Rocket League", "Among Us 🚀", "Roblox!!", "Free Fire", "Dota 2",
+]
+
+
+def sanitize_original(name):
+    """The sanitizer as it was before caching"""
+    name = re.sub(r'[^\w\s-]', '', name)
+    name = name.strip()
+    if len(name) > MAX_LENGTH:
+        name = name[:MAX_LENGTH]
+    if not name:
+        name = DEFAULT
+    return name
+
+
+def repetitive_workload(calls, seed):
+    rng = random.Random(seed)
+    # Popularity falls off quickly, like real game names
+    weights = [1 / (rank + 1) for rank in range(len(POPULAR))]
+    return rng.choices(POPULAR, weights=weights, k=calls)
+
+
+def unique_workload(count, seed):
+    rng = random.Random(seed)
+    return [f"Game {rng.randrange(10 ** 9)} ({index})!" for index in range(count)]
+
+
+def bench(label, func, names, repeat):
+    def run():
+        for name in names:
+            func(name)
+    best = min(timeit.repeat(run, number=1, repeat=repeat))
+    print(f"  {label:<28} {best / len(names) * 1e9:8.0f} ns/call")
+    return best
+
+
+def clear_caches():
+    sanitize_name.cache_clear()
+    canonical_game_name.cache_clear()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=200000, help="Calls in the repetitive workload")
+    parser.add_argument("--unique", type=int, default=20000, help="Names in the cold workload")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    cached = lambda name: sanitize_name(name, MAX_LENGTH, DEFAULT)  # noqa: E731
+    normalized = lambda name: canonical_game_name(sanitize_name(name, MAX_LENGTH, DEFAULT))  # noqa: E731
+
+    names = repetitive_workload(args.calls, args.seed)
+    print(f"== repetitive workload ({len(names)} calls, {len(set(names))} distinct names)")
+    clear_caches()
+    original = bench("original re.sub", sanitize_original, names, args.repeat)
+    fast = bench("cached sanitize", cached, names, args.repeat)
+    bench("cached sanitize + alias", normalized, names, args.repeat)
+    print(f"  speedup:                     {original / fast:.1f}x")
+    print(f"  cache:                       {sanitize_name.cache_info()}")
+
+    names = unique_workload(args.unique, args.seed)
+    print(f"== unique workload ({len(names)} calls, every name new)")
+    original = bench("original re.sub", sanitize_original, names, 1)
+    clear_caches()
+    bench("cached sanitize (all misses)", cached, names, 1)
+
+    print("== aliases")
+    for alias in ("ML", "mlbb", "valo", "CS:GO", "Call of Duty", "Unknown Game"):
+        print(f"  {alias!r:<16} -> {canonical_game_name(sanitize_name(alias, MAX_LENGTH, DEFAULT))!r}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Replay voice state events through VoiceChannelBot.on_voice_state_update
+
+Usage: python -m benchmarks.bench_voice_events [--events N] [--channels N] [--recording FILE]
+"""
+import argparse
+import asyncio
+import time
+
+from benchmarks.fakes import FakeRest
+from benchmarks.harness import (
+    HarnessBot, MemoryTracker, TaskSampler, build_world, load_recorded_events,
+    report, synthetic_voice_events,
+)
+
+
+async def run(args):
+    rest = FakeRest(latency=args.latency, rate_limit_chance=args.rate_limit, seed=args.seed)
+    bot = HarnessBot(rest)
+    bot.expiry.configure(bot.expiry.default.replace(grace=args.delete_delay))
+    await bot.start_harness()
+    guild = build_world(bot, rest, members_per_guild=args.members)[0]
+
+    # Pre-create the temporary channels the events move members between
+    channels = []
+    for index in range(args.channels):
+        channel = await guild.create_voice_channel(f"#{index + 1} - Bench's room")
+        bot.temp_channels.add(channel.id, guild.id, guild.default_role.id)
+        channels.append(channel)
+    rest.calls.clear()
+
+    if args.recording:
+        events = load_recorded_events(args.recording, guild)
+    else:
+        events = synthetic_voice_events(guild, channels, args.events, seed=args.seed)
+
+    count = 0
+    with MemoryTracker() as memory, TaskSampler() as tasks:
+        started = time.perf_counter()
+        for member, target in events:
+            if target is not None and target.id not in guild.channels:
+                target = None  # Channel was deleted during the run
+            guild.move(member, target)
+            count += 1
+            if count % args.batch == 0:
+                await asyncio.sleep(0)  # Let dispatched handlers run, like the gateway reader does
+        await bot.settle()
+        if args.linger:
+            # Give pending deletion timers a chance to fire
+            await asyncio.sleep(args.linger)
+            await bot.settle()
+        elapsed = time.perf_counter() - started
+
+    report(
+        "voice state events",
+        count,
+        elapsed,
+        bot.handler_latencies,
+        rest=rest,
+        tasks=tasks,
+        memory=memory.result,
+        extra={
+            "tracked": len(bot.temp_channels),
+            "scheduler": bot.deletion_scheduler.stats(),
+            "expiry": bot.expiry.stats(),
+        },
+    )
+    await bot.stop_harness()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--channels", type=int, default=200)
+    parser.add_argument("--members", type=int, default=2000)
+    parser.add_argument("--batch", type=int, default=100, help="events delivered between loop iterations")
+    parser.add_argument("--latency", type=float, default=0.05, help="simulated REST latency in seconds")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="chance of a simulated 429 per call")
+    parser.add_argument("--delete-delay", type=float, default=10.0)
+    parser.add_argument("--linger", type=float, default=0.0, help="seconds to wait for deletions after replay")
+    parser.add_argument("--recording", help="JSON lines file of recorded events to replay")
+    parser.add_argument("--seed", type=int, default=1)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
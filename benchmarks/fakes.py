@@ -0,0 +1,303 @@
+"""
+Offline stand-ins for the Discord objects the bot touches
+
+Only the attributes and coroutines used by VoiceChannelBot and
+VoiceChannelCommands are implemented. Every REST-like coroutine goes
+through FakeRest, which adds latency and simulates 429 responses.
+"""
+import asyncio
+import collections
+import datetime
+import itertools
+import random
+import time
+from types import SimpleNamespace
+
+import discord
+
+_snowflakes = itertools.count(1_000_000)
+
+
+def next_id():
+    return next(_snowflakes)
+
+
+class FakeRest:
+    """Simulated REST layer with per-call latency and 429 rate limits.
+
+    429s are retried after retry_after seconds, the same way discord.py's
+    HTTP client handles them, so callers only see the extra latency.
+    """
+
+    def __init__(self, latency=0.05, jitter=0.02, rate_limit_chance=0.0, retry_after=0.5, seed=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit_chance = rate_limit_chance
+        self.retry_after = retry_after
+        self.random = random.Random(seed)
+        self.calls = collections.Counter()  # {route: count}
+        self.rate_limited = collections.Counter()  # {route: 429 count}
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.latencies = []
+
+    async def call(self, route):
+        started = time.perf_counter()
+        self.calls[route] += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            while True:
+                await asyncio.sleep(max(0.0, self.latency + self.random.uniform(-self.jitter, self.jitter)))
+                if self.random.random() >= self.rate_limit_chance:
+                    break
+                self.rate_limited[route] += 1
+                await asyncio.sleep(self.retry_after)
+        finally:
+            self.in_flight -= 1
+            self.latencies.append(time.perf_counter() - started)
+
+    def total_calls(self):
+        return sum(self.calls.values())
+
+
+class FakeObject:
+    """Base for fake snowflake objects, hashed and compared by ID like discord.py"""
+
+    def __init__(self, id=None):
+        self.id = id if id is not None else next_id()
+
+    def __hash__(self):
+        return hash(self.id)
+
+    def __eq__(self, other):
+        return isinstance(other, FakeObject) and other.id == self.id
+
+
+class FakeRole(FakeObject):
+    def __init__(self, guild, name="@everyone"):
+        super().__init__(guild.id)
+        self.guild = guild
+        self.name = name
+
+
+class FakeVoiceState:
+    def __init__(self, channel=None, mute=False, deaf=False):
+        self.channel = channel
+        self.mute = mute
+        self.deaf = deaf
+
+
+class FakeMember(FakeObject):
+    def __init__(self, guild, name=None, manage_channels=False, id=None):
+        super().__init__(id)
+        self.guild = guild
+        self.name = name or f"member{self.id}"
+        self.display_name = self.name
+        self.mention = f"<@{self.id}>"
+        self.bot = False
+        self.voice = None
+        self.guild_permissions = discord.Permissions(
+            connect=True, speak=True, manage_channels=manage_channels
+        )
+
+    def __str__(self):
+        return self.name
+
+    async def edit(self, *, reason=None, **fields):
+        await self.guild.rest.call("PATCH /guilds/{guild_id}/members/{user_id}")
+        if "voice_channel" in fields:
+            self.guild.move(self, fields["voice_channel"])
+        if "mute" in fields and self.voice:
+            self.voice.mute = fields["mute"]
+
+    async def move_to(self, channel, *, reason=None):
+        await self.edit(voice_channel=channel, reason=reason)
+
+
+class FakeCategory(FakeObject):
+    def __init__(self, guild, name):
+        super().__init__()
+        self.guild = guild
+        self.name = name
+        self.channels = []
+
+    @property
+    def voice_channels(self):
+        return [channel for channel in self.guild.voice_channels if channel.category is self]
+
+    async def delete(self, *, reason=None):
+        await self.guild.rest.call("DELETE /channels/{channel_id}")
+        self.guild.remove_channel(self)
+
+
+class FakeVoiceChannel(FakeObject):
+    def __init__(self, guild, name, category=None, overwrites=None, user_limit=0):
+        super().__init__()
+        self.guild = guild
+        self.name = name
+        self.category = category
+        self.overwrites = dict(overwrites or {})
+        self.user_limit = user_limit
+        self.members = []
+        self.created_at = discord.utils.utcnow()
+
+    @property
+    def mention(self):
+        return f"<#{self.id}>"
+
+    def overwrites_for(self, target):
+        for key, overwrite in self.overwrites.items():
+            if key.id == target.id:
+                return overwrite
+        return discord.PermissionOverwrite()
+
+    async def edit(self, *, reason=None, **fields):
+        await self.guild.rest.call("PATCH /channels/{channel_id}")
+        for name, value in fields.items():
+            setattr(self, name, dict(value) if name == "overwrites" else value)
+        return None
+
+    async def set_permissions(self, target, *, overwrite=discord.utils.MISSING, reason=None, **permissions):
+        await self.guild.rest.call("PUT /channels/{channel_id}/permissions/{overwrite_id}")
+        if overwrite is None:
+            self.overwrites.pop(target, None)
+        else:
+            self.overwrites[target] = overwrite if overwrite is not discord.utils.MISSING else discord.PermissionOverwrite(**permissions)
+
+    async def delete(self, *, reason=None):
+        await self.guild.rest.call("DELETE /channels/{channel_id}")
+        if self.id not in self.guild.channels:
+            raise discord.NotFound(SimpleNamespace(status=404, reason="Not Found"), "Unknown Channel")
+        self.guild.remove_channel(self)
+
+
+class FakeGuild(FakeObject):
+    def __init__(self, rest, name=None, id=None):
+        super().__init__(id)
+        self.rest = rest
+        self.name = name or f"guild{self.id}"
+        self.default_role = FakeRole(self)
+        self.channels = {}  # {channel_id: channel}
+        self.members = {}  # {member_id: member}
+        self.dispatch = None  # Set by the harness to deliver voice state events
+
+    @property
+    def categories(self):
+        return [channel for channel in self.channels.values() if isinstance(channel, FakeCategory)]
+
+    @property
+    def voice_channels(self):
+        return [channel for channel in self.channels.values() if isinstance(channel, FakeVoiceChannel)]
+
+    def get_channel(self, channel_id):
+        return self.channels.get(channel_id)
+
+    def get_member(self, member_id):
+        return self.members.get(member_id)
+
+    def add_member(self, **kwargs):
+        member = FakeMember(self, **kwargs)
+        self.members[member.id] = member
+        return member
+
+    def remove_channel(self, channel):
+        self.channels.pop(channel.id, None)
+        for member in list(getattr(channel, "members", ())):
+            member.voice = None
+
+    async def create_category(self, name, *, reason=None, **options):
+        await self.rest.call("POST /guilds/{guild_id}/channels")
+        category = FakeCategory(self, name)
+        self.channels[category.id] = category
+        return category
+
+    async def create_voice_channel(self, name, *, category=None, overwrites=None, reason=None, **options):
+        await self.rest.call("POST /guilds/{guild_id}/channels")
+        channel = FakeVoiceChannel(self, name, category=category, overwrites=overwrites, **options)
+        self.channels[channel.id] = channel
+        return channel
+
+    def move(self, member, channel):
+        """Update the voice cache like the gateway would, returns (before, after) states"""
+        before = member.voice or FakeVoiceState()
+        if before.channel is not None and member in before.channel.members:
+            before.channel.members.remove(member)
+        if channel is not None:
+            channel.members.append(member)
+            member.voice = FakeVoiceState(channel, mute=before.mute, deaf=before.deaf)
+        else:
+            member.voice = None
+        after = member.voice or FakeVoiceState()
+        if self.dispatch is not None:
+            self.dispatch(member, before, after)
+        return before, after
+
+
+def deliver(client, kwargs, ephemeral_timeout=False):
+    """Serialize a message and store its view the way discord.py does after sending"""
+    for embed in ([kwargs["embed"]] if kwargs.get("embed") else kwargs.get("embeds", [])):
+        embed.to_dict()
+    view = kwargs.get("view")
+    if view is None:
+        return
+    view.to_components()
+    if not view.is_finished() and view.is_dispatchable():
+        if ephemeral_timeout and kwargs.get("ephemeral") and view.timeout is None:
+            view.timeout = 15 * 60.0
+        client._connection.store_view(view, next_id())
+
+
+class FakeInteractionResponse:
+    def __init__(self, interaction):
+        self.interaction = interaction
+        self._done = False
+
+    def is_done(self):
+        return self._done
+
+    async def defer(self, **kwargs):
+        self._done = True
+        await self.interaction.rest.call("POST /interactions/{id}/{token}/callback")
+
+    async def send_message(self, content=None, **kwargs):
+        self._done = True
+        await self.interaction.rest.call("POST /interactions/{id}/{token}/callback")
+        deliver(self.interaction.client, kwargs, ephemeral_timeout=True)
+        self.interaction.sent.append((content, kwargs))
+
+    async def send_modal(self, modal):
+        self._done = True
+        await self.interaction.rest.call("POST /interactions/{id}/{token}/callback")
+        modal.to_dict()
+        if not modal.is_finished():
+            self.interaction.client._connection.store_view(modal)
+        self.interaction.sent.append((None, {"modal": modal}))
+
+    async def edit_message(self, **kwargs):
+        self._done = True
+        await self.interaction.rest.call("POST /interactions/{id}/{token}/callback")
+        self.interaction.sent.append((None, kwargs))
+
+
+class FakeFollowup:
+    def __init__(self, interaction):
+        self.interaction = interaction
+
+    async def send(self, content=None, **kwargs):
+        await self.interaction.rest.call("POST /webhooks/{application_id}/{token}")
+        deliver(self.interaction.client, kwargs)
+        self.interaction.sent.append((content, kwargs))
+
+
+class FakeInteraction(FakeObject):
+    def __init__(self, client, guild, user):
+        super().__init__()
+        self.client = client
+        self.guild = guild
+        self.user = user
+        self.rest = guild.rest
+        self.sent = []  # [(content, kwargs)] of every response and followup
+        self.response = FakeInteractionResponse(self)
+        self.followup = FakeFollowup(self)
+        self.created_at = datetime.datetime.now(datetime.timezone.utc)
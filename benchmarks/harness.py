@@ -0,0 +1,214 @@
+"""
+Load-test harness that drives the bot against fake guilds offline
+"""
+import asyncio
+import json
+import os
+import random
+import statistics
+import time
+import tracemalloc
+
+# Keep benchmarks self-contained: no database file, quick deletions
+os.environ.setdefault("REGISTRY_BACKEND", "memory")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from bot import VoiceChannelBot  # noqa: E402
+from commands.voice_channels import VoiceChannelCommands  # noqa: E402
+from benchmarks.fakes import FakeGuild, FakeInteraction, FakeObject, FakeRest  # noqa: E402
+
+
+class HarnessBot(VoiceChannelBot):
+    """VoiceChannelBot whose cache lookups resolve against fake guilds"""
+
+    def __init__(self, rest):
+        super().__init__()
+        self.rest = rest
+        self.fake_guilds = {}  # {guild_id: FakeGuild}
+        self.handler_latencies = []
+        self._dispatched = set()
+        self.bot_user = FakeObject()  # Stands in for the logged-in bot account
+
+    @property
+    def user(self):
+        return self.bot_user
+
+    def get_guild(self, guild_id, /):
+        return self.fake_guilds.get(guild_id)
+
+    def get_channel(self, channel_id, /):
+        for guild in self.fake_guilds.values():
+            channel = guild.get_channel(channel_id)
+            if channel is not None:
+                return channel
+        return None
+
+    def get_user(self, user_id, /):
+        for guild in self.fake_guilds.values():
+            member = guild.get_member(user_id)
+            if member is not None:
+                return member
+        return None
+
+    def add_guild(self, guild):
+        self.fake_guilds[guild.id] = guild
+        guild.dispatch = self.dispatch_voice_state
+
+    def dispatch_voice_state(self, member, before, after):
+        """Deliver a voice state event the way discord.py does, as its own task"""
+        task = asyncio.get_running_loop().create_task(self._timed_voice_state(member, before, after))
+        self._dispatched.add(task)
+        task.add_done_callback(self._dispatched.discard)
+
+    async def _timed_voice_state(self, member, before, after):
+        started = time.perf_counter()
+        await self.on_voice_state_update(member, before, after)
+        self.handler_latencies.append(time.perf_counter() - started)
+
+    async def start_harness(self):
+        """Start the bot components that setup_hook would start, without connecting"""
+        await self.add_cog(VoiceChannelCommands(self))
+        self.store.start()
+        self.channel_pool.start()
+        return self.get_cog('VoiceChannelCommands')
+
+    def stored_views(self):
+        """Return the views and modals discord.py is currently keeping for sent messages"""
+        store = self._connection._view_store
+        return {
+            item.view for items in store._views.values()
+            for item in items.values() if item.view is not None
+        } | set(store._modals.values())
+
+    async def settle(self):
+        """Wait for dispatched events and queued REST actions to finish"""
+        while self._dispatched:
+            await asyncio.gather(*list(self._dispatched), return_exceptions=True)
+        await self.actions.drain()
+
+    async def stop_harness(self):
+        await self.settle()
+        for view in self.stored_views():
+            view.stop()  # Cancels their timeout tasks
+        self.deletion_scheduler.cancel_all()
+        await self.channel_pool.close()
+        await self.store.close()
+
+
+def build_world(bot, rest, guilds=1, members_per_guild=100, managers_per_guild=5):
+    """Create fake guilds with members and register them with the bot"""
+    world = []
+    for _ in range(guilds):
+        guild = FakeGuild(rest)
+        for index in range(members_per_guild):
+            guild.add_member(manage_channels=index < managers_per_guild)
+        bot.add_guild(guild)
+        world.append(guild)
+    return world
+
+
+def synthetic_voice_events(guild, channels, count, seed=None):
+    """Yield (member, target_channel) moves: random joins, switches and leaves"""
+    rng = random.Random(seed)
+    members = list(guild.members.values())
+    for _ in range(count):
+        member = rng.choice(members)
+        target = None if member.voice and rng.random() < 0.5 else rng.choice(channels)
+        yield member, target
+
+
+def load_recorded_events(path, guild):
+    """Yield (member, target_channel) moves from a JSON lines recording.
+
+    Each line looks like {"member": <id>, "channel": <id or null>}; unknown
+    IDs are mapped onto the fake guild's members and voice channels.
+    """
+    members = list(guild.members.values())
+    channels = guild.voice_channels
+    member_map = {}
+    channel_map = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            event = json.loads(line)
+            member = member_map.setdefault(event["member"], members[len(member_map) % len(members)])
+            channel_id = event.get("channel")
+            target = None
+            if channel_id is not None and channels:
+                target = channel_map.setdefault(channel_id, channels[len(channel_map) % len(channels)])
+            yield member, target
+
+
+async def invoke(command, cog, interaction, *args):
+    """Invoke an app command's callback directly"""
+    return await command.callback(cog, interaction, *args)
+
+
+def new_interaction(bot, guild, user):
+    return FakeInteraction(bot, guild, user)
+
+
+class TaskSampler:
+    """Samples the number of live asyncio tasks while a benchmark runs"""
+
+    def __init__(self, interval=0.01):
+        self.interval = interval
+        self.peak = 0
+        self._task = None
+
+    async def _run(self):
+        while True:
+            self.peak = max(self.peak, len(asyncio.all_tasks()))
+            await asyncio.sleep(self.interval)
+
+    def __enter__(self):
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        return self
+
+    def __exit__(self, *exc_info):
+        self._task.cancel()
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def report(title, count, elapsed, latencies, rest=None, tasks=None, memory=None, extra=None):
+    """Print a benchmark summary"""
+    print(f"== {title}")
+    print(f"  operations:   {count}")
+    print(f"  elapsed:      {elapsed:.3f}s")
+    print(f"  throughput:   {count / elapsed if elapsed else 0:.1f}/s")
+    if latencies:
+        print(f"  latency p50:  {percentile(latencies, 0.50) * 1000:.2f}ms")
+        print(f"  latency p99:  {percentile(latencies, 0.99) * 1000:.2f}ms")
+        print(f"  latency mean: {statistics.fmean(latencies) * 1000:.2f}ms")
+    if tasks is not None:
+        print(f"  peak tasks:   {tasks.peak}")
+        print(f"  live tasks:   {len(asyncio.all_tasks())}")
+    if memory is not None:
+        current, peak = memory
+        print(f"  memory:       {current / 1024:.0f} KiB current, {peak / 1024:.0f} KiB peak")
+    if rest is not None:
+        print(f"  REST calls:   {rest.total_calls()} ({sum(rest.rate_limited.values())} rate limited, "
+              f"peak {rest.peak_in_flight} in flight)")
+    for name, value in (extra or {}).items():
+        print(f"  {name + ':':<13} {value}")
+
+
+class MemoryTracker:
+    """tracemalloc wrapper reporting (current, peak) bytes allocated in the block"""
+
+    def __enter__(self):
+        tracemalloc.start()
+        self.result = (0, 0)
+        return self
+
+    def __exit__(self, *exc_info):
+        self.result = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
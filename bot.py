@@ -5,41 +5,303 @@ Manages temporary voice channels with slash commands
 import discord
 from discord.ext import commands, tasks
 import asyncio
-from config import BotConfig
-from commands.voice_channels import VoiceChannelCommands
+import dataclasses
+import datetime
+import signal
+import time
+from config import BotConfig, current_environ
+from commands.voice_channels import GAMING_CHANNEL_PATTERN, ROOM_NUMBER_PATTERN, VoiceChannelCommands
 from utils.logger import setup_logger
+from utils.action_queue import ActionQueue
+from utils.channel_pool import POOL_CHANNEL_NAME, ChannelPool
+from utils.command_sync import CommandSyncer
+from utils.expiry import ExpiryPolicies, ExpiryPolicy
+from utils.locks import ChannelLockManager
+from utils.metrics import MetricsRegistry, MetricsServer, stats_collector
+from utils.names import cache_stats as name_cache_stats
+from utils.occupancy import OccupancyTracker
+from utils.registry import ChannelRegistry
+from utils.rooms import RoomAllocator
+from utils.scheduler import DeletionScheduler
+from utils.storage import WriteBehindStore, create_backend
 
-class VoiceChannelBot(commands.Bot):
-    def __init__(self):
-        # Set up intents
+def client_options(profile="default"):
+    """Gateway intents and cache settings for a RUNTIME_PROFILE"""
+    if profile != "lean":
         intents = discord.Intents.default()
         intents.voice_states = True
         intents.guilds = True
+        return {"intents": intents}
+    
+    # The bot only reads guilds, channels, voice states and interaction payloads:
+    # no message, reaction or typing events, no message cache, and members are
+    # cached only while they are in a voice channel
+    intents = discord.Intents.none()
+    intents.guilds = True
+    intents.voice_states = True
+    return {
+        "intents": intents,
+        "member_cache_flags": discord.MemberCacheFlags(voice=True, joined=False),
+        "max_messages": None,
+        "chunk_guilds_at_startup": False,
+    }
+
+def expiry_policy(config):
+    """Default expiry policy of a config snapshot"""
+    return ExpiryPolicy(
+        grace=config.EMPTY_CHANNEL_DELETE_DELAY,
+        max_lifetime=config.CHANNEL_MAX_LIFETIME,
+        keep_warm_after=config.KEEP_WARM_AFTER,
+        keep_warm_grace=config.KEEP_WARM_GRACE
+    )
+
+class VoiceChannelBot(commands.Bot):
+    def __init__(self, worker_id=None, stats_queue=None, **options):
+        config = BotConfig.load()
         
         super().__init__(
             command_prefix='!',  # Fallback prefix, we'll use slash commands
-            intents=intents,
-            help_command=None
+            help_command=None,
+            **client_options(config.RUNTIME_PROFILE),
+            **options  # shard_ids/shard_count when running sharded
         )
         
-        self.config = BotConfig()
+        self.config = config  # Immutable snapshot, replaced as a whole by reload_config()
         self.logger = setup_logger()
-        self.temp_channels = {}  # Track temporary channels {channel_id: creator_id}
+        self.worker_id = worker_id  # Set when running as one of several worker processes
+        self.stats_queue = stats_queue  # Worker -> supervisor stats channel
+        self.metrics = MetricsRegistry()
+        self.deletion_scheduler = DeletionScheduler(
+            self.delete_empty_channel,
+            delay=self.config.EMPTY_CHANNEL_DELETE_DELAY
+        )
+        self.expiry = ExpiryPolicies(  # Grace periods, lifetimes and keep-warm per guild/platform
+            expiry_policy(self.config), self.config.EXPIRY_POLICIES
+        )
+        self.store = WriteBehindStore(
+            create_backend(self.config),
+            flush_interval=self.config.REGISTRY_FLUSH_INTERVAL,
+            logger=self.logger
+        )
+        self.temp_channels = ChannelRegistry(self.store)  # Tracked temporary channels
+        self.room_numbers = RoomAllocator()  # Gaming room numbers per guild and platform
+        self.channel_locks = ChannelLockManager(self.metrics)  # Serializes mutations of one channel
+        self.occupancy = OccupancyTracker()  # Members per temporary channel, kept from voice events
+        self.occupancy_reconciled_at = time.monotonic()
+        self.actions = ActionQueue(  # Coalescing queue for channel/member REST calls
+            concurrency=self.config.ACTION_QUEUE_CONCURRENCY,
+            logger=self.logger,
+            metrics=self.metrics
+        )
+        self.channel_pool = ChannelPool(
+            self,
+            target_size=self.config.CHANNEL_POOL_SIZE,
+            max_idle=self.config.CHANNEL_POOL_MAX_IDLE,
+            refill_rate=self.config.CHANNEL_POOL_REFILL_RATE,
+            logger=self.logger
+        )
+        self.restored_state = {}  # State loaded from the registry store at startup
+        self.state_reconciled = False
+        self.sweep_lock = asyncio.Lock()  # Ensures cleanup sweeps never overlap
+        self.last_sweep = {}  # Stats from the most recent cleanup sweep
+        self.last_reconcile = {}  # Stats from the startup orphan reconciliation
+        self.metrics_server = None
+        self._close_task = None  # Shared by every close() call and the SIGTERM handler
+        self._setup_metrics()
+    
+    def _setup_metrics(self):
+        """Create hot-path instruments and export component stats at scrape time"""
+        self.command_duration = self.metrics.histogram(
+            "vcb_command_duration_seconds", "Time spent in command handlers", ("command",)
+        )
+        self.command_errors = self.metrics.counter(
+            "vcb_command_errors_total", "Command handlers that raised", ("command",)
+        )
+        # Shared with the action queue, which times the edits and deletes it sends
+        self.rest_duration = self.metrics.histogram(
+            "vcb_rest_request_duration_seconds", "Duration of REST calls", ("action",)
+        )
+        self.cleanup_check_duration = self.metrics.histogram(
+            "vcb_cleanup_check_duration_seconds", "Time spent in check_and_cleanup_channel"
+        )
+        self.sweep_duration = self.metrics.histogram(
+            "vcb_cleanup_sweep_duration_seconds", "Duration of periodic cleanup sweeps",
+            buckets=(0.1, 0.5, 1, 5, 15, 30, 60, 120, 300)
+        )
+        self.sweep_deleted = self.metrics.counter(
+            "vcb_cleanup_sweep_deleted_total", "Channels deleted by cleanup sweeps"
+        )
+        self.metrics.gauge(
+            "vcb_temp_channels", "Temporary channels currently tracked",
+            function=lambda: len(self.temp_channels)
+        )
+        self.metrics.add_collector(stats_collector(
+            "vcb_deletion_scheduler", "Deletion scheduler", self.deletion_scheduler.stats,
+            counters=("scheduled", "rearmed", "cancelled", "fired", "compactions")
+        ))
+        self.metrics.add_collector(stats_collector(
+            "vcb_expiry", "Channel expiry policies", self.expiry.stats,
+            counters=("reuses", "kept_warm", "expired")
+        ))
+        self.metrics.add_collector(stats_collector(
+            "vcb_action_queue", "REST action queue", self.actions.stats,
+            counters=("submitted", "coalesced", "dropped", "executed", "failed")
+        ))
+        self.metrics.add_collector(stats_collector(
+            "vcb_channel_pool", "Pre-warmed channel pool", self.channel_pool.stats,
+            counters=("hits", "misses", "created", "expired", "failed")
+        ))
+        self.metrics.add_collector(stats_collector(
+            "vcb_registry_store", "Registry write-behind store",
+            lambda: {**self.store.metrics, "pending": self.store.pending},
+            counters=("writes", "flushes", "flushed_keys", "errors")
+        ))
+        self.metrics.add_collector(stats_collector(
+            "vcb_channel_locks", "Per-channel locks", self.channel_locks.stats,
+            counters=("acquired", "contended")
+        ))
+        self.metrics.add_collector(stats_collector(
+            "vcb_occupancy", "Temporary channel occupancy tracker", self.occupancy.stats,
+            counters=("joins", "leaves", "seeded", "reconciled", "drift_corrections")
+        ))
+        self.metrics.add_collector(stats_collector(
+            "vcb_name_cache", "Channel and game name caches", name_cache_stats,
+            counters=("sanitize_hits", "sanitize_misses", "game_hits", "game_misses")
+        ))
+        self.metrics.add_collector(stats_collector(
+            "vcb_room_numbers", "Gaming room number allocator", self.room_numbers.stats,
+            counters=("allocated", "reused", "released")
+        ))
         
     async def setup_hook(self):
         """Setup hook called when bot is starting"""
+        # Restore persisted state before anything can touch it
+        # Workers share one store, so only restore the guilds on our shards
+        self.restored_state = await self.store.load()
+        self.temp_channels.load({
+            channel_id: record for channel_id, record in self.restored_state.get("channels", {}).items()
+            if self.owns_guild(record["guild_id"])
+        })
+        self.room_numbers.load(self.temp_channels.records())
+        self.channel_pool.load({
+            channel_id: record for channel_id, record in self.restored_state.get("pool", {}).items()
+            if self.owns_guild(record["guild_id"])
+        })
+        self.store.start()
+        
         # Add voice channel commands
         await self.add_cog(VoiceChannelCommands(self))
         
+        # Start refilling pre-warmed channels (no-op when the pool is disabled)
+        self.channel_pool.start()
+        
         # Start the cleanup task
         self.channel_cleanup.start()
         
-        # Sync slash commands
+        # Reload the config on SIGHUP, like most daemons, and shut down cleanly on SIGTERM
+        # (Client.run only cleans up on Ctrl+C, and the supervisor stops workers with SIGTERM)
+        loop = asyncio.get_running_loop()
+        try:
+            loop.add_signal_handler(signal.SIGHUP, self.reload_config_from_signal)
+            loop.add_signal_handler(signal.SIGTERM, self.begin_close)
+        except (AttributeError, NotImplementedError, RuntimeError):
+            pass  # No signal handlers on this platform, /reload-config still works
+        
+        # Report to the supervisor when running as a worker process
+        if self.stats_queue is not None:
+            self.publish_stats.start()
+        
+        # Serve metrics for scraping when a port is configured (the supervisor serves them for workers)
+        if self.config.METRICS_PORT and self.worker_id is None:
+            self.metrics_server = MetricsServer(
+                self.metrics, self.config.METRICS_HOST, self.config.METRICS_PORT, logger=self.logger
+            )
+            try:
+                await self.metrics_server.start()
+            except OSError as e:
+                self.logger.error("Failed to start metrics server: %s", e)
+                self.metrics_server = None
+        
+        # Sync slash commands (commands are global, one worker is enough)
+        if self.worker_id or self.config.COMMAND_SYNC == "never":
+            return
+        syncer = CommandSyncer(
+            self.tree, self.store, self.restored_state.get(CommandSyncer.NAMESPACE, {}), self.logger
+        )
+        guild = discord.Object(id=int(self.config.GUILD_ID)) if self.config.GUILD_ID else None
         try:
-            synced = await self.tree.sync()
-            self.logger.info(f"Synced {len(synced)} slash commands")
+            synced = await syncer.sync(
+                self.application_id, guild=guild, force=self.config.COMMAND_SYNC == "always"
+            )
+            if synced is not None:
+                self.logger.info("Synced %d slash commands%s", len(synced), f" to guild {guild.id}" if guild else "")
         except Exception as e:
-            self.logger.error(f"Failed to sync slash commands: {e}")
+            self.logger.error("Failed to sync slash commands: %s", e)
+    
+    def reload_config(self):
+        """Load the config again and swap it in atomically.
+        
+        Returns (applied, restart_required) setting names. Settings that only
+        take effect at startup keep their running values in the new snapshot,
+        so bot.config always describes what is actually in use. Raises
+        ValueError/OSError and keeps the old config if the new one is invalid.
+        """
+        config = BotConfig.load(environ=current_environ())  # Picks up .env edits too
+        config.validate_config()
+        
+        changed = self.config.changed(config)
+        restart_required = [name for name in changed if not BotConfig.reloadable(name)]
+        if restart_required:
+            config = dataclasses.replace(config, **{name: getattr(self.config, name) for name in restart_required})
+        applied = [name for name in changed if name not in restart_required]
+        
+        self.apply_config(config)
+        self.config = config
+        self.logger.info("Reloaded config: %d setting(s) changed %s", len(applied), applied)
+        if restart_required:
+            self.logger.warning("Config changes that need a restart were not applied: %s", restart_required)
+        return applied, restart_required
+    
+    def reload_config_from_signal(self):
+        try:
+            self.reload_config()
+        except (ValueError, OSError) as e:
+            self.logger.error("Config reload failed, keeping the old settings: %s", e)
+    
+    def apply_config(self, config):
+        """Push reloadable settings into the components that copied them at startup"""
+        self.deletion_scheduler.delay = config.EMPTY_CHANNEL_DELETE_DELAY
+        self.expiry.configure(expiry_policy(config), config.EXPIRY_POLICIES)
+        self.channel_pool.target_size = config.CHANNEL_POOL_SIZE
+        self.channel_pool.max_idle = config.CHANNEL_POOL_MAX_IDLE
+        self.channel_pool.refill_rate = config.CHANNEL_POOL_REFILL_RATE
+        self.channel_pool.start()  # No-op unless the pool was just enabled
+        cog = self.get_cog('VoiceChannelCommands')
+        if cog is not None:
+            cog.owner_bans.limit = config.OWNER_BAN_LIMIT
+    
+    def owns_guild(self, guild_id):
+        """Check whether a guild belongs to one of the shards this process runs"""
+        shard_ids = getattr(self, "shard_ids", None)
+        if shard_ids is None or not self.shard_count:
+            return True
+        return (guild_id >> 22) % self.shard_count in shard_ids
+    
+    @tasks.loop(seconds=15)
+    async def publish_stats(self):
+        """Send a metrics snapshot to the supervisor process"""
+        self.stats_queue.put({
+            "worker_id": self.worker_id,
+            "shard_ids": list(getattr(self, "shard_ids", None) or []),
+            "guilds": len(self.guilds),
+            "temp_channels": len(self.temp_channels),
+            "samples": self.metrics.snapshot(),
+        })
+    
+    @publish_stats.before_loop
+    async def before_publish_stats(self):
+        """Wait for bot to be ready before reporting stats"""
+        await self.wait_until_ready()
     
     async def on_ready(self):
         """Called when bot is ready and connected"""
@@ -52,66 +314,323 @@ class VoiceChannelBot(commands.Bot):
             name="for /voice commands"
         )
         await self.change_presence(activity=activity)
+        
+        # on_ready fires again after reconnects, only reconcile once
+        if not self.state_reconciled:
+            self.state_reconciled = True
+            self.reconcile_state()
+            await self.reconcile_orphaned_channels()
+    
+    def reconcile_state(self):
+        """Reconcile restored channels against the guild cache in one pass"""
+        restored = len(self.temp_channels)
+        removed = 0
+        scheduled = 0
+        
+        for channel_id in list(self.temp_channels):
+            channel = self.get_channel(channel_id)
+            if not channel:
+                # Deleted while the bot was offline
+                self.untrack_channel(channel_id)
+                removed += 1
+            elif self.occupancy.is_empty(channel):
+                self.deletion_scheduler.schedule(channel_id, self.expiry_delay(channel))
+                scheduled += 1
+        
+        self.logger.info(
+            "Restored %d temporary channels: %d gone, %d empty and scheduled for deletion",
+            restored, removed, scheduled
+        )
+    
+    def find_orphaned_channels(self, guild, categories, pooled):
+        """Return the untracked bot channels in a guild's managed categories"""
+        orphans = []
+        for category in guild.categories:
+            if category.name not in categories:
+                continue
+            gaming = categories[category.name] is not None
+            for channel in category.voice_channels:
+                if channel.id in self.temp_channels or channel.id in pooled:
+                    continue
+                # Categories can hold channels that are not ours (the temporary category's
+                # name is generic), so gaming rooms must match their name pattern and
+                # legacy channels must carry the owner overwrite the bot gives them
+                if gaming:
+                    ours = GAMING_CHANNEL_PATTERN.match(channel.name)
+                else:
+                    ours = self.marked_owner_id(channel) is not None
+                if ours or channel.name == POOL_CHANNEL_NAME:
+                    orphans.append(channel)
+        return orphans
+    
+    def marked_owner_id(self, channel):
+        """Return the member given manage_channels on a channel, the owner marker of bot channels"""
+        for target, overwrite in channel.overwrites.items():
+            if isinstance(target, discord.Role) or target.id == self.user.id:
+                continue
+            if overwrite.manage_channels:
+                return target.id
+        return None
+    
+    def channel_owner_id(self, channel):
+        """Recover the owner of a channel from its manage_channels member overwrite"""
+        # Nobody to hand it back to, only admins can manage it
+        return self.marked_owner_id(channel) or self.user.id
+    
+    def adopt_channel(self, channel, platform):
+        """Track an orphaned channel again, keeping its room number when it is still free"""
+        room_number = None
+        match = ROOM_NUMBER_PATTERN.match(channel.name) if platform is not None else None
+        if match and self.room_numbers.claim(channel.guild.id, platform, int(match.group(1))):
+            room_number = int(match.group(1))
+        return self.temp_channels.add(
+            channel.id, channel.guild.id, self.channel_owner_id(channel),
+            platform=platform if room_number is not None else None, room_number=room_number
+        )
+    
+    async def reconcile_orphaned_channels(self):
+        """Adopt or purge bot channels that were created before a restart but never tracked.
+        
+        All guilds are scanned from the cache in one pass, occupied channels
+        are adopted back into tracking and empty ones are deleted concurrently.
+        """
+        cog = self.get_cog('VoiceChannelCommands')
+        if cog is None:
+            return
+        
+        async with self.sweep_lock:
+            started = time.perf_counter()
+            pooled = self.channel_pool.channel_ids()
+            adopted = 0
+            empty_channels = []
+            
+            guilds = self.guilds
+            for index, guild in enumerate(guilds, 1):
+                categories = cog.managed_categories(guild.id)
+                for channel in self.find_orphaned_channels(guild, categories, pooled):
+                    if channel.members:
+                        self.adopt_channel(channel, categories[channel.category.name])
+                        adopted += 1
+                    else:
+                        empty_channels.append(channel)
+                if index % 250 == 0:
+                    self.logger.info("Reconciliation scanned %d/%d guilds", index, len(guilds))
+                    await asyncio.sleep(0)  # Keep the gateway responsive on large bots
+            
+            scanned = time.perf_counter() - started
+            semaphore = asyncio.Semaphore(self.config.CLEANUP_CONCURRENCY)
+            deleted = 0
+            
+            async def delete(channel):
+                nonlocal deleted
+                async with semaphore:
+                    try:
+                        await self.actions.delete_channel(channel, reason="Orphaned temporary channel")
+                    except discord.NotFound:
+                        pass
+                    except Exception as e:
+                        self.logger.error("Error deleting orphaned channel %s: %s", channel.name, e)
+                        return
+                    deleted += 1
+                    if deleted % 100 == 0:
+                        self.logger.info("Reconciliation deleted %d/%d orphaned channels", deleted, len(empty_channels))
+            
+            await asyncio.gather(*(delete(channel) for channel in empty_channels))
+            duration = time.perf_counter() - started
+            
+            self.last_reconcile = {
+                "guilds": len(guilds),
+                "adopted": adopted,
+                "orphaned_empty": len(empty_channels),
+                "deleted": deleted,
+                "scan_duration": scanned,
+                "duration": duration,
+            }
+            self.logger.info(
+                "Reconciled %d guilds in %.2fs (scan %.2fs): adopted %d channels, deleted %d/%d empty orphans",
+                len(guilds), duration, scanned, adopted, deleted, len(empty_channels)
+            )
+    
+    def untrack_channel(self, channel_id):
+        """Stop tracking a temporary channel, returns its record if it was tracked"""
+        self.deletion_scheduler.cancel(channel_id)
+        record = self.temp_channels.remove(channel_id)
+        self.occupancy.forget(channel_id)
+        self.expiry.forget(channel_id)
+        if record is not None and record.room_number is not None:
+            self.room_numbers.release(record.guild_id, record.platform, record.room_number)
+        return record
     
     async def on_voice_state_update(self, member, before, after):
         """Monitor voice state changes to clean up empty channels"""
+        if before.channel == after.channel:
+            return  # Mute/deafen/stream changes
+        
+        self.occupancy.move(
+            member.id,
+            before.channel.id if before.channel else None,
+            after.channel.id if after.channel else None
+        )
+        
+        # Someone joined a temporary channel, keep it alive (and remember that it got reused)
+        if after.channel and after.channel.id in self.temp_channels:
+            if self.deletion_scheduler.cancel(after.channel.id):
+                self.expiry.note_reuse(after.channel.id)
+        
         # Check if someone left a voice channel
         if before.channel and before.channel.id in self.temp_channels:
             await self.check_and_cleanup_channel(before.channel)
     
     async def check_and_cleanup_channel(self, channel):
-        """Check if a temporary channel is empty and delete it"""
+        """Schedule deletion of a temporary channel if it is empty"""
         if not channel or channel.id not in self.temp_channels:
             return
         
-        # Wait 10 seconds before checking if channel is empty
-        await asyncio.sleep(10)
+        with self.cleanup_check_duration.time():
+            async with self.channel_locks.hold(channel.id, "cleanup-check"):
+                if channel.id not in self.temp_channels:
+                    return  # Deleted while we waited
+                if self.occupancy.is_empty(channel):
+                    # Debounced: re-arms an existing deadline instead of adding another
+                    self.deletion_scheduler.schedule(channel.id, self.expiry_delay(channel))
+                else:
+                    self.deletion_scheduler.cancel(channel.id)
+    
+    def expiry_delay(self, channel, now=None):
+        """Return how long an empty temporary channel is kept under its expiry policy"""
+        return self.expiry.grace_for(self.temp_channels.get(channel.id), now)
+    
+    async def delete_empty_channel(self, channel_id):
+        """Delete a temporary channel once its deletion timer fires"""
+        if channel_id not in self.temp_channels:
+            return
         
-        try:
-            # Refresh channel data
-            channel = self.get_channel(channel.id)
-            if not channel:
+        channel = self.get_channel(channel_id)
+        if not channel:
+            # Channel already deleted
+            self.untrack_channel(channel_id)
+            return
+        
+        # Someone may have joined without us seeing the event
+        await self.delete_temp_channel(channel, require_empty=True)
+    
+    async def delete_temp_channel(self, channel, reason="Temporary channel is empty", require_empty=False):
+        """Delete a tracked temporary channel, returns True if it was deleted"""
+        async with self.channel_locks.hold(channel.id, "delete"):
+            # Owner actions may have run while we waited for the lock
+            if channel.id not in self.temp_channels:
+                return False
+            if require_empty:
+                # Deleting is irreversible, so check the cache rather than the counter
+                self.occupancy.reconcile(channel)
+                if not self.occupancy.is_empty(channel):
+                    return False
+            
+            self.deletion_scheduler.cancel(channel.id)
+            try:
+                self.logger.info("Deleting empty temporary channel: %s", channel.name)
+                await self.actions.delete_channel(channel, reason=reason)
+                self.untrack_channel(channel.id)
+                return True
+            except discord.NotFound:
                 # Channel already deleted
-                self.temp_channels.pop(channel.id, None)
-                return
+                self.untrack_channel(channel.id)
+            except discord.Forbidden:
+                self.logger.error("No permission to delete channel: %s", channel.name)
+            except Exception as e:
+                self.logger.error("Error cleaning up channel %s: %s", channel.name, e)
+            return False
+    
+    async def sweep_empty_channels(self):
+        """Delete all empty temporary channels concurrently, returns the number deleted"""
+        if self.sweep_lock.locked():
+            self.logger.warning("Cleanup sweep already running, skipping")
+            return 0
+        
+        async with self.sweep_lock:
+            started = time.perf_counter()
+            checked = len(self.temp_channels)
+            now = discord.utils.utcnow()
+            empty_channels = []
             
-            # Check if channel is empty (no members)
-            if len(channel.members) == 0:
-                self.logger.info(f"Deleting empty temporary channel: {channel.name}")
-                await channel.delete(reason="Temporary channel is empty")
-                self.temp_channels.pop(channel.id, None)
-                
-        except discord.NotFound:
-            # Channel already deleted
-            self.temp_channels.pop(channel.id, None)
-        except discord.Forbidden:
-            self.logger.error(f"No permission to delete channel: {channel.name}")
-        except Exception as e:
-            channel_name = channel.name if channel else "Unknown"
-            self.logger.error(f"Error cleaning up channel {channel_name}: {e}")
+            # Occupancy is O(1) per channel; every so often it is re-read from the cache to fix drift
+            reconcile = time.monotonic() - self.occupancy_reconciled_at >= self.config.OCCUPANCY_RECONCILE_INTERVAL
+            if reconcile:
+                self.occupancy_reconciled_at = time.monotonic()
+            
+            for channel_id in list(self.temp_channels):
+                channel = self.get_channel(channel_id)
+                if not channel:
+                    # Channel doesn't exist anymore
+                    self.untrack_channel(channel_id)
+                    continue
+                if reconcile:
+                    self.occupancy.reconcile(channel)
+                if not self.occupancy.is_empty(channel) or channel_id in self.deletion_scheduler:
+                    continue  # Occupied, or its deadline is already pending
+                record = self.temp_channels.get(channel_id)
+                delay = self.expiry.grace_for(record, now)
+                fresh = now - record.tracked_at < datetime.timedelta(seconds=delay)
+                if fresh or self.expiry.is_warm(record):
+                    # Give fresh channels time for their creator to join, and popular ones their full grace
+                    self.deletion_scheduler.schedule(channel_id, delay)
+                else:
+                    empty_channels.append(channel)
+            
+            semaphore = asyncio.Semaphore(self.config.CLEANUP_CONCURRENCY)
+            
+            async def delete(channel):
+                async with semaphore:
+                    return await self.delete_temp_channel(channel, require_empty=True)
+            
+            results = await asyncio.gather(*(delete(channel) for channel in empty_channels))
+            deleted = sum(results)
+            duration = time.perf_counter() - started
+            
+            self.last_sweep = {
+                "checked": checked,
+                "empty": len(empty_channels),
+                "deleted": deleted,
+                "duration": duration,
+            }
+            self.sweep_duration.observe(duration)
+            self.sweep_deleted.inc(deleted)
+            self.logger.info(
+                "Cleanup sweep checked %d channels, deleted %d/%d empty in %.2fs",
+                checked, deleted, len(empty_channels), duration
+            )
+            return deleted
     
     @tasks.loop(minutes=5)
     async def channel_cleanup(self):
         """Periodic cleanup task to remove empty temporary channels"""
-        channels_to_remove = []
-        
-        for channel_id in list(self.temp_channels.keys()):
-            channel = self.get_channel(channel_id)
-            if channel:
-                await self.check_and_cleanup_channel(channel)
-            else:
-                # Channel doesn't exist anymore
-                channels_to_remove.append(channel_id)
-        
-        # Clean up tracked channels that no longer exist
-        for channel_id in channels_to_remove:
-            self.temp_channels.pop(channel_id, None)
+        await self.sweep_empty_channels()
     
     @channel_cleanup.before_loop
     async def before_cleanup(self):
         """Wait for bot to be ready before starting cleanup task"""
         await self.wait_until_ready()
     
+    def begin_close(self):
+        """Start shutting down once, returns the task every close() call waits on"""
+        if self._close_task is None:
+            self._close_task = asyncio.create_task(self._shutdown())
+        return self._close_task
+    
+    async def close(self):
+        """Cancel pending deletions and flush state before shutting down"""
+        # Client.run calls close() again during teardown, possibly while a SIGTERM close is running
+        await asyncio.shield(self.begin_close())
+    
+    async def _shutdown(self):
+        self.deletion_scheduler.cancel_all()
+        await self.channel_pool.close()
+        await self.actions.drain()
+        if self.metrics_server:
+            await self.metrics_server.stop()
+        await self.store.close()
+        await super().close()
+    
     async def on_command_error(self, ctx, error):
         """Global error handler"""
         if isinstance(error, commands.CommandNotFound):
@@ -127,3 +646,12 @@ class VoiceChannelBot(commands.Bot):
                 )
             except:
                 pass
+
+class ShardedVoiceChannelBot(VoiceChannelBot, commands.AutoShardedBot):
+    """VoiceChannelBot running several gateway shards in one process"""
+
+def create_bot(mode="single", **options):
+    """Create the bot for a SHARD_MODE ("single", "auto" or a worker of "processes")"""
+    if mode == "single":
+        return VoiceChannelBot(**options)
+    return ShardedVoiceChannelBot(**options)
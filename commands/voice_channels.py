@@ -1,126 +1,484 @@
 """
 Voice Channel Management Commands
 """
+import asyncio
+import functools
+import time
 import discord
 from discord.ext import commands
 from discord import app_commands
 import re
+from utils.bans import OwnerBanList
+from utils.categories import CategoryCache
+from utils.names import canonical_game_name, sanitize_name
+
+# Names given to gaming channels: "#<room> - <game>'s <owner>"
+GAMING_CHANNEL_PATTERN = re.compile(r"^#\d+ - .+'s .+$")
+ROOM_NUMBER_PATTERN = re.compile(r"^#(\d+) - ")
+
+# Stable custom_id of the /gaming-channel platform select, dispatched by the persistent view
+PLATFORM_SELECT_ID = "vcb:gaming-channel:platform"
+# Custom ID prefixes of the stateless room flow, followed by the platform name
+ROOM_PANEL_PREFIX = "vcb:room-panel:"
+ROOM_MODAL_PREFIX = "vcb:room-modal:"
+
+@functools.lru_cache(maxsize=128)
+def platform_options(platforms):
+    """Select options for a platform tuple, shared by every select that offers them"""
+    return tuple(
+        discord.SelectOption(label=platform, value=platform, emoji="🎮")
+        for platform in platforms
+    )
+
+@functools.lru_cache(maxsize=128)
+def gaming_setup_message(platforms):
+    """Return the (embed, view) sent by /gaming-channel for a platform tuple.
+    
+    Both are built once per platform list, so a config reload that changes
+    the list simply starts using new entries. They are shared between
+    messages and must not be modified. The view is stopped so discord.py
+    only renders it and does not store it: the select on every message is
+    handled by the one ChannelCreationView registered at startup.
+    """
+    embed = discord.Embed(
+        title="🎮 Create Gaming Voice Channel",
+        description="Click the button below to set up your gaming voice channel with platform, game, and user limit options!",
+        color=discord.Color.blue()
+    )
+    embed.add_field(
+        name="📋 What you'll set:",
+        value=f"• Platform ({', '.join(platforms)})\n• Game name\n• Maximum users\n• Auto-cleanup when empty",
+        inline=False
+    )
+    embed.set_footer(text="Channel will be named: {Platform} - {Game} - {Your Name}")
+    
+    view = ChannelCreationView(platforms)
+    view.stop()
+    return embed, view
+
+@functools.lru_cache(maxsize=1)
+def voice_help_embed():
+    """The /voice-help embed, built once (shared, do not modify)"""
+    embed = discord.Embed(
+        title="🔊 Voice Channel Bot Help",
+        description="Manage temporary voice channels with these commands:",
+        color=discord.Color.green()
+    )
+    
+    embed.add_field(
+        name="/create-voice [name]",
+        value="Create a temporary voice channel with an optional custom name. "
+              "The channel will be automatically deleted when empty.",
+        inline=False
+    )
+    
+    embed.add_field(
+        name="/delete-voice",
+        value="Delete a temporary voice channel you created.",
+        inline=False
+    )
+    
+    embed.add_field(
+        name="/list-temp-channels",
+        value="Show the active temporary voice channels in this server.",
+        inline=False
+    )
+    
+    embed.add_field(
+        name="/voice-help",
+        value="Show this help message.",
+        inline=False
+    )
+    
+    embed.add_field(
+        name="📋 Requirements",
+        value="• You must be in a voice channel OR have 'Manage Channels' permission\n"
+              "• Channel names are automatically sanitized\n"
+              "• Channels auto-delete when empty",
+        inline=False
+    )
+    
+    embed.set_footer(text="Bot created for temporary voice channel management")
+    return embed
+
+@functools.lru_cache(maxsize=128)
+def room_modal(platform):
+    """The room form for a platform, stopped so discord.py sends it without keeping it (shared)"""
+    modal = ChannelCreationModal(platform)
+    modal.stop()
+    return modal
+
+@functools.lru_cache(maxsize=128)
+def room_panel_message(platforms):
+    """Return the (embed, view) of a room panel for a platform tuple (shared, do not modify)"""
+    embed = discord.Embed(
+        title="🎮 Create a Gaming Room",
+        description="Pick your platform below, enter the game and room size, and your voice channel is ready.",
+        color=discord.Color.blue()
+    )
+    embed.add_field(
+        name="📋 How it works",
+        value="• Rooms are named `#<number> - <game>'s <you>`\n"
+              "• You can kick, mute, ban and transfer ownership in your room\n"
+              "• Rooms are deleted automatically once everyone has left",
+        inline=False
+    )
+    embed.set_footer(text="You must be in a voice channel or have 'Manage Channels' permission")
+    
+    view = discord.ui.View(timeout=None)
+    for platform in platforms:
+        view.add_item(RoomPanelButton(platform))
+    view.stop()  # Clicks are handled by the registered RoomPanelButton template
+    return embed, view
+
+class RoomPanelButton(discord.ui.DynamicItem[discord.ui.Button], template=ROOM_PANEL_PREFIX + r"(?P<platform>.+)"):
+    """Platform button of a posted room panel.
+    
+    The platform is part of the custom_id, and discord.py rebuilds the item
+    from it on every click, so panels keep working after restarts without
+    any view object per panel or per user.
+    """
+    
+    def __init__(self, platform):
+        super().__init__(discord.ui.Button(
+            label=platform,
+            emoji="🎮",
+            style=discord.ButtonStyle.primary,
+            custom_id=f"{ROOM_PANEL_PREFIX}{platform}"
+        ))
+        self.platform = platform
+    
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match):
+        return cls(match["platform"])
+    
+    async def callback(self, interaction: discord.Interaction):
+        cog = interaction.client.get_cog('VoiceChannelCommands')
+        if cog:
+            await cog.open_room_modal(interaction, self.platform)
 
 class PlatformSelect(discord.ui.Select):
     def __init__(self, platforms):
-        options = [
-            discord.SelectOption(label=platform, value=platform, emoji="🎮")
-            for platform in platforms
-        ]
-        super().__init__(placeholder="Choose your platform...", options=options)
+        super().__init__(
+            placeholder="Choose your platform...",
+            options=list(platform_options(tuple(platforms))),
+            custom_id=PLATFORM_SELECT_ID
+        )
 
     async def callback(self, interaction: discord.Interaction):
-        selected_platform = self.values[0]
-        modal = ChannelCreationModal(selected_platform)
-        await interaction.response.send_modal(modal)
+        cog = interaction.client.get_cog('VoiceChannelCommands')
+        if cog:
+            await cog.open_room_modal(interaction, self.values[0])
 
 class ChannelCreationModal(discord.ui.Modal, title='Create Gaming Voice Channel'):
+    """Game name and room size form for a platform.
+    
+    Sent from shared, stopped instances (see room_modal) so no modal is kept
+    per user, not even for forms that are dismissed. The platform travels in
+    the custom_id and VoiceChannelCommands.on_interaction handles the submit.
+    """
+    
     def __init__(self, platform):
-        super().__init__()
+        super().__init__(custom_id=f"{ROOM_MODAL_PREFIX}{platform}")
         self.selected_platform = platform
     
     game_name = discord.ui.TextInput(
         label='Game Name',
         placeholder='Mobile Legends, Dota2, LOL, Valorant, or custom game name',
         required=True,
-        max_length=50
+        max_length=50,
+        custom_id="game_name"
     )
     
     max_users = discord.ui.TextInput(
         label='Max Users (2-99)',
         placeholder='Enter maximum number of users (default: 10)',
         required=False,
-        max_length=2
+        max_length=2,
+        custom_id="max_users"
     )
-
-    async def on_submit(self, interaction: discord.Interaction):
-        # Get the voice channel commands cog from the bot
-        cog = interaction.client.get_cog('VoiceChannelCommands')
-        if cog:
-            await cog.create_gaming_channel(interaction, self.selected_platform, self.game_name.value, self.max_users.value)
+    
+    @staticmethod
+    def submitted_values(interaction):
+        """Return (platform, {input custom_id: value}) from a submission of this form"""
+        values = {}
+        pending = list(interaction.data.get("components", []))
+        while pending:
+            component = pending.pop()
+            pending.extend(component.get("components", ()))
+            if "component" in component:
+                pending.append(component["component"])  # Inputs wrapped in a label
+            if "value" in component:
+                values[component["custom_id"]] = component["value"]
+        return interaction.data["custom_id"][len(ROOM_MODAL_PREFIX):], values
 
 class ChannelCreationView(discord.ui.View):
-    def __init__(self, platforms):
-        super().__init__(timeout=300)
+    """Platform picker of /gaming-channel.
+    
+    Persistent (no timeout, stable custom_id): one instance is registered
+    with bot.add_view() when the cog loads and answers the select on every
+    setup message, including ones sent before a restart. Only the chosen
+    value is read, so its own option list does not matter.
+    """
+    
+    def __init__(self, platforms=()):
+        super().__init__(timeout=None)
         self.add_item(PlatformSelect(platforms))
 
+class TempChannelListView(discord.ui.View):
+    """Paginated listing of a guild's temporary channels"""
+    
+    PAGE_SIZE = 10
+    
+    def __init__(self, bot, guild, user_id, channel_ids):
+        super().__init__(timeout=120)
+        self.bot = bot
+        self.guild = guild
+        self.user_id = user_id
+        self.channel_ids = channel_ids  # Snapshot taken when the command ran
+        self.page = 0
+        self.page_count = max(1, -(-len(channel_ids) // self.PAGE_SIZE))
+        self._update_buttons()
+    
+    def build_embed(self):
+        """Build the embed for the current page, resolving only its channels"""
+        embed = discord.Embed(
+            title="🔊 Temporary Voice Channels",
+            color=discord.Color.blue()
+        )
+        
+        start = self.page * self.PAGE_SIZE
+        for channel_id in self.channel_ids[start:start + self.PAGE_SIZE]:
+            channel = self.guild.get_channel(channel_id)
+            owner_id = self.bot.temp_channels.owner_of(channel_id)
+            
+            if channel and owner_id is not None:
+                embed.add_field(
+                    name=f"🔗 {channel.name}",
+                    value=f"👤 Created by: <@{owner_id}>\n"
+                          f"👥 Members: {self.bot.occupancy.count(channel)}",
+                    inline=True
+                )
+        
+        if not embed.fields:
+            embed.description = "No active temporary channels found on this page."
+        
+        embed.set_footer(text=f"Page {self.page + 1}/{self.page_count} • {len(self.channel_ids)} channels")
+        return embed
+    
+    def _update_buttons(self):
+        self.previous_page.disabled = self.page == 0
+        self.next_page.disabled = self.page >= self.page_count - 1
+    
+    async def interaction_check(self, interaction: discord.Interaction):
+        return interaction.user.id == self.user_id
+    
+    async def _show_page(self, interaction, page):
+        self.page = max(0, min(page, self.page_count - 1))
+        self._update_buttons()
+        await interaction.response.edit_message(embed=self.build_embed(), view=self)
+    
+    @discord.ui.button(label="◀ Previous", style=discord.ButtonStyle.secondary)
+    async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show_page(interaction, self.page - 1)
+    
+    @discord.ui.button(label="Next ▶", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show_page(interaction, self.page + 1)
+
+class BulkModerationView(discord.ui.View):
+    """Member picker with bulk kick/mute/ban actions for a channel owner"""
+    
+    def __init__(self, cog, owner_id, channel_id):
+        super().__init__(timeout=180)
+        self.cog = cog
+        self.owner_id = owner_id
+        self.channel_id = channel_id
+        self.selected = []
+    
+    async def interaction_check(self, interaction: discord.Interaction):
+        return interaction.user.id == self.owner_id
+    
+    @discord.ui.select(cls=discord.ui.UserSelect, placeholder="Choose members...", min_values=1, max_values=25)
+    async def member_select(self, interaction: discord.Interaction, select: discord.ui.UserSelect):
+        self.selected = list(select.values)
+        await interaction.response.defer()
+    
+    async def _apply(self, interaction, action, targets):
+        channel = interaction.guild.get_channel(self.channel_id)
+        if channel is None:
+            await interaction.response.send_message("❌ Your channel no longer exists.", ephemeral=True)
+            return
+        if not targets:
+            await interaction.response.send_message("❌ Choose some members first.", ephemeral=True)
+            return
+        await interaction.response.defer()
+        summary = await self.cog.bulk_moderate(interaction.user, channel, action, targets)
+        await interaction.followup.send(summary, ephemeral=True)
+    
+    @discord.ui.button(label="Kick", style=discord.ButtonStyle.secondary, emoji="👢")
+    async def kick_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._apply(interaction, "kick", self.selected)
+    
+    @discord.ui.button(label="Mute", style=discord.ButtonStyle.secondary, emoji="🔇")
+    async def mute_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._apply(interaction, "mute", self.selected)
+    
+    @discord.ui.button(label="Unmute", style=discord.ButtonStyle.secondary, emoji="🔊")
+    async def unmute_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._apply(interaction, "unmute", self.selected)
+    
+    @discord.ui.button(label="Ban", style=discord.ButtonStyle.danger, emoji="🚫")
+    async def ban_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._apply(interaction, "ban", self.selected)
+    
+    @discord.ui.button(label="Kick everyone except me", style=discord.ButtonStyle.danger, row=2)
+    async def kick_all_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        channel = interaction.guild.get_channel(self.channel_id)
+        await self._apply(interaction, "kick", list(channel.members) if channel else [])
+
 class VoiceChannelCommands(commands.Cog):
     """Cog for voice channel management commands"""
     
     def __init__(self, bot):
         self.bot = bot
         self.logger = bot.logger
-        # Default platforms - can be modified with commands
-        self.platforms = ["PC", "Mobile", "Console", "Switch", "PlayStation", "Xbox"]
-        # Track channel numbers per platform
-        self.platform_counters = {}
-        # Track banned users per channel
-        self.channel_bans = {}  # {channel_id: [user_ids]}
-    
-    def sanitize_channel_name(self, name):
-        """Sanitize channel name to meet Discord requirements"""
-        # Remove invalid characters and limit length
-        name = re.sub(r'[^\w\s-]', '', name)
-        name = name.strip()
-        if len(name) > self.bot.config.MAX_CHANNEL_NAME_LENGTH:
-            name = name[:self.bot.config.MAX_CHANNEL_NAME_LENGTH]
-        
-        # Ensure name is not empty
-        if not name:
-            name = self.bot.config.DEFAULT_CHANNEL_NAME
-        
-        return name
+        # Users each owner has banned, applied to every room they create
+        self.owner_bans = OwnerBanList(bot.store, limit=bot.config.OWNER_BAN_LIMIT)
+        self.owner_bans.load({
+            key: user_ids for key, user_ids in bot.restored_state.get(OwnerBanList.NAMESPACE, {}).items()
+            if bot.owns_guild(int(key.split(":")[0]))
+        })
+        # Resolved categories per guild and platform
+        self.category_cache = CategoryCache(self.logger, rest_duration=bot.rest_duration)
+    
+    async def cog_load(self):
+        """Register the persistent views that handle components of already sent messages"""
+        self.bot.add_view(ChannelCreationView())
+        self.bot.add_dynamic_items(RoomPanelButton)
+    
+    @commands.Cog.listener()
+    async def on_interaction(self, interaction: discord.Interaction):
+        """Stateless dispatcher for room form submissions"""
+        if interaction.type is not discord.InteractionType.modal_submit:
+            return
+        if not interaction.data.get("custom_id", "").startswith(ROOM_MODAL_PREFIX):
+            return
+        platform, values = ChannelCreationModal.submitted_values(interaction)
+        await self.create_gaming_channel(interaction, platform, values.get("game_name", ""), values.get("max_users", ""))
+    
+    async def open_room_modal(self, interaction, platform):
+        """Answer a platform pick (panel button or /gaming-channel select) with the room form"""
+        if not self.check_permissions(interaction.user, interaction.guild):
+            await interaction.response.send_message(
+                "❌ You need to be in a voice channel or have 'Manage Channels' permission to create temporary channels.",
+                ephemeral=True
+            )
+            return
+        if platform not in self.bot.config.for_guild(interaction.guild.id).PLATFORMS:
+            await interaction.response.send_message(
+                f"❌ {platform} rooms are no longer offered here, ask an admin to post a new panel.",
+                ephemeral=True
+            )
+            return
+        await interaction.response.send_modal(room_modal(platform))
+    
+    def sanitize_channel_name(self, name, guild_id=None):
+        """Sanitize channel name to meet Discord requirements (cached)"""
+        config = self.bot.config.for_guild(guild_id)
+        return sanitize_name(name, config.MAX_CHANNEL_NAME_LENGTH, config.DEFAULT_CHANNEL_NAME)
+    
+    def managed_categories(self, guild_id=None):
+        """Return {category name: platform} for the categories the bot creates (None = legacy)"""
+        config = self.bot.config.for_guild(guild_id)
+        categories = {f"🎮 {platform} Gaming": platform for platform in config.PLATFORMS}
+        categories[config.TEMP_CATEGORY_NAME] = None
+        return categories
     
     async def get_or_create_platform_category(self, guild, platform):
         """Get or create a platform-specific category"""
         category_name = f"🎮 {platform} Gaming"
         
-        # Look for existing category
-        category = discord.utils.get(guild.categories, name=category_name)
-        
-        if not category:
-            try:
-                category = await guild.create_category(
-                    category_name,
-                    reason=f"Category for {platform} gaming channels"
-                )
-                self.logger.info(f"Created platform category: {category_name}")
-            except discord.Forbidden:
-                self.logger.error("No permission to create category")
-                return None
-            except Exception as e:
-                self.logger.error(f"Error creating category: {e}")
-                return None
-        
-        return category
+        try:
+            return await self.category_cache.get_or_create(
+                guild,
+                platform,
+                category_name,
+                reason=f"Category for {platform} gaming channels"
+            )
+        except discord.Forbidden:
+            self.logger.error("No permission to create category")
+        except Exception as e:
+            self.logger.error(f"Error creating category: {e}")
+        return None
 
     async def get_or_create_temp_category(self, guild):
         """Get or create the temporary channels category (legacy)"""
-        category_name = self.bot.config.TEMP_CATEGORY_NAME
-        
-        # Look for existing category
-        category = discord.utils.get(guild.categories, name=category_name)
+        category_name = self.bot.config.for_guild(guild.id).TEMP_CATEGORY_NAME
         
-        if not category:
-            try:
-                category = await guild.create_category(
-                    category_name,
-                    reason="Category for temporary voice channels"
+        try:
+            return await self.category_cache.get_or_create(
+                guild,
+                None,  # Legacy category is not tied to a platform
+                category_name,
+                reason="Category for temporary voice channels"
+            )
+        except discord.Forbidden:
+            self.logger.error("No permission to create category")
+        except Exception as e:
+            self.logger.error(f"Error creating category: {e}")
+        return None
+    
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel):
+        """Drop deleted categories from the category cache"""
+        if isinstance(channel, discord.CategoryChannel):
+            self.category_cache.invalidate(channel.id)
+    
+    @commands.Cog.listener()
+    async def on_guild_channel_update(self, before, after):
+        """Drop renamed categories from the category cache"""
+        if isinstance(after, discord.CategoryChannel) and before.name != after.name:
+            self.category_cache.invalidate(after.id)
+    
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild):
+        """Drop cached categories of guilds the bot left"""
+        self.category_cache.invalidate_guild(guild.id)
+    
+    async def create_temp_voice_channel(self, guild, platform, name, *, category, overwrites, reason, **options):
+        """Claim a pre-warmed channel from the pool, or create a new one on a miss"""
+        channel = await self.bot.channel_pool.claim(
+            guild, platform, name=name, overwrites=overwrites, reason=reason, **options
+        )
+        if channel is None:
+            with self.bot.rest_duration.labels("create_channel").time():
+                channel = await guild.create_voice_channel(
+                    name, category=category, overwrites=overwrites, reason=reason, **options
                 )
-                self.logger.info(f"Created temporary channels category: {category_name}")
-            except discord.Forbidden:
-                self.logger.error("No permission to create category")
-                return None
-            except Exception as e:
-                self.logger.error(f"Error creating category: {e}")
-                return None
-        
-        return category
+        return channel
+    
+    async def interaction_check(self, interaction: discord.Interaction):
+        """Stamp the start time of every command for the duration histogram"""
+        interaction.extras["started_at"] = time.perf_counter()
+        return True
+    
+    def _observe_command(self, interaction, name):
+        started_at = interaction.extras.get("started_at")
+        if started_at is not None:
+            self.bot.command_duration.labels(name).observe(time.perf_counter() - started_at)
+    
+    @commands.Cog.listener()
+    async def on_app_command_completion(self, interaction: discord.Interaction, command):
+        """Record how long a completed slash command took"""
+        self._observe_command(interaction, command.qualified_name)
+    
+    async def cog_app_command_error(self, interaction: discord.Interaction, error):
+        """Record slash commands that raised"""
+        name = interaction.command.qualified_name if interaction.command else "unknown"
+        self._observe_command(interaction, name)
+        self.bot.command_errors.labels(name).inc()
+        self.logger.error("Error in /%s: %s", name, error)
     
     def check_permissions(self, member, guild):
         """Check if user has required permissions"""
@@ -148,24 +506,13 @@ class VoiceChannelCommands(commands.Cog):
             )
             return
         
-        # Create embed
-        embed = discord.Embed(
-            title="🎮 Create Gaming Voice Channel",
-            description="Click the button below to set up your gaming voice channel with platform, game, and user limit options!",
-            color=discord.Color.blue()
-        )
-        embed.add_field(
-            name="📋 What you'll set:",
-            value="• Platform (PC, Mobile, Console)\n• Game name\n• Maximum users\n• Auto-cleanup when empty",
-            inline=False
-        )
-        embed.set_footer(text="Channel will be named: {Platform} - {Game} - {Your Name}")
-        
-        view = ChannelCreationView(self.platforms)
+        # Prebuilt per platform list; the select is handled by the registered persistent view
+        embed, view = gaming_setup_message(self.bot.config.for_guild(interaction.guild.id).PLATFORMS)
         await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
 
     async def create_gaming_channel(self, interaction: discord.Interaction, platform: str, game_name: str, max_users_str: str):
         """Create the actual gaming voice channel from modal data"""
+        started_at = time.perf_counter()
         await interaction.response.defer()
         
         try:
@@ -182,21 +529,18 @@ class VoiceChannelCommands(commands.Cog):
                     max_users = 10
             
             # Sanitize inputs
-            platform = self.sanitize_channel_name(platform)
-            game_name = self.sanitize_channel_name(game_name)
+            platform = self.sanitize_channel_name(platform, interaction.guild.id)
+            game_name = canonical_game_name(self.sanitize_channel_name(game_name, interaction.guild.id))
             
-            # Get next room number for this platform
-            if platform not in self.platform_counters:
-                self.platform_counters[platform] = 0
-            self.platform_counters[platform] += 1
-            room_number = self.platform_counters[platform]
+            # Get or create platform-specific category
+            category = await self.get_or_create_platform_category(interaction.guild, platform)
+            
+            # Lowest free room number for this platform in this guild
+            room_number = self.bot.room_numbers.allocate(interaction.guild.id, platform)
             
             # Create channel name format: #{Number} - {Game}'s {Owner}
             channel_name = f"#{room_number} - {game_name}'s {interaction.user.display_name}"
             
-            # Get or create platform-specific category
-            category = await self.get_or_create_platform_category(interaction.guild, platform)
-            
             # Enhanced permissions for channel creator
             overwrites = {
                 interaction.guild.default_role: discord.PermissionOverwrite(connect=True),
@@ -208,23 +552,36 @@ class VoiceChannelCommands(commands.Cog):
                     mute_members=True,
                     deafen_members=True,
                     priority_speaker=True
-                )
+                ),
+                # The owner's bans ride along with the create call
+                **self.owner_bans.overwrites(interaction.guild.id, interaction.user.id)
             }
             
-            voice_channel = await interaction.guild.create_voice_channel(
-                channel_name,
-                category=category,
-                overwrites=overwrites,
-                user_limit=max_users,
-                reason=f"Gaming voice channel created by {interaction.user}"
-            )
+            try:
+                voice_channel = await self.create_temp_voice_channel(
+                    interaction.guild,
+                    platform,
+                    channel_name,
+                    category=category,
+                    overwrites=overwrites,
+                    user_limit=max_users,
+                    reason=f"Gaming voice channel created by {interaction.user}"
+                )
+            except Exception:
+                self.bot.room_numbers.release(interaction.guild.id, platform, room_number)
+                raise
             
             # Track the temporary channel
-            self.bot.temp_channels[voice_channel.id] = interaction.user.id
+            self.bot.temp_channels.add(
+                voice_channel.id, interaction.guild.id, interaction.user.id,
+                platform=platform, room_number=room_number
+            )
             
-            self.logger.info(f"Created gaming voice channel: {channel_name} by {interaction.user}")
+            self.logger.info("Created gaming voice channel: %s by %s", channel_name, interaction.user)
             
             # Success embed with clickable channel link
+            # Mostly per-channel content, so it is built per call rather than from a template
+            grace = self.bot.expiry.policy_for(interaction.guild.id, platform).grace
             success_embed = discord.Embed(
                 title="✅ Gaming Channel Created!",
                 description=f"🎮 **Click here to join:** <#{voice_channel.id}>",
@@ -233,8 +590,8 @@ class VoiceChannelCommands(commands.Cog):
             success_embed.add_field(name="📱 Platform", value=platform, inline=True)
             success_embed.add_field(name="🎲 Game", value=game_name, inline=True)
             success_embed.add_field(name="👥 Max Users", value=str(max_users), inline=True)
-            success_embed.add_field(name="🛡️ Owner Powers", value="Use `/kick-user`, `/mute-user`, `/ban-user`, `/transfer-owner`", inline=False)
-            success_embed.add_field(name="🗑️ Auto-cleanup", value="Channel deletes after 10 seconds when empty", inline=False)
+            success_embed.add_field(name="🛡️ Owner Powers", value="Use `/kick-user`, `/mute-user`, `/ban-user`, `/unban-user`, `/transfer-owner`, or `/bulk-moderate` for several members", inline=False)
+            success_embed.add_field(name="🗑️ Auto-cleanup", value=f"Channel deletes after {grace:g} seconds when empty", inline=False)
             
             await interaction.followup.send(embed=success_embed, ephemeral=True)
             
@@ -249,6 +606,8 @@ class VoiceChannelCommands(commands.Cog):
                 f"❌ An error occurred while creating the voice channel: {str(e)}",
                 ephemeral=True
             )
+        finally:
+            self.bot.command_duration.labels("gaming-channel-submit").observe(time.perf_counter() - started_at)
 
     @app_commands.command(name="create-voice", description="Create a simple temporary voice channel")
     @app_commands.describe(name="Name for the temporary voice channel")
@@ -269,7 +628,7 @@ class VoiceChannelCommands(commands.Cog):
             if not name:
                 name = f"{interaction.user.display_name}'s Channel"
             
-            channel_name = self.sanitize_channel_name(name)
+            channel_name = self.sanitize_channel_name(name, interaction.guild.id)
             
             # Get or create temporary category
             category = await self.get_or_create_temp_category(interaction.guild)
@@ -283,10 +642,13 @@ class VoiceChannelCommands(commands.Cog):
                     manage_channels=True,
                     move_members=True,
                     mute_members=True
-                )
+                ),
+                **self.owner_bans.overwrites(interaction.guild.id, interaction.user.id)
             }
             
-            voice_channel = await interaction.guild.create_voice_channel(
+            voice_channel = await self.create_temp_voice_channel(
+                interaction.guild,
+                None,  # Legacy channels share the temporary category pool
                 channel_name,
                 category=category,
                 overwrites=overwrites,
@@ -294,9 +656,9 @@ class VoiceChannelCommands(commands.Cog):
             )
             
             # Track the temporary channel
-            self.bot.temp_channels[voice_channel.id] = interaction.user.id
+            self.bot.temp_channels.add(voice_channel.id, interaction.guild.id, interaction.user.id)
             
-            self.logger.info(f"Created temporary voice channel: {channel_name} by {interaction.user}")
+            self.logger.info("Created temporary voice channel: %s by %s", channel_name, interaction.user)
             
             await interaction.followup.send(
                 f"✅ Created temporary voice channel: **{channel_name}**\n"
@@ -323,10 +685,11 @@ class VoiceChannelCommands(commands.Cog):
         await interaction.response.defer()
         
         try:
-            user_id = interaction.user.id
+            # Only consider the caller's channels in this guild
+            guild_channels = self.bot.temp_channels.channels_in(interaction.guild.id)
             user_channels = [
-                channel_id for channel_id, creator_id in self.bot.temp_channels.items()
-                if creator_id == user_id
+                channel_id for channel_id in self.bot.temp_channels.channels_of(interaction.user.id)
+                if channel_id in guild_channels
             ]
             
             if not user_channels:
@@ -336,28 +699,23 @@ class VoiceChannelCommands(commands.Cog):
                 )
                 return
             
-            # If user is in a voice channel and it's their temp channel, delete it
+            # Prefer the temp channel the user is in, otherwise the first one they created
+            # (snowflake IDs grow over time, the index is a set)
+            channel_id = min(user_channels)
             if interaction.user.voice and interaction.user.voice.channel:
-                current_channel = interaction.user.voice.channel
-                if current_channel.id in user_channels:
-                    channel_name = current_channel.name
-                    await current_channel.delete(reason=f"Deleted by creator: {interaction.user}")
-                    self.bot.temp_channels.pop(current_channel.id, None)
-                    
-                    await interaction.followup.send(
-                        f"✅ Deleted temporary voice channel: **{channel_name}**",
-                        ephemeral=True
-                    )
-                    return
-            
-            # Otherwise, delete the first channel they created
-            channel_id = user_channels[0]
+                if interaction.user.voice.channel.id in user_channels:
+                    channel_id = interaction.user.voice.channel.id
             channel = self.bot.get_channel(channel_id)
             
             if channel:
                 channel_name = channel.name
-                await channel.delete(reason=f"Deleted by creator: {interaction.user}")
-                self.bot.temp_channels.pop(channel_id, None)
+                async with self.bot.channel_locks.hold(channel_id, "delete"):
+                    # It may have been deleted or handed over while we waited
+                    if not self.bot.temp_channels.is_owner(channel_id, interaction.user.id):
+                        await interaction.followup.send("❌ That channel is no longer yours to delete.", ephemeral=True)
+                        return
+                    await self.bot.actions.delete_channel(channel, reason=f"Deleted by creator: {interaction.user}")
+                    self.bot.untrack_channel(channel_id)
                 
                 await interaction.followup.send(
                     f"✅ Deleted temporary voice channel: **{channel_name}**",
@@ -365,7 +723,7 @@ class VoiceChannelCommands(commands.Cog):
                 )
             else:
                 # Channel doesn't exist anymore
-                self.bot.temp_channels.pop(channel_id, None)
+                self.bot.untrack_channel(channel_id)
                 await interaction.followup.send(
                     "❌ Channel not found. It may have already been deleted.",
                     ephemeral=True
@@ -383,88 +741,165 @@ class VoiceChannelCommands(commands.Cog):
                 ephemeral=True
             )
     
-    @app_commands.command(name="list-temp-channels", description="List all temporary voice channels")
+    @app_commands.command(name="list-temp-channels", description="List the temporary voice channels in this server")
     async def list_temp_channels(self, interaction: discord.Interaction):
-        """List all temporary voice channels"""
-        await interaction.response.defer()
+        """List the temporary voice channels in the caller's guild"""
+        # Only the caller's guild partition is touched
+        channel_ids = sorted(self.bot.temp_channels.channels_in(interaction.guild.id))
         
-        if not self.bot.temp_channels:
-            await interaction.followup.send(
+        if not channel_ids:
+            await interaction.response.send_message(
                 "📝 No temporary voice channels are currently active.",
                 ephemeral=True
             )
             return
         
-        embed = discord.Embed(
-            title="🔊 Temporary Voice Channels",
-            color=discord.Color.blue()
-        )
-        
-        for channel_id, creator_id in self.bot.temp_channels.items():
-            channel = self.bot.get_channel(channel_id)
-            creator = self.bot.get_user(creator_id)
-            
-            if channel:
-                member_count = len(channel.members)
-                embed.add_field(
-                    name=f"🔗 {channel.name}",
-                    value=f"👤 Created by: {creator.mention if creator else 'Unknown'}\n"
-                          f"👥 Members: {member_count}",
-                    inline=True
-                )
-        
-        if not embed.fields:
-            embed.description = "No active temporary channels found."
-        
-        await interaction.followup.send(embed=embed, ephemeral=True)
+        view = TempChannelListView(self.bot, interaction.guild, interaction.user.id, channel_ids)
+        await interaction.response.send_message(embed=view.build_embed(), view=view, ephemeral=True)
     
     @app_commands.command(name="voice-help", description="Show help for voice channel commands")
     async def voice_help(self, interaction: discord.Interaction):
         """Show help for voice channel commands"""
-        embed = discord.Embed(
-            title="🔊 Voice Channel Bot Help",
-            description="Manage temporary voice channels with these commands:",
-            color=discord.Color.green()
-        )
-        
-        embed.add_field(
-            name="/create-voice [name]",
-            value="Create a temporary voice channel with an optional custom name. "
-                  "The channel will be automatically deleted when empty.",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="/delete-voice",
-            value="Delete a temporary voice channel you created.",
-            inline=False
-        )
+        await interaction.response.send_message(embed=voice_help_embed(), ephemeral=True)
+
+
+
+    @app_commands.command(name="post-room-panel", description="Post a panel where members create gaming rooms with one click")
+    @app_commands.describe(channel="Channel to post the panel in (defaults to this channel)")
+    @app_commands.default_permissions(manage_guild=True)
+    async def post_room_panel(self, interaction: discord.Interaction, channel: discord.TextChannel = None):
+        """Post a persistent room creation panel with one button per platform"""
+        channel = channel or interaction.channel
+        embed, view = room_panel_message(self.bot.config.for_guild(interaction.guild.id).PLATFORMS)
         
-        embed.add_field(
-            name="/list-temp-channels",
-            value="Show all currently active temporary voice channels.",
-            inline=False
-        )
+        try:
+            await channel.send(embed=embed, view=view)
+        except discord.Forbidden:
+            await interaction.response.send_message(f"❌ I don't have permission to send messages in {channel.mention}.", ephemeral=True)
+            return
+        except Exception as e:
+            self.logger.error("Error posting room panel in %s: %s", channel, e)
+            await interaction.response.send_message(f"❌ An error occurred while posting the panel: {str(e)}", ephemeral=True)
+            return
         
-        embed.add_field(
-            name="/voice-help",
-            value="Show this help message.",
-            inline=False
-        )
+        self.logger.info("%s posted a room panel in %s", interaction.user, channel)
+        await interaction.response.send_message(f"✅ Room panel posted in {channel.mention}.", ephemeral=True)
+
+    @app_commands.command(name="bulk-moderate", description="Kick, mute or ban several members of your voice channel at once")
+    async def bulk_moderate_command(self, interaction: discord.Interaction):
+        """Open the bulk moderation panel for the owner's channel"""
+        channel = interaction.user.voice.channel if interaction.user.voice else None
+        if channel is None or not self.bot.temp_channels.is_owner(channel.id, interaction.user.id):
+            await interaction.response.send_message("❌ You must be in a voice channel you created.", ephemeral=True)
+            return
         
-        embed.add_field(
-            name="📋 Requirements",
-            value="• You must be in a voice channel OR have 'Manage Channels' permission\n"
-                  "• Channel names are automatically sanitized\n"
-                  "• Channels auto-delete when empty",
-            inline=False
+        view = BulkModerationView(self, interaction.user.id, channel.id)
+        await interaction.response.send_message(
+            f"🛡️ Pick members of **{channel.name}**, then choose an action.", view=view, ephemeral=True
         )
+    
+    @app_commands.command(name="clear-channel", description="Kick everyone except you from your voice channel")
+    async def clear_channel(self, interaction: discord.Interaction):
+        """Kick all other members from the owner's channel in one go"""
+        await interaction.response.defer()
         
-        embed.set_footer(text="Bot created for temporary voice channel management")
+        channel = interaction.user.voice.channel if interaction.user.voice else None
+        if channel is None:
+            await interaction.followup.send("❌ You must be in a voice channel to use this command.", ephemeral=True)
+            return
         
-        await interaction.response.send_message(embed=embed, ephemeral=True)
-
-
+        summary = await self.bulk_moderate(interaction.user, channel, "kick", list(channel.members))
+        await interaction.followup.send(summary, ephemeral=True)
+    
+    async def bulk_moderate(self, owner, channel, action, targets):
+        """Apply kick/mute/unmute/ban to many members at once, returns one summary message"""
+        async with self.bot.channel_locks.hold(channel.id, f"bulk-{action}"):
+            if not self.bot.temp_channels.is_owner(channel.id, owner.id):
+                return "❌ You can only moderate channels you created."
+            
+            # Never act on the owner or the bot, and only once per member
+            excluded = {owner.id, self.bot.user.id}
+            targets = list({target.id: target for target in targets if target.id not in excluded}.values())
+            in_channel = [
+                target for target in targets
+                if getattr(target, "voice", None) and target.voice.channel == channel
+            ]
+            reason = f"Bulk {action} by channel owner {owner}"
+            failures = {}  # {member: reason}
+            done = []
+            
+            if action == "ban":
+                banned = []
+                for target in targets:
+                    if self.owner_bans.add(channel.guild.id, owner.id, target.id):
+                        banned.append(target)
+                    else:
+                        failures[target] = "ban list full"
+                
+                # Submitted back to back, the overwrites coalesce into one channel edit
+                try:
+                    await asyncio.gather(*(
+                        self.bot.actions.set_permissions(channel, target, discord.PermissionOverwrite(connect=False), reason=reason)
+                        for target in banned
+                    ))
+                except Exception as e:
+                    return f"❌ Could not update channel permissions: {self._failure_reason(e)}"
+                done = banned
+                to_move = [target for target in in_channel if target in banned]
+                skipped = []
+            else:
+                to_move = in_channel
+                skipped = [target for target in targets if target not in in_channel]
+            
+            # Moves and mutes are per member: run them concurrently, bounded so one room can't hog the queue
+            semaphore = asyncio.Semaphore(self.bot.config.BULK_ACTION_CONCURRENCY)
+            
+            async def apply(member):
+                async with semaphore:
+                    try:
+                        if action in ("mute", "unmute"):
+                            await self.bot.actions.edit_member(member, mute=action == "mute", reason=reason)
+                        else:
+                            await self.bot.actions.move_member(member, None, reason=reason)
+                    except Exception as e:
+                        # A ban still stands when only the disconnect failed
+                        prefix = "banned but not disconnected, " if action == "ban" else ""
+                        failures[member] = prefix + self._failure_reason(e)
+                        return False
+                    return True
+            
+            results = await asyncio.gather(*(apply(member) for member in to_move))
+            if action != "ban":
+                done = [member for member, ok in zip(to_move, results) if ok]
+            
+            self.logger.info(
+                "%s bulk %s in %s: %d done, %d failed, %d skipped",
+                owner, action, channel.name, len(done), len(failures), len(skipped)
+            )
+            return self._bulk_summary(action, done, failures, skipped)
+    
+    @staticmethod
+    def _failure_reason(error):
+        if isinstance(error, discord.Forbidden):
+            return "missing permission"
+        if isinstance(error, discord.NotFound):
+            return "no longer here"
+        return str(error)
+    
+    @staticmethod
+    def _bulk_summary(action, done, failures, skipped):
+        past = {"kick": "Kicked", "mute": "Muted", "unmute": "Unmuted", "ban": "Banned"}[action]
+        lines = []
+        if done:
+            lines.append(f"✅ {past} {len(done)} member{'s' if len(done) != 1 else ''}: " + ", ".join(m.mention for m in done))
+        if failures:
+            lines.append("⚠️ Failed: " + ", ".join(f"{m.mention} ({why})" for m, why in failures.items()))
+        if skipped:
+            lines.append("↪️ Not in your channel: " + ", ".join(m.mention for m in skipped))
+        if not lines:
+            lines.append("📝 Nobody to moderate.")
+        # Stay within Discord's message length limit for very large selections
+        return "\n".join(lines)[:2000]
 
     @app_commands.command(name="kick-user", description="Kick a user from your voice channel")
     @app_commands.describe(user="User to kick from the channel")
@@ -478,19 +913,20 @@ class VoiceChannelCommands(commands.Cog):
             return
         
         channel = interaction.user.voice.channel
-        if channel.id not in self.bot.temp_channels or self.bot.temp_channels[channel.id] != interaction.user.id:
-            await interaction.followup.send("❌ You can only kick users from channels you created.", ephemeral=True)
-            return
-        
-        if user.voice and user.voice.channel == channel:
-            try:
-                await user.move_to(None)
-                await interaction.followup.send(f"✅ Kicked {user.mention} from the channel.", ephemeral=True)
-                self.logger.info(f"{interaction.user} kicked {user} from {channel.name}")
-            except discord.Forbidden:
-                await interaction.followup.send("❌ I don't have permission to move members.", ephemeral=True)
-        else:
-            await interaction.followup.send(f"❌ {user.mention} is not in your channel.", ephemeral=True)
+        async with self.bot.channel_locks.hold(channel.id, "kick"):
+            if not self.bot.temp_channels.is_owner(channel.id, interaction.user.id):
+                await interaction.followup.send("❌ You can only kick users from channels you created.", ephemeral=True)
+                return
+            
+            if user.voice and user.voice.channel == channel:
+                try:
+                    await self.bot.actions.move_member(user, None)
+                    await interaction.followup.send(f"✅ Kicked {user.mention} from the channel.", ephemeral=True)
+                    self.logger.info("%s kicked %s from %s", interaction.user, user, channel.name)
+                except discord.Forbidden:
+                    await interaction.followup.send("❌ I don't have permission to move members.", ephemeral=True)
+            else:
+                await interaction.followup.send(f"❌ {user.mention} is not in your channel.", ephemeral=True)
 
     @app_commands.command(name="ban-user", description="Ban a user from joining your voice channel")
     @app_commands.describe(user="User to ban from the channel")
@@ -503,32 +939,73 @@ class VoiceChannelCommands(commands.Cog):
             await interaction.followup.send("❌ You must be in a voice channel to use this command.", ephemeral=True)
             return
         
+        # Owner bans carry over to every future room, never lock out the owner or the bot
+        if user.id in {interaction.user.id, self.bot.user.id}:
+            await interaction.followup.send("❌ You can't ban yourself or the bot.", ephemeral=True)
+            return
+        
         channel = interaction.user.voice.channel
-        if channel.id not in self.bot.temp_channels or self.bot.temp_channels[channel.id] != interaction.user.id:
-            await interaction.followup.send("❌ You can only ban users from channels you created.", ephemeral=True)
+        async with self.bot.channel_locks.hold(channel.id, "ban"):
+            if not self.bot.temp_channels.is_owner(channel.id, interaction.user.id):
+                await interaction.followup.send("❌ You can only ban users from channels you created.", ephemeral=True)
+                return
+            
+            # Banned users are blocked from every room this owner creates from now on
+            guild_id = interaction.guild.id
+            already_banned = self.owner_bans.is_banned(guild_id, interaction.user.id, user.id)
+            if already_banned and channel.overwrites_for(user).connect is False:
+                await interaction.followup.send(f"❌ {user.mention} is already banned from your channel.", ephemeral=True)
+                return
+            
+            if self.owner_bans.add(guild_id, interaction.user.id, user.id):
+                # Update channel permissions
+                try:
+                    reason = f"Banned by channel owner {interaction.user}"
+                    pending = [
+                        self.bot.actions.set_permissions(channel, user, discord.PermissionOverwrite(connect=False), reason=reason)
+                    ]
+                    
+                    # Kick if currently in channel
+                    if user.voice and user.voice.channel == channel:
+                        pending.append(self.bot.actions.move_member(user, None, reason=reason))
+                    
+                    await asyncio.gather(*pending)
+                    
+                    await interaction.followup.send(f"✅ Banned {user.mention} from the channel.", ephemeral=True)
+                    self.logger.info("%s banned %s from %s", interaction.user, user, channel.name)
+                except discord.Forbidden:
+                    await interaction.followup.send("❌ I don't have permission to manage channel permissions.", ephemeral=True)
+            else:
+                await interaction.followup.send(
+                    f"❌ You can ban at most {self.owner_bans.limit} users. Use `/unban-user` to make room.",
+                    ephemeral=True
+                )
+
+    @app_commands.command(name="unban-user", description="Allow a banned user to join your voice channels again")
+    @app_commands.describe(user="User to unban")
+    async def unban_user(self, interaction: discord.Interaction, user: discord.User):
+        """Lift an owner's ban and reopen their current channel to the user"""
+        await interaction.response.defer()
+        
+        if not self.owner_bans.remove(interaction.guild.id, interaction.user.id, user.id):
+            await interaction.followup.send(f"❌ {user.mention} is not banned from your channels.", ephemeral=True)
             return
         
-        # Add to ban list
-        if channel.id not in self.channel_bans:
-            self.channel_bans[channel.id] = []
+        # Reopen the channel the owner is in right now; future rooms simply won't carry the ban
+        channel = interaction.user.voice.channel if interaction.user.voice else None
+        if channel is not None:
+            async with self.bot.channel_locks.hold(channel.id, "unban"):
+                if self.bot.temp_channels.is_owner(channel.id, interaction.user.id) and channel.overwrites_for(user).connect is False:
+                    try:
+                        await self.bot.actions.set_permissions(
+                            channel, user, None, reason=f"Unbanned by channel owner {interaction.user}"
+                        )
+                    except discord.Forbidden:
+                        await interaction.followup.send("❌ I don't have permission to manage channel permissions.", ephemeral=True)
+                        return
         
-        if user.id not in self.channel_bans[channel.id]:
-            self.channel_bans[channel.id].append(user.id)
-            
-            # Update channel permissions
-            try:
-                await channel.set_permissions(user, connect=False, reason=f"Banned by channel owner {interaction.user}")
-                
-                # Kick if currently in channel
-                if user.voice and user.voice.channel == channel:
-                    await user.move_to(None)
-                
-                await interaction.followup.send(f"✅ Banned {user.mention} from the channel.", ephemeral=True)
-                self.logger.info(f"{interaction.user} banned {user} from {channel.name}")
-            except discord.Forbidden:
-                await interaction.followup.send("❌ I don't have permission to manage channel permissions.", ephemeral=True)
-        else:
-            await interaction.followup.send(f"❌ {user.mention} is already banned from your channel.", ephemeral=True)
+        await interaction.followup.send(f"✅ Unbanned {user.mention} from your channels.", ephemeral=True)
+        self.logger.info("%s unbanned %s", interaction.user, user)
 
     @app_commands.command(name="mute-user", description="Server mute a user in your voice channel")
     @app_commands.describe(user="User to mute in the channel")
@@ -542,20 +1019,22 @@ class VoiceChannelCommands(commands.Cog):
             return
         
         channel = interaction.user.voice.channel
-        if channel.id not in self.bot.temp_channels or self.bot.temp_channels[channel.id] != interaction.user.id:
-            await interaction.followup.send("❌ You can only mute users in channels you created.", ephemeral=True)
-            return
-        
-        if user.voice and user.voice.channel == channel:
-            try:
-                await user.edit(mute=not user.voice.mute)
-                action = "unmuted" if user.voice.mute else "muted"
-                await interaction.followup.send(f"✅ {action.capitalize()} {user.mention} in the channel.", ephemeral=True)
-                self.logger.info(f"{interaction.user} {action} {user} in {channel.name}")
-            except discord.Forbidden:
-                await interaction.followup.send("❌ I don't have permission to mute members.", ephemeral=True)
-        else:
-            await interaction.followup.send(f"❌ {user.mention} is not in your channel.", ephemeral=True)
+        async with self.bot.channel_locks.hold(channel.id, "mute"):
+            if not self.bot.temp_channels.is_owner(channel.id, interaction.user.id):
+                await interaction.followup.send("❌ You can only mute users in channels you created.", ephemeral=True)
+                return
+            
+            if user.voice and user.voice.channel == channel:
+                try:
+                    mute = not user.voice.mute
+                    await self.bot.actions.edit_member(user, mute=mute)
+                    action = "muted" if mute else "unmuted"
+                    await interaction.followup.send(f"✅ {action.capitalize()} {user.mention} in the channel.", ephemeral=True)
+                    self.logger.info("%s %s %s in %s", interaction.user, action, user, channel.name)
+                except discord.Forbidden:
+                    await interaction.followup.send("❌ I don't have permission to mute members.", ephemeral=True)
+            else:
+                await interaction.followup.send(f"❌ {user.mention} is not in your channel.", ephemeral=True)
 
     @app_commands.command(name="transfer-owner", description="Transfer ownership of your voice channel")
     @app_commands.describe(user="User to transfer ownership to")
@@ -569,25 +1048,53 @@ class VoiceChannelCommands(commands.Cog):
             return
         
         channel = interaction.user.voice.channel
-        if channel.id not in self.bot.temp_channels or self.bot.temp_channels[channel.id] != interaction.user.id:
-            await interaction.followup.send("❌ You can only transfer ownership of channels you created.", ephemeral=True)
+        async with self.bot.channel_locks.hold(channel.id, "transfer"):
+            if not self.bot.temp_channels.is_owner(channel.id, interaction.user.id):
+                await interaction.followup.send("❌ You can only transfer ownership of channels you created.", ephemeral=True)
+                return
+            
+            if not (user.voice and user.voice.channel == channel):
+                await interaction.followup.send(f"❌ {user.mention} must be in the channel to receive ownership.", ephemeral=True)
+                return
+            
+            try:
+                # Update ownership tracking
+                self.bot.temp_channels.transfer(channel.id, user.id)
+                
+                # Update permissions, both changes are coalesced into one channel edit
+                await asyncio.gather(
+                    self.bot.actions.set_permissions(channel, interaction.user, None),  # Remove old owner perms
+                    self.bot.actions.set_permissions(channel, user, discord.PermissionOverwrite(
+                        connect=True, speak=True, manage_channels=True,
+                        move_members=True, mute_members=True, deafen_members=True,
+                        priority_speaker=True
+                    ))
+                )
+                
+                await interaction.followup.send(f"✅ Transferred channel ownership to {user.mention}.", ephemeral=True)
+                self.logger.info("%s transferred ownership of %s to %s", interaction.user, channel.name, user)
+            except discord.Forbidden:
+                await interaction.followup.send("❌ I don't have permission to manage channel permissions.", ephemeral=True)
+
+    @app_commands.command(name="reload-config", description="Reload the bot configuration without restarting (bot owner only)")
+    @app_commands.default_permissions(administrator=True)
+    async def reload_config(self, interaction: discord.Interaction):
+        """Reload the config file and environment and swap in the new settings"""
+        # The config is shared by every server, so only the bot owner may reload it
+        if not await self.bot.is_owner(interaction.user):
+            await interaction.response.send_message("❌ Only the bot owner can reload the configuration.", ephemeral=True)
             return
         
-        if not (user.voice and user.voice.channel == channel):
-            await interaction.followup.send(f"❌ {user.mention} must be in the channel to receive ownership.", ephemeral=True)
+        try:
+            applied, restart_required = self.bot.reload_config()
+        except (ValueError, OSError) as e:
+            self.logger.error("Config reload failed: %s", e)
+            await interaction.response.send_message(f"❌ Config not reloaded, the old settings stay active: {e}", ephemeral=True)
             return
         
-        try:
-            # Update ownership tracking
-            self.bot.temp_channels[channel.id] = user.id
-            
-            # Update permissions
-            await channel.set_permissions(interaction.user, overwrite=None)  # Remove old owner perms
-            await channel.set_permissions(user, connect=True, speak=True, manage_channels=True, 
-                                        move_members=True, mute_members=True, deafen_members=True, 
-                                        priority_speaker=True)
-            
-            await interaction.followup.send(f"✅ Transferred channel ownership to {user.mention}.", ephemeral=True)
-            self.logger.info(f"{interaction.user} transferred ownership of {channel.name} to {user}")
-        except discord.Forbidden:
-            await interaction.followup.send("❌ I don't have permission to manage channel permissions.", ephemeral=True)
+        message = f"✅ Reloaded configuration, {len(applied)} setting(s) changed"
+        if applied:
+            message += ": " + ", ".join(f"`{name}`" for name in applied)
+        if restart_required:
+            message += "\n⚠️ These only take effect after a restart: " + ", ".join(f"`{name}`" for name in restart_required)
+        await interaction.response.send_message(message, ephemeral=True)
@@ -1,39 +1,204 @@
 """
 Configuration settings for the Discord Voice Channel Bot
 """
+import dataclasses
+import json
 import os
-from dotenv import load_dotenv
+import tomllib
+from dataclasses import dataclass, field
+from dotenv import dotenv_values, load_dotenv
+
+# Environment as the process got it, before .env fills in the gaps
+_PROCESS_ENVIRON = dict(os.environ)
 
 # Load environment variables from .env file
 load_dotenv()
 
+def current_environ():
+    """Return the environment with the current .env read again, process variables still win"""
+    environ = {key: value for key, value in dotenv_values().items() if value is not None}
+    environ.update(_PROCESS_ENVIRON)
+    return environ
+
+def setting(default=None, env=None, guild=False, reload=True, factory=None):
+    """Declare a config field.
+
+    env: environment variable name when it differs from the field name
+    guild: the field can be overridden per guild ([guilds.<id>] in the config file)
+    reload: False when a change only takes effect after a restart
+    """
+    metadata = {"env": env, "guild": guild, "reload": reload}
+    if factory is not None:
+        return field(default_factory=factory, metadata=metadata)
+    return field(default=default, metadata=metadata)
+
+def _coerce(value, kind):
+    """Convert an environment string or config file value to a field's type"""
+    if value is None:
+        return None
+    if kind is tuple:
+        if isinstance(value, str):
+            value = [item.strip() for item in value.split(",") if item.strip()]
+        return tuple(value)
+    if kind is dict:
+        return json.loads(value) if isinstance(value, str) else dict(value)
+    if kind in (int, float):
+        return kind(value)
+    return str(value)  # str and str | None
+
+@dataclass(frozen=True)
 class BotConfig:
-    """Bot configuration class"""
-    
-    def __init__(self):
-        # Bot settings
-        self.BOT_TOKEN = os.getenv("DISCORD_BOT_TOKEN")
-        self.GUILD_ID = os.getenv("DISCORD_GUILD_ID")  # Optional: for guild-specific commands
-        
-        # Voice channel settings
-        self.DEFAULT_CHANNEL_NAME = os.getenv("DEFAULT_CHANNEL_NAME", "Temporary Channel")
-        self.MAX_CHANNEL_NAME_LENGTH = int(os.getenv("MAX_CHANNEL_NAME_LENGTH", "50"))
-        self.TEMP_CATEGORY_NAME = os.getenv("TEMP_CATEGORY_NAME", "Temporary Channels")
-        
-        # Permission settings
-        self.REQUIRED_PERMISSIONS = [
-            "manage_channels",
-            "connect",
-            "speak"
+    """Immutable snapshot of the bot configuration.
+
+    Built by load() from defaults, the optional TOML config file and the
+    environment (later sources win). A reload builds a new snapshot and the
+    bot swaps it in with one assignment, so readers never see a half-applied
+    config. for_guild() returns the snapshot with a guild's overrides applied.
+    """
+
+    # Bot settings
+    BOT_TOKEN: str | None = setting(env="DISCORD_BOT_TOKEN", reload=False)
+    GUILD_ID: str | None = setting(env="DISCORD_GUILD_ID", reload=False)  # Optional: for guild-specific commands
+    COMMAND_SYNC: str = setting("auto", reload=False)  # auto (on change), always or never
+
+    # Voice channel settings
+    DEFAULT_CHANNEL_NAME: str = setting("Temporary Channel", guild=True)
+    MAX_CHANNEL_NAME_LENGTH: int = setting(50, guild=True)
+    TEMP_CATEGORY_NAME: str = setting("Temporary Channels", guild=True)
+    PLATFORMS: tuple = setting(("PC", "Mobile", "Console", "Switch", "PlayStation", "Xbox"), guild=True)
+    EMPTY_CHANNEL_DELETE_DELAY: float = setting(10.0)
+    CLEANUP_CONCURRENCY: int = setting(5)  # Parallel deletes per sweep
+    OCCUPANCY_RECONCILE_INTERVAL: float = setting(1800.0)  # Seconds between occupancy re-reads
+    ACTION_QUEUE_CONCURRENCY: int = setting(10, reload=False)  # Parallel REST actions
+    BULK_ACTION_CONCURRENCY: int = setting(5)  # Parallel moves/mutes per bulk command
+    OWNER_BAN_LIMIT: int = setting(50)  # Bans each owner can keep
+
+    # Expiry policy settings (EXPIRY_POLICIES overrides them per guild and/or platform)
+    CHANNEL_MAX_LIFETIME: float = setting(0.0)  # Seconds, 0 = no limit
+    KEEP_WARM_AFTER: int = setting(2)  # Reuses before a channel is kept warm, 0 = off
+    KEEP_WARM_GRACE: float = setting(600.0)  # Grace for kept-warm channels
+    EXPIRY_POLICIES: dict = setting(factory=dict)  # {"<guild_id>:<platform>": {"grace": 60, ...}}
+
+    # Pre-warmed channel pool settings (pool size 0 disables the pool)
+    CHANNEL_POOL_SIZE: int = setting(0)  # Idle channels per guild and platform
+    CHANNEL_POOL_MAX_IDLE: float = setting(1800.0)  # Seconds without demand before a pool is drained
+    CHANNEL_POOL_REFILL_RATE: float = setting(0.5)  # Channels created per second
+
+    # Registry persistence settings
+    REGISTRY_BACKEND: str = setting("sqlite", reload=False)  # sqlite or memory
+    REGISTRY_PATH: str = setting("bot_state.db", reload=False)
+    REGISTRY_FLUSH_INTERVAL: float = setting(2.0, reload=False)
+
+    # Metrics endpoint settings (port 0 disables the endpoint)
+    METRICS_HOST: str = setting("127.0.0.1", reload=False)
+    METRICS_PORT: int = setting(0, reload=False)
+
+    # Gateway intents and caching ("lean" keeps only what the bot reads)
+    RUNTIME_PROFILE: str = setting("default", reload=False)  # default or lean
+
+    # Sharding settings
+    SHARD_MODE: str = setting("single", reload=False)  # single, auto or processes
+    SHARD_COUNT: int = setting(0, reload=False)  # 0 uses Discord's recommended count
+    WORKER_PROCESSES: int = setting(2, reload=False)  # Worker processes in processes mode
+
+    # Permission settings
+    REQUIRED_PERMISSIONS: tuple = setting(("manage_channels", "connect", "speak"))
+
+    # Logging settings
+    LOG_LEVEL: str = setting("INFO", reload=False)
+    LOG_FILE: str = setting("bot.log", reload=False)
+
+    # Per-guild overrides of the guild=True settings: {guild_id: {name: value}}
+    GUILDS: dict = setting(factory=dict)
+
+    _guild_configs: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Resolve every guild's snapshot up front so for_guild() is a dict lookup
+        guild_configs = {
+            guild_id: dataclasses.replace(self, GUILDS={}, **overrides)
+            for guild_id, overrides in self.GUILDS.items()
+        }
+        object.__setattr__(self, "_guild_configs", guild_configs)
+
+    @classmethod
+    def load(cls, path=None, environ=None):
+        """Build a snapshot from defaults, the config file (CONFIG_FILE, default config.toml) and the environment
+
+        environ: mapping to read instead of os.environ
+        """
+        environ = os.environ if environ is None else environ
+        path = path or environ.get("CONFIG_FILE", "config.toml")
+        data = {}
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                data = tomllib.load(f)
+
+        fields = {f.name: f for f in dataclasses.fields(cls) if f.init}
+        values = {}
+        guilds = data.pop("guilds", {})
+        for key, value in data.items():
+            name = key.upper()
+            if name not in fields or name == "GUILDS":
+                raise ValueError(f"Unknown setting in {path}: {key}")
+            values[name] = _coerce(value, fields[name].type)
+
+        for name, f in fields.items():
+            value = environ.get(f.metadata.get("env") or name)
+            if value is not None and name != "GUILDS":
+                values[name] = _coerce(value, f.type)
+
+        values["GUILDS"] = {}
+        for guild_id, overrides in guilds.items():
+            if not str(guild_id).isdigit():
+                raise ValueError(f"[guilds.{guild_id}] in {path} must be keyed by a server ID")
+            resolved = {}
+            for key, value in overrides.items():
+                name = key.upper()
+                if name not in fields or not fields[name].metadata.get("guild"):
+                    raise ValueError(f"{key} cannot be overridden per server ([guilds.{guild_id}] in {path})")
+                resolved[name] = _coerce(value, fields[name].type)
+            values["GUILDS"][int(guild_id)] = resolved
+
+        return cls(**values)
+
+    @classmethod
+    def reloadable(cls, name):
+        """Check whether a setting takes effect without a restart"""
+        return cls.__dataclass_fields__[name].metadata.get("reload", True)
+
+    def for_guild(self, guild_id):
+        """Return the snapshot with a guild's overrides applied"""
+        return self._guild_configs.get(guild_id, self)
+
+    def changed(self, other):
+        """Return the names of the settings that differ from another snapshot"""
+        return [
+            f.name for f in dataclasses.fields(self)
+            if f.compare and getattr(self, f.name) != getattr(other, f.name)
         ]
-        
-        # Logging settings
-        self.LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
-        self.LOG_FILE = os.getenv("LOG_FILE", "bot.log")
-    
+
     def validate_config(self):
         """Validate required configuration"""
         if not self.BOT_TOKEN:
             raise ValueError("DISCORD_BOT_TOKEN is required")
-        
+        if self.COMMAND_SYNC not in ("auto", "always", "never"):
+            raise ValueError("COMMAND_SYNC must be auto, always or never")
+        if self.RUNTIME_PROFILE not in ("default", "lean"):
+            raise ValueError("RUNTIME_PROFILE must be default or lean")
+        if self.SHARD_MODE not in ("single", "auto", "processes"):
+            raise ValueError("SHARD_MODE must be single, auto or processes")
+        for key, policy in self.EXPIRY_POLICIES.items():
+            if not isinstance(policy, dict) or not set(policy) <= {"grace", "max_lifetime", "keep_warm_after", "keep_warm_grace"}:
+                raise ValueError(f"EXPIRY_POLICIES[{key!r}] must only set grace, max_lifetime, keep_warm_after or keep_warm_grace")
+        for config in (self, *self._guild_configs.values()):
+            if not 1 <= config.MAX_CHANNEL_NAME_LENGTH <= 100:
+                raise ValueError("MAX_CHANNEL_NAME_LENGTH must be between 1 and 100")
+            if not 1 <= len(config.PLATFORMS) <= 25:
+                raise ValueError("PLATFORMS must list between 1 and 25 platforms")  # One select menu's worth
+            if not all(1 <= len(platform) <= 80 for platform in config.PLATFORMS):
+                raise ValueError("Platform names must be 1 to 80 characters")  # They are part of custom_ids
+            if not config.TEMP_CATEGORY_NAME or not config.DEFAULT_CHANNEL_NAME:
+                raise ValueError("TEMP_CATEGORY_NAME and DEFAULT_CHANNEL_NAME cannot be empty")
+
         return True
@@ -3,8 +3,10 @@ Main entry point for the Discord Voice Channel Bot
 """
 import asyncio
 import os
-from bot import VoiceChannelBot
+from bot import create_bot
+from config import BotConfig
 from utils.logger import setup_logger
+from utils.sharding import ShardSupervisor
 
 def main():
     """Main function to start the Discord bot"""
@@ -17,8 +19,27 @@ def main():
         logger.error("Please create a .env file with your bot token or set the environment variable.")
         return
     
+    try:
+        config = BotConfig.load()
+        config.validate_config()
+    except (ValueError, OSError) as e:
+        logger.error("Invalid configuration: %s", e)
+        return
+    
+    # Several worker processes, each running a range of shards
+    if config.SHARD_MODE == "processes":
+        try:
+            logger.info("Starting Discord Voice Channel Bot shard supervisor...")
+            asyncio.run(ShardSupervisor(bot_token, config, logger).run())
+        except Exception as e:
+            logger.error("Shard supervisor failed: %s", e)
+        return
+    
     # Create and run the bot
-    bot = VoiceChannelBot()
+    options = {}
+    if config.SHARD_MODE == "auto" and config.SHARD_COUNT:
+        options["shard_count"] = config.SHARD_COUNT
+    bot = create_bot(config.SHARD_MODE, **options)
     
     try:
         logger.info("Starting Discord Voice Channel Bot...")
@@ -0,0 +1,218 @@
+"""
+Tests for the coalescing REST action queue
+"""
+import asyncio
+
+import discord
+
+from utils.action_queue import ActionQueue
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class Target:
+    def __init__(self, id):
+        self.id = id
+
+
+class Guild:
+    def __init__(self, id=1):
+        self.id = id
+        self.channels = {}
+
+    def get_channel(self, channel_id):
+        return self.channels.get(channel_id)
+
+
+class Channel:
+    def __init__(self, guild, id, overwrites=None, latency=0.01):
+        self.guild = guild
+        self.id = id
+        self.overwrites = dict(overwrites or {})
+        self.latency = latency
+        self.edits = []
+        self.deleted = False
+        guild.channels[id] = self
+
+    async def edit(self, *, reason=None, **fields):
+        await asyncio.sleep(self.latency)
+        self.edits.append(fields)
+        if "overwrites" in fields:
+            self.overwrites = dict(fields["overwrites"])
+        return self
+
+    async def delete(self, *, reason=None):
+        await asyncio.sleep(self.latency)
+        self.deleted = True
+
+
+class Member:
+    in_flight = 0
+    peak = 0
+
+    def __init__(self, guild, id, latency=0.02):
+        self.guild = guild
+        self.id = id
+        self.latency = latency
+        self.edits = []
+
+    async def edit(self, *, reason=None, **fields):
+        Member.in_flight += 1
+        Member.peak = max(Member.peak, Member.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            self.edits.append(fields)
+        finally:
+            Member.in_flight -= 1
+
+
+def allow(**permissions):
+    return discord.PermissionOverwrite(**permissions)
+
+
+def test_queued_edits_coalesce_into_one_call():
+    async def main():
+        queue = ActionQueue()
+        channel = Channel(Guild(), 10)
+        first = queue.edit_channel(channel, name="a")
+        await asyncio.sleep(0)  # The worker picks it up, later submissions queue behind it
+        second = queue.edit_channel(channel, name="b")
+        third = queue.edit_channel(channel, user_limit=5)
+        await asyncio.gather(first, second, third)
+        return queue, channel
+
+    queue, channel = run(main())
+    assert channel.edits == [{"name": "a"}, {"name": "b", "user_limit": 5}]
+    assert queue.metrics["coalesced"] == 1
+
+
+def test_permission_changes_merge_with_cached_overwrites():
+    async def main():
+        queue = ActionQueue()
+        owner, guest, other = Target(1), Target(2), Target(3)
+        channel = Channel(Guild(), 10, overwrites={owner: allow(manage_channels=True), other: allow(connect=True)})
+        queue.edit_channel(channel, name="busy")
+        await asyncio.sleep(0)
+        queue.set_permissions(channel, guest, allow(connect=False))
+        queue.set_permissions(channel, other, None)  # Removes it
+        await queue.drain()
+        return channel, owner, guest
+
+    channel, owner, guest = run(main())
+    assert len(channel.edits) == 2
+    assert {target.id for target in channel.edits[-1]["overwrites"]} == {owner.id, guest.id}
+
+
+def test_explicit_overwrites_are_the_merge_base():
+    async def main():
+        queue = ActionQueue()
+        owner, other, stale = Target(1), Target(2), Target(3)
+        channel = Channel(Guild(), 10, overwrites={stale: allow(connect=True)})
+        queue.edit_channel(channel, name="busy")
+        await asyncio.sleep(0)
+        queue.edit_channel(channel, name="claimed", overwrites={owner: allow(manage_channels=True)})
+        queue.set_permissions(channel, other, allow(connect=False))
+        await queue.drain()
+        return channel, owner, other
+
+    channel, owner, other = run(main())
+    sent = channel.edits[-1]
+    assert sent["name"] == "claimed"
+    assert {target.id for target in sent["overwrites"]} == {owner.id, other.id}
+
+
+def test_replacing_overwrites_drops_earlier_permission_changes():
+    async def main():
+        queue = ActionQueue()
+        owner, guest = Target(1), Target(2)
+        channel = Channel(Guild(), 10)
+        queue.edit_channel(channel, name="busy")
+        await asyncio.sleep(0)
+        queue.set_permissions(channel, guest, allow(connect=False))
+        queue.edit_channel(channel, overwrites={owner: allow(manage_channels=True)})
+        await queue.drain()
+        return channel, owner
+
+    channel, owner = run(main())
+    assert list(channel.edits[-1]["overwrites"]) == [owner]
+
+
+def test_delete_drops_pending_edits():
+    async def main():
+        queue = ActionQueue()
+        channel = Channel(Guild(), 10)
+        running = queue.edit_channel(channel, name="a")
+        await asyncio.sleep(0)
+        dropped = queue.edit_channel(channel, name="b")
+        deleted = queue.delete_channel(channel)
+        after = queue.edit_channel(channel, name="c")
+        results = await asyncio.gather(running, dropped, deleted, after)
+        return queue, channel, results
+
+    queue, channel, results = run(main())
+    assert channel.edits == [{"name": "a"}]
+    assert channel.deleted
+    assert results[1] is None and results[3] is None
+    assert queue.metrics["dropped"] == 2
+
+
+def test_member_edits_merge_per_member():
+    async def main():
+        queue = ActionQueue()
+        guild = Guild()
+        alice, bob = Member(guild, 1), Member(guild, 2)
+        queue.edit_member(alice, mute=True)
+        await asyncio.sleep(0)
+        queue.edit_member(alice, deafen=True)
+        queue.edit_member(bob, mute=True)
+        queue.move_member(alice, None)
+        await queue.drain()
+        return alice, bob
+
+    alice, bob = run(main())
+    assert alice.edits == [{"mute": True}, {"deafen": True, "voice_channel": None}]
+    assert bob.edits == [{"mute": True}]
+
+
+def test_member_edits_overlap_up_to_the_guild_cap():
+    async def main():
+        Member.peak = 0
+        queue = ActionQueue(concurrency=50, guild_member_concurrency=3)
+        guild, other_guild = Guild(1), Guild(2)
+        members = [Member(guild, index) for index in range(12)]
+        await asyncio.gather(*(queue.edit_member(member, mute=True) for member in members))
+        one_guild = Member.peak
+
+        Member.peak = 0
+        members += [Member(other_guild, 100 + index) for index in range(12)]
+        await asyncio.gather(*(queue.edit_member(member, mute=False) for member in members))
+        return one_guild, Member.peak
+
+    one_guild, two_guilds = run(main())
+    assert one_guild == 3
+    assert two_guilds == 6
+
+
+def test_failures_reach_every_merged_caller():
+    async def main():
+        queue = ActionQueue()
+        channel = Channel(Guild(), 10)
+
+        async def fail(**fields):
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        queue.edit_channel(channel, name="a")
+        await asyncio.sleep(0)
+        channel.edit = fail
+        results = await asyncio.gather(
+            queue.edit_channel(channel, name="b"), queue.edit_channel(channel, name="c"), return_exceptions=True
+        )
+        await queue.drain()
+        return queue, results
+
+    queue, results = run(main())
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert queue.metrics["failed"] == 1
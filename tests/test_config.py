@@ -0,0 +1,128 @@
+"""
+Tests for config loading, per-guild overrides and reloading
+"""
+import dataclasses
+
+import pytest
+
+import config as config_module
+from config import BotConfig
+
+
+def write_config(tmp_path, text):
+    path = tmp_path / "config.toml"
+    path.write_text(text)
+    return str(path)
+
+
+def test_defaults_without_file_or_environment(tmp_path):
+    config = BotConfig.load(path=str(tmp_path / "missing.toml"), environ={})
+    assert config.EMPTY_CHANNEL_DELETE_DELAY == 10.0
+    assert config.PLATFORMS[0] == "PC"
+
+
+def test_file_then_environment(tmp_path):
+    path = write_config(tmp_path, 'empty_channel_delete_delay = 30\nplatforms = ["PC", "VR"]\nkeep_warm_after = 4\n')
+    config = BotConfig.load(path=path, environ={
+        "KEEP_WARM_AFTER": "6",
+        "EXPIRY_POLICIES": '{"PC": {"grace": 5}}',
+        "DISCORD_BOT_TOKEN": "token",
+    })
+
+    assert config.EMPTY_CHANNEL_DELETE_DELAY == 30.0
+    assert config.PLATFORMS == ("PC", "VR")
+    assert config.KEEP_WARM_AFTER == 6  # The environment wins over the file
+    assert config.EXPIRY_POLICIES == {"PC": {"grace": 5}}
+    assert config.BOT_TOKEN == "token"
+
+
+def test_config_file_from_environment(tmp_path):
+    path = write_config(tmp_path, "owner_ban_limit = 7\n")
+    assert BotConfig.load(environ={"CONFIG_FILE": path}).OWNER_BAN_LIMIT == 7
+
+
+def test_guild_overrides(tmp_path):
+    path = write_config(tmp_path, (
+        'temp_category_name = "Rooms"\n'
+        "[guilds.123]\n"
+        'platforms = "PC, Console"\n'
+        "max_channel_name_length = 20\n"
+    ))
+    config = BotConfig.load(path=path, environ={})
+
+    guild = config.for_guild(123)
+    assert guild.PLATFORMS == ("PC", "Console")
+    assert guild.MAX_CHANNEL_NAME_LENGTH == 20
+    assert guild.TEMP_CATEGORY_NAME == "Rooms"
+    assert config.for_guild(456) is config
+    assert config.PLATFORMS != guild.PLATFORMS
+
+
+@pytest.mark.parametrize("text, message", [
+    ("no_such_setting = 1\n", "Unknown setting"),
+    ("[guilds.123]\nlog_level = \"DEBUG\"\n", "cannot be overridden per server"),
+    ("[guilds.main]\nplatforms = [\"PC\"]\n", "server ID"),
+])
+def test_invalid_files_are_rejected(tmp_path, text, message):
+    with pytest.raises(ValueError, match=message):
+        BotConfig.load(path=write_config(tmp_path, text), environ={})
+
+
+@pytest.mark.parametrize("changes, message", [
+    ({"BOT_TOKEN": None}, "DISCORD_BOT_TOKEN"),
+    ({"SHARD_MODE": "many"}, "SHARD_MODE"),
+    ({"MAX_CHANNEL_NAME_LENGTH": 0}, "MAX_CHANNEL_NAME_LENGTH"),
+    ({"PLATFORMS": ()}, "PLATFORMS"),
+    ({"PLATFORMS": ("x" * 81,)}, "Platform names"),
+    ({"EXPIRY_POLICIES": {"PC": {"ttl": 1}}}, "EXPIRY_POLICIES"),
+    ({"GUILDS": {1: {"MAX_CHANNEL_NAME_LENGTH": 200}}}, "MAX_CHANNEL_NAME_LENGTH"),
+])
+def test_validation(changes, message):
+    config = dataclasses.replace(BotConfig(BOT_TOKEN="token"), **changes)
+    with pytest.raises(ValueError, match=message):
+        config.validate_config()
+
+
+def test_snapshot_is_frozen_and_diffable():
+    config = BotConfig(BOT_TOKEN="token")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.KEEP_WARM_AFTER = 3
+
+    other = dataclasses.replace(config, KEEP_WARM_AFTER=3, SHARD_MODE="auto")
+    assert sorted(config.changed(other)) == ["KEEP_WARM_AFTER", "SHARD_MODE"]
+    assert BotConfig.reloadable("KEEP_WARM_AFTER")
+    assert not BotConfig.reloadable("SHARD_MODE")
+
+
+def test_process_environment_wins_over_dotenv(monkeypatch):
+    monkeypatch.setattr(config_module, "_PROCESS_ENVIRON", {"EMPTY_CHANNEL_DELETE_DELAY": "30"})
+    monkeypatch.setattr(config_module, "dotenv_values", lambda: {
+        "EMPTY_CHANNEL_DELETE_DELAY": "99", "KEEP_WARM_GRACE": "7", "EMPTY": None,
+    })
+
+    environ = config_module.current_environ()
+    assert environ == {"EMPTY_CHANNEL_DELETE_DELAY": "30", "KEEP_WARM_GRACE": "7"}
+
+
+def test_reload_applies_settings_and_keeps_startup_only_ones(tmp_path, monkeypatch):
+    import bot as bot_module
+
+    path = write_config(tmp_path, "empty_channel_delete_delay = 20\n")
+    environ = {"CONFIG_FILE": path, "DISCORD_BOT_TOKEN": "token", "REGISTRY_BACKEND": "memory"}
+    for name, value in environ.items():
+        monkeypatch.setenv(name, value)
+    monkeypatch.setattr(bot_module, "current_environ", lambda: dict(environ))
+    bot = bot_module.VoiceChannelBot()
+    assert bot.deletion_scheduler.delay == 20
+
+    write_config(tmp_path, 'empty_channel_delete_delay = 45\nshard_mode = "auto"\n')
+    applied, restart_required = bot.reload_config()
+    assert applied == ["EMPTY_CHANNEL_DELETE_DELAY"]
+    assert restart_required == ["SHARD_MODE"]
+    assert bot.config.SHARD_MODE == "single"
+    assert bot.deletion_scheduler.delay == 45
+
+    write_config(tmp_path, "max_channel_name_length = 500\n")
+    with pytest.raises(ValueError):
+        bot.reload_config()
+    assert bot.config.EMPTY_CHANNEL_DELETE_DELAY == 45
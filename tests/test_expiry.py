@@ -0,0 +1,73 @@
+"""
+Tests for expiry policy resolution and keep-warm
+"""
+import datetime
+
+from utils.expiry import ExpiryPolicies, ExpiryPolicy
+from utils.registry import TempChannel
+
+NOW = datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def record(channel_id=1, guild_id=10, platform="PC", age=0):
+    return TempChannel(
+        channel_id, guild_id, 100, platform, 1, tracked_at=NOW - datetime.timedelta(seconds=age)
+    )
+
+
+def test_most_specific_override_wins():
+    policies = ExpiryPolicies(ExpiryPolicy(grace=10), {
+        "PC": {"grace": 20, "max_lifetime": 500},
+        "10": {"grace": 30},
+        "10:PC": {"keep_warm_after": 2},
+    })
+
+    policy = policies.policy_for(10, "PC")
+    assert (policy.grace, policy.max_lifetime, policy.keep_warm_after) == (30, 500, 2)
+    assert policies.policy_for(11, "PC").grace == 20
+    assert policies.policy_for(10, "Mobile").grace == 30
+    assert policies.policy_for(11, "Mobile").grace == 10
+
+
+def test_keep_warm_after_enough_reuses():
+    policies = ExpiryPolicies(ExpiryPolicy(grace=10, keep_warm_after=2, keep_warm_grace=600))
+    channel = record()
+
+    policies.note_reuse(1)
+    assert policies.grace_for(channel, NOW) == 10
+    policies.note_reuse(1)
+    assert policies.is_warm(channel)
+    assert policies.grace_for(channel, NOW) == 600
+
+
+def test_lifetime_caps_grace_from_tracked_at():
+    policies = ExpiryPolicies(ExpiryPolicy(grace=300, max_lifetime=1000))
+
+    assert policies.grace_for(record(age=0), NOW) == 300
+    assert policies.grace_for(record(age=900), NOW) == 100
+    assert policies.grace_for(record(age=5000), NOW) == 0
+
+
+def test_metrics_count_channels_not_lookups():
+    policies = ExpiryPolicies(ExpiryPolicy(grace=10, max_lifetime=100, keep_warm_after=1, keep_warm_grace=60))
+    channel = record(age=70)
+    policies.note_reuse(1)
+
+    for _ in range(5):
+        policies.grace_for(channel, NOW)
+    assert (policies.metrics["kept_warm"], policies.metrics["expired"]) == (1, 1)
+
+    policies.forget(1)
+    policies.note_reuse(1)
+    policies.grace_for(channel, NOW)
+    assert policies.metrics["kept_warm"] == 2
+
+
+def test_configure_clears_resolved_policies_but_keeps_reuses():
+    policies = ExpiryPolicies(ExpiryPolicy(grace=10))
+    policies.policy_for(10, "PC")
+    policies.note_reuse(1)
+
+    policies.configure(ExpiryPolicy(grace=45))
+    assert policies.policy_for(10, "PC").grace == 45
+    assert policies.reuses(1) == 1
@@ -0,0 +1,74 @@
+"""
+Tests for the indexed temporary channel registry
+"""
+from utils.registry import ChannelRegistry
+from utils.storage import MemoryBackend, WriteBehindStore
+
+
+def test_add_indexes_by_owner_and_guild():
+    registry = ChannelRegistry()
+    registry.add(1, guild_id=10, owner_id=100)
+    registry.add(2, guild_id=10, owner_id=100, platform="PC", room_number=1)
+    registry.add(3, guild_id=20, owner_id=200)
+
+    assert len(registry) == 3
+    assert registry.channels_of(100) == {1, 2}
+    assert set(registry.channels_in(10)) == {1, 2}
+    assert registry.guild_count(20) == 1
+    assert registry.is_owner(2, 100) and not registry.is_owner(2, 200)
+    assert registry.get(2).tracked_at is not None
+
+
+def test_add_existing_channel_transfers_it():
+    registry = ChannelRegistry()
+    first = registry.add(1, guild_id=10, owner_id=100)
+    again = registry.add(1, guild_id=10, owner_id=200)
+
+    assert again is first
+    assert registry.owner_of(1) == 200
+    assert registry.channels_of(100) == frozenset()
+    assert registry.channels_of(200) == {1}
+
+
+def test_transfer_moves_owner_index():
+    registry = ChannelRegistry()
+    registry.add(1, guild_id=10, owner_id=100)
+    registry.add(2, guild_id=10, owner_id=100)
+
+    assert registry.transfer(1, 200).owner_id == 200
+    assert registry.channels_of(100) == {2}
+    assert registry.channels_of(200) == {1}
+    assert registry.transfer(99, 200) is None
+
+
+def test_remove_drops_empty_index_entries():
+    registry = ChannelRegistry()
+    registry.add(1, guild_id=10, owner_id=100)
+
+    record = registry.remove(1)
+    assert record.channel_id == 1
+    assert 1 not in registry
+    assert registry.channels_of(100) == frozenset()
+    assert registry.channels_in(10) == {}
+    assert registry._by_owner == {} and registry._by_guild == {}
+    assert registry.remove(1) is None
+
+
+def test_persisted_records_round_trip():
+    store = WriteBehindStore(MemoryBackend())
+    registry = ChannelRegistry(store)
+    registry.add(1, guild_id=10, owner_id=100, platform="PC", room_number=3)
+    registry.add(2, guild_id=10, owner_id=100)
+    registry.transfer(2, 200)
+    registry.add(3, guild_id=10, owner_id=100)
+    registry.remove(3)
+
+    stored = {key: value for (namespace, key), value in store._pending.items() if value is not None}
+    assert set(stored) == {"1", "2"}
+
+    restored = ChannelRegistry()
+    restored.load(stored)
+    assert restored.owner_of(2) == 200
+    assert (restored.get(1).platform, restored.get(1).room_number) == ("PC", 3)
+    assert restored.get(1).tracked_at == registry.get(1).tracked_at
+    assert restored.channels_of(100) == {1}
@@ -0,0 +1,66 @@
+"""
+Tests for per-guild, per-platform room number allocation
+"""
+from utils.registry import TempChannel
+from utils.rooms import RoomAllocator
+
+
+def test_numbers_are_per_guild_and_platform():
+    rooms = RoomAllocator()
+    assert [rooms.allocate(1, "PC") for _ in range(3)] == [1, 2, 3]
+    assert rooms.allocate(1, "Mobile") == 1
+    assert rooms.allocate(2, "PC") == 1
+
+
+def test_lowest_released_number_is_reused_first():
+    rooms = RoomAllocator()
+    for _ in range(5):
+        rooms.allocate(1, "PC")
+    rooms.release(1, "PC", 4)
+    rooms.release(1, "PC", 2)
+
+    assert rooms.allocate(1, "PC") == 2
+    assert rooms.allocate(1, "PC") == 4
+    assert rooms.allocate(1, "PC") == 6
+    assert rooms.metrics["reused"] == 2
+
+
+def test_releasing_every_room_restarts_at_one():
+    rooms = RoomAllocator()
+    first, second = rooms.allocate(1, "PC"), rooms.allocate(1, "PC")
+    rooms.release(1, "PC", first)
+    rooms.release(1, "PC", second)
+
+    assert rooms.stats()["keys"] == 0
+    assert rooms.allocate(1, "PC") == 1
+
+
+def test_release_ignores_unknown_numbers():
+    rooms = RoomAllocator()
+    rooms.allocate(1, "PC")
+    assert rooms.release(1, "PC", 7) is False
+    assert rooms.release(2, "PC", 1) is False
+    assert rooms.metrics["released"] == 0
+
+
+def test_claim_frees_skipped_numbers():
+    rooms = RoomAllocator()
+    assert rooms.claim(1, "PC", 4) is True
+    assert rooms.claim(1, "PC", 4) is False
+    assert rooms.claim(1, "PC", 0) is False
+    assert rooms.claim(1, "PC", 2) is True
+
+    assert [rooms.allocate(1, "PC") for _ in range(3)] == [1, 3, 5]
+
+
+def test_load_rebuilds_from_registry_records():
+    rooms = RoomAllocator()
+    rooms.load([
+        TempChannel(10, 1, 100, "PC", 3),
+        TempChannel(11, 1, 100, "PC", 1),
+        TempChannel(12, 1, 100),  # Not a gaming room
+    ])
+
+    assert rooms.in_use(1, "PC") == [1, 3]
+    assert rooms.allocate(1, "PC") == 2
+    assert rooms.allocate(1, "PC") == 4
@@ -0,0 +1,112 @@
+"""
+Tests for the heap-based deletion scheduler
+"""
+import asyncio
+
+from utils.scheduler import DeletionScheduler
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def make_scheduler(delay=0.05):
+    fired = []
+
+    async def callback(channel_id):
+        fired.append(channel_id)
+
+    return DeletionScheduler(callback, delay=delay), fired
+
+
+def test_fires_in_deadline_order():
+    async def main():
+        scheduler, fired = make_scheduler()
+        scheduler.schedule(1, 0.06)
+        scheduler.schedule(2, 0.02)
+        scheduler.schedule(3, 0.04)
+        await asyncio.sleep(0.1)
+        return scheduler, fired
+
+    scheduler, fired = run(main())
+    assert fired == [2, 3, 1]
+    assert len(scheduler) == 0
+    assert scheduler.stats()["fired"] == 3
+
+
+def test_rearm_replaces_the_deadline():
+    async def main():
+        scheduler, fired = make_scheduler()
+        scheduler.schedule(1, 0.02)
+        scheduler.schedule(1, 0.08)  # Debounced: pushed back, not fired twice
+        await asyncio.sleep(0.05)
+        early = list(fired)
+        await asyncio.sleep(0.06)
+        return scheduler, early, fired
+
+    scheduler, early, fired = run(main())
+    assert early == []
+    assert fired == [1]
+    assert scheduler.metrics["rearmed"] == 1
+
+
+def test_cancel_stops_the_deletion():
+    async def main():
+        scheduler, fired = make_scheduler()
+        scheduler.schedule(1, 0.02)
+        scheduler.schedule(2, 0.03)
+        assert scheduler.cancel(1) is True
+        assert scheduler.cancel(1) is False
+        await asyncio.sleep(0.06)
+        return fired
+
+    assert run(main()) == [2]
+
+
+def test_cancel_all_clears_timer_and_heap():
+    async def main():
+        scheduler, fired = make_scheduler()
+        for channel_id in range(5):
+            scheduler.schedule(channel_id)
+        scheduler.cancel_all()
+        await asyncio.sleep(0.08)
+        return scheduler, fired
+
+    scheduler, fired = run(main())
+    assert fired == []
+    assert scheduler._timer is None
+    assert scheduler.stats()["heap"] == 0
+
+
+def test_stale_entries_are_compacted():
+    async def main():
+        scheduler, _ = make_scheduler(delay=10)
+        for channel_id in range(200):
+            scheduler.schedule(channel_id)
+        for channel_id in range(190):
+            scheduler.cancel(channel_id)
+        stats = scheduler.stats()
+        scheduler.cancel_all()
+        return stats
+
+    stats = run(main())
+    assert stats["pending"] == 10
+    assert stats["compactions"] >= 1
+    assert stats["heap"] <= 2 * stats["pending"] + 64
+
+
+def test_one_timer_for_many_deadlines():
+    async def main():
+        scheduler, _ = make_scheduler(delay=10)
+        loop = asyncio.get_running_loop()
+        before = len(loop._scheduled)
+        for channel_id in range(1000):
+            scheduler.schedule(channel_id, 10 + channel_id)
+        timers = len(loop._scheduled) - before
+        pending = scheduler.pending()
+        scheduler.cancel_all()
+        return timers, pending
+
+    timers, pending = run(main())
+    assert timers == 1
+    assert len(pending) == 1000 and min(pending.values()) > 9
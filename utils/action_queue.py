@@ -0,0 +1,245 @@
+"""
+Coalescing queue for channel and member REST actions
+"""
+import asyncio
+import collections
+import logging
+import time
+
+
+class _Action:
+    """A pending REST action, possibly merged from several submissions"""
+
+    __slots__ = ("kind", "target", "fields", "overwrites", "reason", "futures", "enqueued_at")
+
+    def __init__(self, kind, target, reason):
+        self.kind = kind  # "edit_channel", "delete_channel" or "edit_member"
+        self.target = target
+        self.fields = {}
+        self.overwrites = {}  # {target_id: (target, PermissionOverwrite or None)}
+        self.reason = reason
+        self.futures = []
+        self.enqueued_at = time.perf_counter()
+
+
+class ActionQueue:
+    """Serializes REST actions per route bucket and coalesces redundant ones.
+
+    Actions on the same channel (or member) share a bucket and run in order,
+    mirroring Discord's per-route rate limits, while different buckets run
+    concurrently up to a global limit. Member edits share one rate limit per
+    guild, so at most guild_member_concurrency of them run at once in a guild.
+    Submissions that arrive while an earlier action for the same target is
+    still queued are merged into it:
+    several permission changes become one channel.edit(overwrites=...), a
+    move and a mute become one member.edit(), and a delete drops any edits
+    that have not started yet.
+
+    Every submit method returns a future resolving to the REST call's result,
+    or None when the action was made unnecessary by a later delete.
+    """
+
+    def __init__(self, concurrency=10, guild_member_concurrency=5, logger=None, metrics=None):
+        self.logger = logger or logging.getLogger(__name__)
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self.guild_member_concurrency = guild_member_concurrency
+        self._guild_semaphores = {}  # {guild_id: Semaphore} for member edits
+        self._buckets = {}  # {bucket_key: deque of pending _Action}
+        self._workers = {}  # {bucket_key: worker Task}
+        self.metrics = {
+            "submitted": 0,
+            "coalesced": 0,
+            "dropped": 0,
+            "executed": 0,
+            "failed": 0,
+        }
+        self.latency = {"count": 0, "total": 0.0, "max": 0.0}
+        self._rest_duration = None
+        self._queue_latency = None
+        if metrics is not None:
+            self._rest_duration = metrics.histogram(
+                "vcb_rest_request_duration_seconds", "Duration of REST calls", ("action",)
+            )
+            self._queue_latency = metrics.histogram(
+                "vcb_action_queue_latency_seconds", "Time from submission to completion of queued actions"
+            )
+
+    @property
+    def depth(self):
+        """Number of actions waiting to run"""
+        return sum(len(actions) for actions in self._buckets.values())
+
+    def stats(self):
+        """Return a snapshot of queue metrics"""
+        count = self.latency["count"]
+        return {
+            **self.metrics,
+            "depth": self.depth,
+            "buckets": len(self._buckets),
+            "latency_avg": self.latency["total"] / count if count else 0.0,
+            "latency_max": self.latency["max"],
+        }
+
+    def edit_channel(self, channel, *, reason=None, **fields):
+        """Queue a channel.edit() call"""
+        action, future = self._submit_edit(("channel", channel.id), "edit_channel", channel, reason)
+        if action is not None:
+            if "overwrites" in fields:
+                action.overwrites.clear()  # Replaced wholesale, earlier permission changes are moot
+            action.fields.update(fields)
+        return future
+
+    def set_permissions(self, channel, target, overwrite, *, reason=None):
+        """Queue a permission overwrite for a member or role (None removes it)"""
+        action, future = self._submit_edit(("channel", channel.id), "edit_channel", channel, reason)
+        if action is not None:
+            action.overwrites[target.id] = (target, overwrite)
+        return future
+
+    def delete_channel(self, channel, *, reason=None):
+        """Queue a channel deletion, dropping any edits still waiting for it"""
+        key = ("channel", channel.id)
+        future = self._new_future()
+        pending = self._buckets.setdefault(key, collections.deque())
+
+        for action in pending:
+            if action.kind == "delete_channel":
+                action.futures.append(future)
+                self.metrics["submitted"] += 1
+                self.metrics["coalesced"] += 1
+                return future
+
+        # Queued edits are pointless once the channel is gone
+        while pending:
+            dropped = pending.pop()
+            self.metrics["dropped"] += 1
+            for dropped_future in dropped.futures:
+                if not dropped_future.done():
+                    dropped_future.set_result(None)
+
+        action = _Action("delete_channel", channel, reason)
+        action.futures.append(future)
+        self._enqueue(key, action)
+        return future
+
+    def edit_member(self, member, *, reason=None, **fields):
+        """Queue a member.edit() call (mute, deafen, voice_channel, ...)"""
+        action, future = self._submit_edit(("member", member.guild.id, member.id), "edit_member", member, reason)
+        if action is not None:
+            action.fields.update(fields)
+        return future
+
+    def move_member(self, member, channel, *, reason=None):
+        """Queue a voice move, None disconnects the member"""
+        return self.edit_member(member, voice_channel=channel, reason=reason)
+
+    async def drain(self):
+        """Wait until every queued action has run"""
+        while self._workers:
+            await asyncio.gather(*self._workers.values(), return_exceptions=True)
+
+    def _new_future(self):
+        return asyncio.get_running_loop().create_future()
+
+    def _submit_edit(self, key, kind, target, reason):
+        """Return the (action, future) to merge an edit into, action is None if moot"""
+        future = self._new_future()
+        pending = self._buckets.get(key)
+        last = pending[-1] if pending else None
+
+        if last is not None and last.kind == "delete_channel":
+            # The channel is about to be deleted, nothing to edit
+            self.metrics["submitted"] += 1
+            self.metrics["dropped"] += 1
+            future.set_result(None)
+            return None, future
+
+        if last is not None and last.kind == kind:
+            last.futures.append(future)
+            if reason and not last.reason:
+                last.reason = reason
+            self.metrics["submitted"] += 1
+            self.metrics["coalesced"] += 1
+            return last, future
+
+        action = _Action(kind, target, reason)
+        action.futures.append(future)
+        self._enqueue(key, action)
+        return action, future
+
+    def _guild_semaphore(self, guild_id):
+        semaphore = self._guild_semaphores.get(guild_id)
+        if semaphore is None:
+            semaphore = self._guild_semaphores[guild_id] = asyncio.Semaphore(self.guild_member_concurrency)
+        return semaphore
+
+    def _enqueue(self, key, action):
+        self._buckets.setdefault(key, collections.deque()).append(action)
+        self.metrics["submitted"] += 1
+        if key not in self._workers:
+            self._workers[key] = asyncio.create_task(self._work(key))
+
+    async def _work(self, key):
+        try:
+            pending = self._buckets.get(key)
+            while pending:
+                # Once popped the action can no longer absorb new submissions
+                action = pending.popleft()
+                if key[0] == "member":
+                    async with self._guild_semaphore(key[1]), self._semaphore:
+                        await self._execute(action)
+                else:
+                    async with self._semaphore:
+                        await self._execute(action)
+        finally:
+            self._workers.pop(key, None)
+            if not self._buckets.get(key):
+                self._buckets.pop(key, None)
+
+    async def _execute(self, action):
+        started = time.perf_counter()
+        try:
+            result = await self._call(action)
+        except Exception as e:
+            self.metrics["failed"] += 1
+            self.logger.debug("Queued %s failed: %s", action.kind, e)
+            for future in action.futures:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            self.metrics["executed"] += 1
+            for future in action.futures:
+                if not future.done():
+                    future.set_result(result)
+
+        finished = time.perf_counter()
+        elapsed = finished - action.enqueued_at
+        self.latency["count"] += 1
+        self.latency["total"] += elapsed
+        self.latency["max"] = max(self.latency["max"], elapsed)
+        if self._rest_duration is not None:
+            self._rest_duration.labels(action.kind).observe(finished - started)
+            self._queue_latency.observe(elapsed)
+
+    async def _call(self, action):
+        target = action.target
+        if action.kind == "delete_channel":
+            return await target.delete(reason=action.reason)
+
+        if action.kind == "edit_member":
+            return await target.edit(reason=action.reason, **action.fields)
+
+        fields = dict(action.fields)
+        if action.overwrites:
+            base = fields.get("overwrites")
+            if base is None:
+                # Use the freshest cached copy so concurrent changes are not lost
+                base = (target.guild.get_channel(target.id) or target).overwrites
+            merged = {key.id: (key, value) for key, value in base.items()}
+            for target_id, (overwrite_target, overwrite) in action.overwrites.items():
+                if overwrite is None:
+                    merged.pop(target_id, None)
+                else:
+                    merged[target_id] = (overwrite_target, overwrite)
+            fields["overwrites"] = dict(merged.values())
+        return await target.edit(reason=action.reason, **fields)
@@ -0,0 +1,76 @@
+"""
+Owner-scoped ban lists for temporary channels
+"""
+import discord
+
+
+class OwnerBanList:
+    """Persistent sets of users each channel owner has banned, per guild.
+
+    Bans belong to the owner rather than to a channel, so they carry over
+    to every room the owner creates later and are folded into the
+    overwrites of the create call instead of being applied one by one.
+    """
+
+    NAMESPACE = "owner_bans"
+
+    def __init__(self, store=None, limit=50):
+        self.store = store
+        self.limit = limit  # Keeps overwrites well within Discord's per-channel cap
+        self._bans = {}  # {(guild_id, owner_id): {user_id}}
+
+    def __len__(self):
+        return sum(len(user_ids) for user_ids in self._bans.values())
+
+    def banned_by(self, guild_id, owner_id):
+        """Return the set of users an owner has banned (a live view, do not modify)"""
+        return self._bans.get((guild_id, owner_id), frozenset())
+
+    def is_banned(self, guild_id, owner_id, user_id):
+        return user_id in self._bans.get((guild_id, owner_id), ())
+
+    def add(self, guild_id, owner_id, user_id):
+        """Ban a user, returns False if the owner's list is full"""
+        user_ids = self._bans.setdefault((guild_id, owner_id), set())
+        if user_id not in user_ids:
+            if len(user_ids) >= self.limit:
+                return False
+            user_ids.add(user_id)
+            self._persist(guild_id, owner_id)
+        return True
+
+    def remove(self, guild_id, owner_id, user_id):
+        """Lift a ban, returns True if the user was banned"""
+        key = (guild_id, owner_id)
+        user_ids = self._bans.get(key)
+        if not user_ids or user_id not in user_ids:
+            return False
+        user_ids.discard(user_id)
+        if not user_ids:
+            del self._bans[key]
+        self._persist(guild_id, owner_id)
+        return True
+
+    def overwrites(self, guild_id, owner_id):
+        """Return {target: PermissionOverwrite} denying connect to everyone the owner banned"""
+        return {
+            discord.Object(id=user_id, type=discord.Member): discord.PermissionOverwrite(connect=False)
+            for user_id in self._bans.get((guild_id, owner_id), ())
+        }
+
+    def load(self, stored_bans):
+        """Restore from stored {"<guild_id>:<owner_id>": [user_ids]} data"""
+        for key, user_ids in stored_bans.items():
+            guild_id, owner_id = (int(part) for part in key.split(":"))
+            if user_ids:
+                self._bans.setdefault((guild_id, owner_id), set()).update(user_ids)
+
+    def _persist(self, guild_id, owner_id):
+        if self.store is None:
+            return
+        user_ids = self._bans.get((guild_id, owner_id))
+        key = f"{guild_id}:{owner_id}"
+        if user_ids:
+            self.store.put(self.NAMESPACE, key, sorted(user_ids))
+        else:
+            self.store.delete(self.NAMESPACE, key)
@@ -0,0 +1,88 @@
+"""
+Category resolution cache for bot-managed channel categories
+"""
+import asyncio
+import logging
+import time
+
+import discord
+
+
+class CategoryCache:
+    """Per-guild cache of bot-managed categories with single-flight creation.
+
+    Entries are keyed by (guild_id, key), where key is the platform name for
+    gaming categories. Concurrent lookups for a missing category share one
+    lock, so only the first one creates it and the rest reuse the result.
+    """
+
+    def __init__(self, logger=None, rest_duration=None):
+        self.logger = logger or logging.getLogger(__name__)
+        self.rest_duration = rest_duration  # Optional histogram labelled by action
+        self._categories = {}  # {(guild_id, key): (category_id, name)}
+        self._keys_by_category = {}  # {category_id: (guild_id, key)}
+        self._locks = {}  # {(guild_id, key): asyncio.Lock}
+        self.metrics = {"hits": 0, "misses": 0, "created": 0, "invalidated": 0}
+
+    def __len__(self):
+        return len(self._categories)
+
+    async def get_or_create(self, guild, key, name, reason=None):
+        """Return the cached category for a key, creating it once if needed"""
+        cache_key = (guild.id, key)
+        category = self._lookup(guild, cache_key, name)
+        if category is not None:
+            self.metrics["hits"] += 1
+            return category
+
+        lock = self._locks.setdefault(cache_key, asyncio.Lock())
+        async with lock:
+            # Another coroutine may have resolved it while we waited
+            category = self._lookup(guild, cache_key, name)
+            if category is not None:
+                self.metrics["hits"] += 1
+                return category
+
+            self.metrics["misses"] += 1
+            category = discord.utils.get(guild.categories, name=name)
+            if category is None:
+                started = time.perf_counter()
+                category = await guild.create_category(name, reason=reason)
+                if self.rest_duration is not None:
+                    self.rest_duration.labels("create_category").observe(time.perf_counter() - started)
+                self.metrics["created"] += 1
+                self.logger.info("Created category: %s", name)
+
+            self._categories[cache_key] = (category.id, name)
+            self._keys_by_category[category.id] = cache_key
+            return category
+
+    def invalidate(self, category_id):
+        """Forget a category, returns True if it was cached"""
+        cache_key = self._keys_by_category.pop(category_id, None)
+        if cache_key is None:
+            return False
+        self._categories.pop(cache_key, None)
+        lock = self._locks.get(cache_key)
+        if lock is not None and not lock.locked():
+            del self._locks[cache_key]
+        self.metrics["invalidated"] += 1
+        return True
+
+    def invalidate_guild(self, guild_id):
+        """Forget every cached category of a guild"""
+        for cache_key, (category_id, _) in list(self._categories.items()):
+            if cache_key[0] == guild_id:
+                self.invalidate(category_id)
+
+    def _lookup(self, guild, cache_key, name):
+        entry = self._categories.get(cache_key)
+        if entry is None:
+            return None
+
+        category_id, cached_name = entry
+        category = guild.get_channel(category_id)
+        if category is None or cached_name != name or category.name != name:
+            self.invalidate(category_id)
+            return None
+        return category
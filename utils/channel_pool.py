@@ -0,0 +1,201 @@
+"""
+Pre-warmed pool of hidden voice channels for instant channel creation
+"""
+import asyncio
+import collections
+import logging
+import time
+
+import discord
+
+POOL_CHANNEL_NAME = "⏳ standby"  # Name given to pooled channels until they are claimed
+
+
+class ChannelPool:
+    """Per-guild, per-platform pool of pre-created hidden voice channels.
+
+    Claiming a pooled channel costs one channel edit instead of a create, and
+    a background task refills pools that have seen demand recently. A key
+    (guild, platform) is only kept warm while it was claimed from within
+    max_idle seconds; after that its idle channels are deleted.
+    """
+
+    def __init__(self, bot, target_size=0, max_idle=1800, refill_rate=0.5, logger=None):
+        self.bot = bot
+        self.target_size = target_size
+        self.max_idle = max_idle
+        self.refill_rate = refill_rate  # Channels created per second at most
+        self.logger = logger or logging.getLogger(__name__)
+        self._idle = {}  # {(guild_id, platform): deque of channel IDs}
+        self._demand = {}  # {(guild_id, platform): monotonic time of last claim}
+        self._wake = asyncio.Event()
+        self._task = None
+        self._cleanups = set()  # Deletions of pooled channels that failed to be claimed
+        self.metrics = {"hits": 0, "misses": 0, "created": 0, "expired": 0, "failed": 0}
+
+    @property
+    def enabled(self):
+        return self.target_size > 0
+
+    def size(self, guild_id=None, platform=None):
+        """Return the number of idle channels, optionally for one key"""
+        if guild_id is not None:
+            return len(self._idle.get((guild_id, platform), ()))
+        return sum(len(channel_ids) for channel_ids in self._idle.values())
+
+    def channel_ids(self):
+        """Return the IDs of all idle pooled channels"""
+        return {channel_id for channel_ids in self._idle.values() for channel_id in channel_ids}
+
+    def stats(self):
+        """Return a snapshot of pool metrics"""
+        hits = self.metrics["hits"]
+        total = hits + self.metrics["misses"]
+        return {
+            **self.metrics,
+            "idle": self.size(),
+            "keys": len(self._demand),
+            "hit_ratio": hits / total if total else 0.0,
+        }
+
+    def load(self, stored_channels):
+        """Restore pooled channels persisted before a restart"""
+        now = time.monotonic()
+        for channel_id, data in stored_channels.items():
+            key = (data["guild_id"], data["platform"])
+            self._idle.setdefault(key, collections.deque()).append(int(channel_id))
+            self._demand.setdefault(key, now)
+
+    def start(self):
+        """Start the background refill task"""
+        if self.enabled and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self):
+        """Stop refilling; pooled channels are kept for the next start"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def claim(self, guild, platform, *, name, overwrites, reason=None, **options):
+        """Turn a pooled channel into a live one, returns None on a pool miss"""
+        if not self.enabled:
+            return None
+
+        key = (guild.id, platform)
+        self._demand[key] = time.monotonic()
+        self._wake.set()
+
+        idle = self._idle.get(key)
+        while idle:
+            channel_id = idle.popleft()
+            self.bot.store.delete("pool", channel_id)
+            channel = guild.get_channel(channel_id)
+            if channel is None:
+                continue  # Deleted behind our back
+
+            fields = dict(options, overwrites=overwrites)
+            if channel.name != name:
+                fields["name"] = name
+            try:
+                edited = await self.bot.actions.edit_channel(channel, reason=reason, **fields)
+            except discord.HTTPException as e:
+                self.metrics["failed"] += 1
+                self.logger.warning("Could not claim pooled channel %s: %s", channel_id, e)
+                # Already out of the pool, delete it in the background so it does not become an orphan
+                task = asyncio.create_task(self._delete(guild.id, channel_id, reason="Pooled channel could not be claimed"))
+                self._cleanups.add(task)
+                task.add_done_callback(self._cleanups.discard)
+                continue
+
+            self.metrics["hits"] += 1
+            return edited or channel
+
+        self.metrics["misses"] += 1
+        return None
+
+    async def _run(self):
+        while True:
+            for guild_id, channel_id in self._expire_idle_keys():
+                await self._delete(guild_id, channel_id)
+            key = self._next_key_to_fill()
+            if key is None:
+                self._wake.clear()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=60)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            try:
+                await self._create(*key)
+            except Exception as e:
+                self.metrics["failed"] += 1
+                self.logger.error("Error refilling channel pool for %s: %s", key, e)
+            # Space out creations so refills never crowd out user requests
+            await asyncio.sleep(1 / self.refill_rate if self.refill_rate > 0 else 1)
+
+    def _next_key_to_fill(self):
+        for key in self._demand:
+            if len(self._idle.get(key, ())) < self.target_size:
+                return key
+        return None
+
+    def _expire_idle_keys(self):
+        """Drop keys without recent demand, returns their (guild_id, channel_id) pairs"""
+        now = time.monotonic()
+        expired = []
+        for key, last_claim in list(self._demand.items()):
+            if now - last_claim < self.max_idle:
+                continue
+            del self._demand[key]
+            for channel_id in self._idle.pop(key, ()):
+                self.bot.store.delete("pool", channel_id)
+                self.metrics["expired"] += 1
+                expired.append((key[0], channel_id))
+        return expired
+
+    async def _create(self, guild_id, platform):
+        guild = self.bot.get_guild(guild_id)
+        cog = self.bot.get_cog('VoiceChannelCommands')
+        if guild is None or cog is None:
+            self._demand.pop((guild_id, platform), None)
+            return
+
+        if platform is None:
+            category = await cog.get_or_create_temp_category(guild)
+        else:
+            category = await cog.get_or_create_platform_category(guild, platform)
+        if category is None:
+            # Outside a managed category neither the pool nor orphan reconciliation would find it again;
+            # stop refilling until the next claim shows demand
+            self._demand.pop((guild_id, platform), None)
+            self.metrics["failed"] += 1
+            return
+
+        with self.bot.rest_duration.labels("create_channel").time():
+            channel = await guild.create_voice_channel(
+                POOL_CHANNEL_NAME,
+                category=category,
+                overwrites={
+                    guild.default_role: discord.PermissionOverwrite(view_channel=False, connect=False)
+                },
+                reason="Pre-warmed channel pool"
+            )
+        self._idle.setdefault((guild_id, platform), collections.deque()).append(channel.id)
+        self.bot.store.put("pool", channel.id, {"guild_id": guild_id, "platform": platform})
+        self.metrics["created"] += 1
+
+    async def _delete(self, guild_id, channel_id, reason="Idle pooled channel expired"):
+        guild = self.bot.get_guild(guild_id)
+        channel = guild.get_channel(channel_id) if guild else None
+        if channel is None:
+            return
+        try:
+            await self.bot.actions.delete_channel(channel, reason=reason)
+        except discord.HTTPException as e:
+            self.logger.warning("Could not delete pooled channel %s: %s", channel_id, e)
@@ -0,0 +1,48 @@
+"""
+Slash command sync that only talks to Discord when the command tree changed
+"""
+import hashlib
+import json
+
+
+def command_tree_hash(tree, guild=None):
+    """Stable hash of the command payloads a sync would upload"""
+    payload = sorted(
+        (command.to_dict(tree) for command in tree.get_commands(guild=guild)),
+        key=lambda command: (command.get("type", 1), command["name"])
+    )
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class CommandSyncer:
+    """Syncs a command tree globally or to one guild, skipping unchanged trees.
+
+    The hash of the last successful sync is kept in the registry store under
+    the "command_sync" namespace, keyed by application and scope.
+    """
+
+    NAMESPACE = "command_sync"
+
+    def __init__(self, tree, store, synced_hashes, logger):
+        self.tree = tree
+        self.store = store
+        self.synced_hashes = dict(synced_hashes)  # {"<application id>:<scope>": hash}
+        self.logger = logger
+
+    async def sync(self, application_id, guild=None, force=False):
+        """Sync if needed, returns the synced commands or None when skipped"""
+        if guild is not None:
+            # Guild commands update instantly, handy while developing
+            self.tree.copy_global_to(guild=guild)
+
+        key = f"{application_id}:{guild.id if guild is not None else 'global'}"
+        digest = command_tree_hash(self.tree, guild=guild)
+        if not force and self.synced_hashes.get(key) == digest:
+            self.logger.info("Slash commands unchanged (%s), skipping sync", digest[:12])
+            return None
+
+        synced = await self.tree.sync(guild=guild)
+        self.synced_hashes[key] = digest
+        self.store.put(self.NAMESPACE, key, digest)
+        return synced
@@ -0,0 +1,133 @@
+"""
+Expiry policies for temporary voice channels
+"""
+import datetime
+
+import discord
+
+POLICY_FIELDS = ("grace", "max_lifetime", "keep_warm_after", "keep_warm_grace")
+
+
+class ExpiryPolicy:
+    """How long an empty channel is kept before it is deleted.
+
+    grace: seconds an empty channel waits for someone to come back
+    max_lifetime: seconds after creation past which an empty channel is
+        deleted straight away (0 = no limit); occupied rooms are never cut off
+    keep_warm_after: reuses after which a channel counts as popular (0 = off)
+    keep_warm_grace: grace for popular channels
+    """
+
+    __slots__ = POLICY_FIELDS
+
+    def __init__(self, grace=10, max_lifetime=0, keep_warm_after=0, keep_warm_grace=0):
+        self.grace = float(grace)
+        self.max_lifetime = float(max_lifetime)
+        self.keep_warm_after = int(keep_warm_after)
+        self.keep_warm_grace = float(keep_warm_grace)
+
+    def __repr__(self):
+        fields = " ".join(f"{field}={getattr(self, field)}" for field in POLICY_FIELDS)
+        return f"<ExpiryPolicy {fields}>"
+
+    def replace(self, **changes):
+        """Return a copy with some fields changed"""
+        return ExpiryPolicy(**{field: changes.get(field, getattr(self, field)) for field in POLICY_FIELDS})
+
+
+class ExpiryPolicies:
+    """Resolves the expiry policy of a channel and remembers which channels get reused.
+
+    Overrides are keyed "<guild_id>:<platform>", "<guild_id>" or
+    "<platform>" and only need the fields they change; the most specific
+    match wins. Resolved policies are cached per (guild, platform), so the
+    lookup on the voice event path is a single dict hit.
+
+    A reuse is someone joining a channel while its deletion is pending,
+    i.e. the room emptied between matches and the group came back. Once a
+    channel has been reused keep_warm_after times it gets keep_warm_grace
+    instead of the normal grace.
+    """
+
+    def __init__(self, default, overrides=None):
+        self._reuses = {}  # {channel_id: count}
+        self._kept_warm = set()  # Channels counted in metrics["kept_warm"]
+        self._expired = set()  # Channels counted in metrics["expired"]
+        self.metrics = {"reuses": 0, "kept_warm": 0, "expired": 0}  # kept_warm/expired count channels
+        self.configure(default, overrides)
+
+    def configure(self, default, overrides=None):
+        """Replace the policies, reuse history is kept"""
+        self.default = default
+        self.overrides = {}
+        for key, fields in (overrides or {}).items():
+            guild, _, platform = str(key).partition(":")
+            if not guild.isdigit():
+                guild, platform = "", guild
+            self.overrides[(int(guild) if guild else None, platform or None)] = fields
+        self._resolved = {}  # {(guild_id, platform): ExpiryPolicy}
+
+    def policy_for(self, guild_id, platform=None):
+        """Return the policy of a guild and platform"""
+        key = (guild_id, platform)
+        policy = self._resolved.get(key)
+        if policy is None:
+            policy = self.default
+            # Least to most specific, later matches win
+            for override in ((None, platform), (guild_id, None), (guild_id, platform)):
+                if override in self.overrides:
+                    policy = policy.replace(**self.overrides[override])
+            self._resolved[key] = policy
+        return policy
+
+    def note_reuse(self, channel_id):
+        """Record that a channel was rejoined before it expired"""
+        self._reuses[channel_id] = self._reuses.get(channel_id, 0) + 1
+        self.metrics["reuses"] += 1
+
+    def reuses(self, channel_id):
+        return self._reuses.get(channel_id, 0)
+
+    def is_warm(self, record):
+        """Check whether a channel has been reused often enough to be kept warm"""
+        policy = self.policy_for(record.guild_id, record.platform)
+        return 0 < policy.keep_warm_after <= self._reuses.get(record.channel_id, 0)
+
+    def grace_for(self, record, now=None):
+        """Return the seconds an empty channel should be kept, 0 when it is past its lifetime.
+
+        The lifetime counts from record.tracked_at, when the room was handed out.
+        """
+        policy = self.policy_for(record.guild_id, record.platform)
+        grace = policy.grace
+        if 0 < policy.keep_warm_after <= self._reuses.get(record.channel_id, 0):
+            grace = max(grace, policy.keep_warm_grace)
+            self._count_once(self._kept_warm, "kept_warm", record.channel_id)
+        if policy.max_lifetime:
+            now = now or discord.utils.utcnow()
+            remaining = policy.max_lifetime - (now - record.tracked_at) / datetime.timedelta(seconds=1)
+            if remaining < grace:
+                # Never keep an empty channel past its lifetime
+                grace = max(0.0, remaining)
+                self._count_once(self._expired, "expired", record.channel_id)
+        return grace
+
+    def _count_once(self, counted, metric, channel_id):
+        # grace_for runs on every leave and sweep, count each channel once
+        if channel_id not in counted:
+            counted.add(channel_id)
+            self.metrics[metric] += 1
+
+    def forget(self, channel_id):
+        """Drop the reuse history of a deleted channel"""
+        self._reuses.pop(channel_id, None)
+        self._kept_warm.discard(channel_id)
+        self._expired.discard(channel_id)
+
+    def stats(self):
+        """Return a snapshot of policy metrics"""
+        return {
+            **self.metrics,
+            "tracked": len(self._reuses),
+            "policies": len(self._resolved),
+        }
@@ -0,0 +1,61 @@
+"""
+Per-channel locks for serializing conflicting channel mutations
+"""
+import asyncio
+import contextlib
+import time
+import weakref
+
+
+class ChannelLockManager:
+    """Hands out one asyncio.Lock per channel, created on demand.
+
+    Locks are held in a WeakValueDictionary: a lock only lives while some
+    coroutine holds or waits for it, so idle channels cost nothing and no
+    cleanup is needed. Each acquisition names its operation, which labels
+    the contention metrics.
+    """
+
+    def __init__(self, metrics=None):
+        self._locks = weakref.WeakValueDictionary()  # {channel_id: asyncio.Lock}
+        self.metrics = {"acquired": 0, "contended": 0}
+        self._wait = None
+        self._contended = None
+        if metrics is not None:
+            self._wait = metrics.histogram(
+                "vcb_channel_lock_wait_seconds", "Time spent waiting for a channel lock", ("operation",)
+            )
+            self._contended = metrics.counter(
+                "vcb_channel_lock_contended_total", "Channel lock acquisitions that had to wait", ("operation",)
+            )
+
+    def __len__(self):
+        return len(self._locks)
+
+    def stats(self):
+        """Return a snapshot of lock metrics"""
+        return {**self.metrics, "active": len(self._locks)}
+
+    def locked(self, channel_id):
+        """Check whether a channel's lock is currently held"""
+        lock = self._locks.get(channel_id)
+        return lock is not None and lock.locked()
+
+    @contextlib.asynccontextmanager
+    async def hold(self, channel_id, operation):
+        """Hold the lock of a channel for the duration of the block"""
+        lock = self._locks.get(channel_id)
+        if lock is None:
+            lock = self._locks[channel_id] = asyncio.Lock()
+
+        contended = lock.locked()
+        started = time.perf_counter()
+        async with lock:
+            self.metrics["acquired"] += 1
+            if contended:
+                self.metrics["contended"] += 1
+                if self._contended is not None:
+                    self._contended.labels(operation).inc()
+            if self._wait is not None:
+                self._wait.labels(operation).observe(time.perf_counter() - started)
+            yield
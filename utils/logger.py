@@ -1,55 +1,155 @@
 """
 Logging configuration for the Discord Voice Channel Bot
 """
+import atexit
+import copy
+import json
 import logging
+import logging.handlers
 import os
+import queue
+import time
 from datetime import datetime
 
+_listeners = {}  # {logger name: QueueListener} for loggers set up in queued mode
+
+
+def _env_flag(name, default):
+    return os.getenv(name, default).strip().lower() in ("1", "true", "yes", "on")
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as single-line JSON objects"""
+
+    def format(self, record):
+        entry = {
+            "time": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        fields = getattr(record, "fields", None)
+        if fields:
+            entry.update(fields)
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class SizeAndTimeRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotates the log file when it grows past max_bytes or every interval seconds"""
+
+    def __init__(self, filename, max_bytes=0, backup_count=0, interval=0, encoding=None):
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding=encoding)
+        self.interval = interval
+        self.rollover_at = time.time() + interval if interval else None
+
+    def shouldRollover(self, record):
+        if self.rollover_at is not None and time.time() >= self.rollover_at:
+            return 1
+        return super().shouldRollover(record)
+
+    def doRollover(self):
+        super().doRollover()
+        if self.interval:
+            self.rollover_at = time.time() + self.interval
+
+
+class BackgroundQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves formatting to the background writer thread.
+
+    The stock handler formats every record on the calling thread; here only
+    the %-style message is rendered so that arguments are captured as they
+    were when the call was made.
+    """
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
 def setup_logger(name="VoiceChannelBot", level=None):
-    """Setup and configure logger for the bot"""
-    
+    """Setup and configure logger for the bot (safe to call more than once)"""
+
+    logger = logging.getLogger(name)
+
     # Get log level from environment or default to INFO
     if level is None:
         level = os.getenv("LOG_LEVEL", "INFO").upper()
-    
-    # Create logger
-    logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, level, logging.INFO))
-    
+
+    # Already configured by an earlier call, keep the running pipeline
+    if getattr(logger, "_voice_bot_configured", False):
+        return logger
+
     # Clear existing handlers to avoid duplicates
     logger.handlers.clear()
-    
+
     # Create formatters
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
+    if _env_flag("LOG_JSON", "false"):
+        formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+
+    handlers = []
+
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-    
+    handlers.append(console_handler)
+
     # File handler (optional)
     log_file = os.getenv("LOG_FILE")
     if log_file:
         try:
-            file_handler = logging.FileHandler(log_file, encoding='utf-8')
+            file_handler = SizeAndTimeRotatingFileHandler(
+                log_file,
+                max_bytes=int(os.getenv("LOG_MAX_BYTES", str(10 * 1024 * 1024))),
+                backup_count=int(os.getenv("LOG_BACKUP_COUNT", "5")),
+                interval=float(os.getenv("LOG_ROTATE_INTERVAL", "86400")),
+                encoding='utf-8'
+            )
             file_handler.setLevel(logging.DEBUG)
             file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+            handlers.append(file_handler)
         except Exception as e:
             logger.warning(f"Could not create file handler: {e}")
-    
+
+    if _env_flag("LOG_QUEUE", "true"):
+        # Hand records to a background thread so logging never blocks the event loop
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        _listeners[name] = listener
+        atexit.register(shutdown_logger, name)
+        logger.addHandler(BackgroundQueueHandler(log_queue))
+    else:
+        for handler in handlers:
+            logger.addHandler(handler)
+
+    logger._voice_bot_configured = True
     return logger
 
+def shutdown_logger(name="VoiceChannelBot"):
+    """Flush and stop the background writer of a queued logger"""
+    listener = _listeners.pop(name, None)
+    if listener is not None:
+        listener.stop()
+
 def log_command_usage(logger, user, command, guild=None):
-    """Log command usage for monitoring"""
-    guild_info = f" in {guild.name}" if guild else ""
-    logger.info(f"Command '{command}' used by {user}{guild_info}")
+    """Log command usage for monitoring (formatted lazily)"""
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Command '%s' used by %s%s", command, user, f" in {guild.name}" if guild else "")
 
 def log_error(logger, error, context=""):
-    """Log errors with context"""
-    context_str = f" ({context})" if context else ""
-    logger.error(f"Error{context_str}: {error}")
+    """Log errors with context (formatted lazily)"""
+    if context:
+        logger.error("Error (%s): %s", context, error)
+    else:
+        logger.error("Error: %s", error)
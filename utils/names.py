@@ -0,0 +1,91 @@
+"""
+Channel and game name normalization
+"""
+import functools
+import re
+
+_INVALID_CHARS = re.compile(r'[^\w\s-]')
+_ALIAS_KEY_STRIP = re.compile(r'[\W_]+')
+
+# Common shorthands players type, keyed by their alias key (see _alias_key)
+GAME_ALIASES = {
+    "ml": "Mobile Legends",
+    "mlbb": "Mobile Legends",
+    "mobilelegends": "Mobile Legends",
+    "mobilelegendsbangbang": "Mobile Legends",
+    "val": "Valorant",
+    "valo": "Valorant",
+    "valorant": "Valorant",
+    "lol": "League of Legends",
+    "league": "League of Legends",
+    "leagueoflegends": "League of Legends",
+    "wr": "Wild Rift",
+    "wildrift": "Wild Rift",
+    "cs": "Counter-Strike 2",
+    "cs2": "Counter-Strike 2",
+    "csgo": "Counter-Strike 2",
+    "counterstrike": "Counter-Strike 2",
+    "counterstrike2": "Counter-Strike 2",
+    "cod": "Call of Duty",
+    "callofduty": "Call of Duty",
+    "codm": "Call of Duty Mobile",
+    "callofdutymobile": "Call of Duty Mobile",
+    "pubg": "PUBG",
+    "pubgm": "PUBG Mobile",
+    "pubgmobile": "PUBG Mobile",
+    "ff": "Free Fire",
+    "freefire": "Free Fire",
+    "fn": "Fortnite",
+    "fortnite": "Fortnite",
+    "mc": "Minecraft",
+    "minecraft": "Minecraft",
+    "apex": "Apex Legends",
+    "apexlegends": "Apex Legends",
+    "ow": "Overwatch 2",
+    "ow2": "Overwatch 2",
+    "overwatch": "Overwatch 2",
+    "overwatch2": "Overwatch 2",
+    "dota": "Dota 2",
+    "dota2": "Dota 2",
+    "r6": "Rainbow Six Siege",
+    "r6s": "Rainbow Six Siege",
+    "siege": "Rainbow Six Siege",
+    "rainbowsixsiege": "Rainbow Six Siege",
+    "rl": "Rocket League",
+    "rocketleague": "Rocket League",
+    "gi": "Genshin Impact",
+    "genshin": "Genshin Impact",
+    "genshinimpact": "Genshin Impact",
+    "hok": "Honor of Kings",
+    "honorofkings": "Honor of Kings",
+}
+
+
+@functools.lru_cache(maxsize=2048)
+def sanitize_name(name, max_length, default):
+    """Strip characters Discord rejects, trim to max_length, fall back to default"""
+    name = _INVALID_CHARS.sub('', name).strip()
+    if len(name) > max_length:
+        name = name[:max_length]
+    return name or default
+
+
+def _alias_key(name):
+    return _ALIAS_KEY_STRIP.sub('', name).casefold()
+
+
+@functools.lru_cache(maxsize=2048)
+def canonical_game_name(name):
+    """Map a known alias ("ML", "mlbb", ...) to its canonical game name, else return it unchanged"""
+    return GAME_ALIASES.get(_alias_key(name), name)
+
+
+def cache_stats():
+    """Return hit/miss counts of the name caches"""
+    stats = {}
+    for prefix, cached in (("sanitize", sanitize_name), ("game", canonical_game_name)):
+        info = cached.cache_info()
+        stats[f"{prefix}_hits"] = info.hits
+        stats[f"{prefix}_misses"] = info.misses
+        stats[f"{prefix}_size"] = info.currsize
+    return stats
@@ -0,0 +1,73 @@
+"""
+Incremental voice occupancy of temporary channels
+"""
+
+
+class OccupancyTracker:
+    """Keeps the set of members in each temporary channel up to date from voice events.
+
+    discord.py's channel.members walks every voice state of the guild, so
+    asking it per channel is O(voice states). Here a channel is seeded from
+    the cache the first time it is asked about, after which join/leave
+    transitions keep it current and count() is O(1). Member sets (rather
+    than bare counters) make updates idempotent, so an event that was
+    already reflected in the seed is not counted twice. reconcile()
+    re-reads the cache to correct any drift.
+    """
+
+    def __init__(self):
+        self._members = {}  # {channel_id: {member_id}}
+        self.metrics = {"joins": 0, "leaves": 0, "seeded": 0, "reconciled": 0, "drift_corrections": 0}
+
+    def __len__(self):
+        return len(self._members)
+
+    def __contains__(self, channel_id):
+        return channel_id in self._members
+
+    def stats(self):
+        """Return a snapshot of tracker metrics"""
+        return {
+            **self.metrics,
+            "channels": len(self._members),
+            "members": sum(len(member_ids) for member_ids in self._members.values()),
+        }
+
+    def count(self, channel):
+        """Return the number of members in a channel, seeding it from the cache once"""
+        member_ids = self._members.get(channel.id)
+        if member_ids is None:
+            member_ids = self._members[channel.id] = {member.id for member in channel.members}
+            self.metrics["seeded"] += 1
+        return len(member_ids)
+
+    def is_empty(self, channel):
+        return self.count(channel) == 0
+
+    def move(self, member_id, before_id, after_id):
+        """Apply a voice transition, only channels already being followed are updated"""
+        if before_id is not None:
+            member_ids = self._members.get(before_id)
+            if member_ids is not None and member_id in member_ids:
+                member_ids.discard(member_id)
+                self.metrics["leaves"] += 1
+        if after_id is not None:
+            member_ids = self._members.get(after_id)
+            if member_ids is not None and member_id not in member_ids:
+                member_ids.add(member_id)
+                self.metrics["joins"] += 1
+
+    def forget(self, channel_id):
+        """Stop following a channel"""
+        self._members.pop(channel_id, None)
+
+    def reconcile(self, channel):
+        """Re-read a channel's members from the cache, returns True if the tracked set had drifted"""
+        actual = {member.id for member in channel.members}
+        tracked = self._members.get(channel.id)
+        self._members[channel.id] = actual
+        self.metrics["reconciled"] += 1
+        if tracked is not None and tracked != actual:
+            self.metrics["drift_corrections"] += 1
+            return True
+        return False
@@ -0,0 +1,154 @@
+"""
+Registry of tracked temporary voice channels
+"""
+import datetime
+
+
+class TempChannel:
+    """A tracked temporary channel"""
+
+    __slots__ = ("channel_id", "guild_id", "owner_id", "platform", "room_number", "tracked_at")
+
+    def __init__(self, channel_id, guild_id, owner_id, platform=None, room_number=None, tracked_at=None):
+        self.channel_id = channel_id
+        self.guild_id = guild_id
+        self.owner_id = owner_id
+        self.platform = platform  # Gaming channels only
+        self.room_number = room_number
+        self.tracked_at = tracked_at  # When the room was handed out, later than created_at for pooled channels
+
+    def __repr__(self):
+        return f"<TempChannel channel_id={self.channel_id} guild_id={self.guild_id} owner_id={self.owner_id}>"
+
+    def to_dict(self):
+        data = {"guild_id": self.guild_id, "owner_id": self.owner_id}
+        if self.room_number is not None:
+            data["platform"] = self.platform
+            data["room_number"] = self.room_number
+        data["tracked_at"] = self.tracked_at.timestamp()
+        return data
+
+
+class ChannelRegistry:
+    """Tracks temporary channels with channel, owner and guild indexes.
+
+    Every mutation updates all three indexes (and the optional store) without
+    awaiting, so callers on the event loop always see a consistent view.
+    Records are partitioned by guild so per-guild queries never touch other
+    guilds. Collections returned by channels_of()/channels_in() are live
+    views and must not be modified by callers.
+    """
+
+    def __init__(self, store=None):
+        self.store = store
+        self._channels = {}  # {channel_id: TempChannel}
+        self._by_owner = {}  # {owner_id: {channel_id}}
+        self._by_guild = {}  # {guild_id: {channel_id: TempChannel}}
+
+    def __contains__(self, channel_id):
+        return channel_id in self._channels
+
+    def __len__(self):
+        return len(self._channels)
+
+    def __iter__(self):
+        return iter(self._channels)
+
+    def __bool__(self):
+        return bool(self._channels)
+
+    def get(self, channel_id):
+        """Return the record for a channel, or None"""
+        return self._channels.get(channel_id)
+
+    def records(self):
+        """Return all channel records"""
+        return self._channels.values()
+
+    def owner_of(self, channel_id):
+        """Return the owner ID of a channel, or None if it is not tracked"""
+        record = self._channels.get(channel_id)
+        return record.owner_id if record else None
+
+    def is_owner(self, channel_id, user_id):
+        """Check whether a user owns a tracked channel"""
+        record = self._channels.get(channel_id)
+        return record is not None and record.owner_id == user_id
+
+    def channels_of(self, owner_id):
+        """Return the IDs of all channels owned by a user"""
+        return self._by_owner.get(owner_id, frozenset())
+
+    def channels_in(self, guild_id):
+        """Return the {channel_id: record} partition of a guild"""
+        return self._by_guild.get(guild_id, {})
+
+    def guild_count(self, guild_id):
+        """Return the number of channels tracked in a guild"""
+        return len(self._by_guild.get(guild_id, ()))
+
+    def add(self, channel_id, guild_id, owner_id, platform=None, room_number=None):
+        """Start tracking a channel, returns its record"""
+        if channel_id in self._channels:
+            return self.transfer(channel_id, owner_id)
+
+        record = TempChannel(
+            channel_id, guild_id, owner_id, platform, room_number,
+            tracked_at=datetime.datetime.now(datetime.timezone.utc)
+        )
+        self._channels[channel_id] = record
+        self._by_owner.setdefault(owner_id, set()).add(channel_id)
+        self._by_guild.setdefault(guild_id, {})[channel_id] = record
+        self._persist(record)
+        return record
+
+    def transfer(self, channel_id, new_owner_id):
+        """Move a channel to a new owner, returns its record or None if untracked"""
+        record = self._channels.get(channel_id)
+        if record is None:
+            return None
+        if record.owner_id != new_owner_id:
+            self._discard(self._by_owner, record.owner_id, channel_id)
+            record.owner_id = new_owner_id
+            self._by_owner.setdefault(new_owner_id, set()).add(channel_id)
+            self._persist(record)
+        return record
+
+    def remove(self, channel_id):
+        """Stop tracking a channel, returns its record or None if it was not tracked"""
+        record = self._channels.pop(channel_id, None)
+        if record is None:
+            return None
+        self._discard(self._by_owner, record.owner_id, channel_id)
+        partition = self._by_guild.get(record.guild_id)
+        if partition is not None:
+            partition.pop(channel_id, None)
+            if not partition:
+                del self._by_guild[record.guild_id]
+        if self.store is not None:
+            self.store.delete("channels", channel_id)
+        return record
+
+    def load(self, stored_channels):
+        """Rebuild the registry from stored {channel_id: record dict} data"""
+        for channel_id, data in stored_channels.items():
+            channel_id = int(channel_id)
+            record = TempChannel(
+                channel_id, data["guild_id"], data["owner_id"], data.get("platform"), data.get("room_number"),
+                tracked_at=datetime.datetime.fromtimestamp(data["tracked_at"], datetime.timezone.utc)
+            )
+            self._channels[channel_id] = record
+            self._by_owner.setdefault(record.owner_id, set()).add(channel_id)
+            self._by_guild.setdefault(record.guild_id, {})[channel_id] = record
+
+    def _persist(self, record):
+        if self.store is not None:
+            self.store.put("channels", record.channel_id, record.to_dict())
+
+    @staticmethod
+    def _discard(index, key, channel_id):
+        channel_ids = index.get(key)
+        if channel_ids is not None:
+            channel_ids.discard(channel_id)
+            if not channel_ids:
+                del index[key]
@@ -0,0 +1,99 @@
+"""
+Room number allocation for gaming channels
+"""
+import heapq
+
+
+class _RoomNumbers:
+    """Room numbers of one guild and platform"""
+
+    __slots__ = ("next_number", "freed", "in_use")
+
+    def __init__(self):
+        self.next_number = 1  # Lowest number never handed out
+        self.freed = []  # Min-heap of released numbers below next_number
+        self.in_use = set()
+
+
+class RoomAllocator:
+    """Hands out the lowest free room number per (guild, platform).
+
+    Released numbers go on a min-heap and are reused before new ones, so a
+    guild's rooms stay numbered from #1 up. Allocation and release never
+    await, which makes them atomic on the event loop: concurrent modal
+    submissions can't receive the same number. A key whose rooms are all
+    released is dropped, restarting its numbering at #1.
+
+    Allocations are not persisted here; the registry stores each channel's
+    room number and load() rebuilds the free lists from it after a restart.
+    """
+
+    def __init__(self):
+        self._rooms = {}  # {(guild_id, platform): _RoomNumbers}
+        self.metrics = {"allocated": 0, "reused": 0, "released": 0}
+
+    def __len__(self):
+        return sum(len(rooms.in_use) for rooms in self._rooms.values())
+
+    def stats(self):
+        """Return a snapshot of allocator metrics"""
+        return {
+            **self.metrics,
+            "in_use": len(self),
+            "freed": sum(len(rooms.freed) for rooms in self._rooms.values()),
+            "keys": len(self._rooms),
+        }
+
+    def in_use(self, guild_id, platform):
+        """Return the sorted room numbers in use for a key"""
+        rooms = self._rooms.get((guild_id, platform))
+        return sorted(rooms.in_use) if rooms else []
+
+    def allocate(self, guild_id, platform):
+        """Reserve and return the lowest free room number (O(log n))"""
+        rooms = self._rooms.setdefault((guild_id, platform), _RoomNumbers())
+        if rooms.freed:
+            number = heapq.heappop(rooms.freed)
+            self.metrics["reused"] += 1
+        else:
+            number = rooms.next_number
+            rooms.next_number += 1
+        rooms.in_use.add(number)
+        self.metrics["allocated"] += 1
+        return number
+
+    def claim(self, guild_id, platform, number):
+        """Reserve a specific room number, returns False if it is already taken"""
+        rooms = self._rooms.setdefault((guild_id, platform), _RoomNumbers())
+        if number in rooms.in_use or number < 1:
+            return False
+        if number >= rooms.next_number:
+            # Everything skipped over becomes free
+            for skipped in range(rooms.next_number, number):
+                heapq.heappush(rooms.freed, skipped)
+            rooms.next_number = number + 1
+        else:
+            rooms.freed.remove(number)
+            heapq.heapify(rooms.freed)
+        rooms.in_use.add(number)
+        return True
+
+    def release(self, guild_id, platform, number):
+        """Return a room number to the free list (O(log n))"""
+        key = (guild_id, platform)
+        rooms = self._rooms.get(key)
+        if rooms is None or number not in rooms.in_use:
+            return False
+        rooms.in_use.discard(number)
+        self.metrics["released"] += 1
+        if not rooms.in_use:
+            del self._rooms[key]
+        else:
+            heapq.heappush(rooms.freed, number)
+        return True
+
+    def load(self, records):
+        """Rebuild allocations from registry records that carry a room number"""
+        for record in records:
+            if record.room_number is not None:
+                self.claim(record.guild_id, record.platform, record.room_number)
@@ -0,0 +1,138 @@
+"""
+Debounced deletion scheduler for temporary voice channels
+"""
+import asyncio
+import heapq
+import itertools
+
+
+class DeletionScheduler:
+    """Keeps at most one pending deletion deadline per channel.
+
+    Deadlines live in a single heap and only the earliest one holds a loop
+    timer, so thousands of channels with different deadlines cost one heap
+    entry each instead of one TimerHandle each. Re-arming or cancelling
+    leaves the old heap entry behind; stale entries are skipped when they
+    surface and the heap is rebuilt once they outnumber the live ones.
+    """
+
+    def __init__(self, callback, delay=10):
+        self.callback = callback  # async callable taking a channel_id
+        self.delay = delay
+        self._deadlines = {}  # {channel_id: (deadline, seq)}
+        self._heap = []  # [(deadline, seq, channel_id)], may hold stale entries
+        self._seq = itertools.count()
+        self._timer = None  # TimerHandle for the earliest deadline
+        self._running = set()  # Tasks for fired callbacks that are still running
+        self.metrics = {
+            "scheduled": 0,
+            "rearmed": 0,
+            "cancelled": 0,
+            "fired": 0,
+            "compactions": 0,
+        }
+
+    def __contains__(self, channel_id):
+        return channel_id in self._deadlines
+
+    def __len__(self):
+        return len(self._deadlines)
+
+    def schedule(self, channel_id, delay=None):
+        """Arm (or re-arm) the deletion deadline for a channel"""
+        loop = asyncio.get_running_loop()
+        if delay is None:
+            delay = self.delay
+
+        if channel_id in self._deadlines:
+            self.metrics["rearmed"] += 1
+        else:
+            self.metrics["scheduled"] += 1
+
+        entry = (loop.time() + delay, next(self._seq), channel_id)
+        self._deadlines[channel_id] = entry[:2]
+        heapq.heappush(self._heap, entry)
+        self._arm(loop)
+
+    def cancel(self, channel_id):
+        """Cancel a pending deletion, returns True if one was pending"""
+        if self._deadlines.pop(channel_id, None) is None:
+            return False
+        self.metrics["cancelled"] += 1
+        if len(self._heap) > 2 * len(self._deadlines) + 64:
+            self._compact()
+        return True
+
+    def cancel_all(self):
+        """Cancel every pending deadline and running callback"""
+        self.metrics["cancelled"] += len(self._deadlines)
+        self._deadlines.clear()
+        self._heap.clear()
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        for task in self._running:
+            task.cancel()
+
+    def pending(self):
+        """Return {channel_id: seconds until deletion} for all pending deadlines"""
+        if not self._deadlines:
+            return {}
+        now = asyncio.get_running_loop().time()
+        return {
+            channel_id: max(0.0, deadline - now)
+            for channel_id, (deadline, _) in self._deadlines.items()
+        }
+
+    def stats(self):
+        """Return a snapshot of scheduler metrics"""
+        return {
+            **self.metrics,
+            "pending": len(self._deadlines),
+            "heap": len(self._heap),
+            "running": len(self._running),
+        }
+
+    def _is_live(self, entry):
+        deadline, seq, channel_id = entry
+        return self._deadlines.get(channel_id) == (deadline, seq)
+
+    def _compact(self):
+        self._heap = [entry for entry in self._heap if self._is_live(entry)]
+        heapq.heapify(self._heap)
+        self.metrics["compactions"] += 1
+
+    def _arm(self, loop):
+        """Point the loop timer at the earliest live deadline"""
+        heap = self._heap
+        while heap and not self._is_live(heap[0]):
+            heapq.heappop(heap)
+        if not heap:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            return
+
+        when = heap[0][0]
+        if self._timer is not None:
+            if self._timer.when() <= when:
+                return  # Already due first; _fire re-arms for the rest
+            self._timer.cancel()
+        self._timer = loop.call_at(when, self._fire)
+
+    def _fire(self):
+        self._timer = None
+        loop = asyncio.get_running_loop()
+        now = loop.time() + 0.001  # The loop may run a timer up to its clock resolution early
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            entry = heapq.heappop(heap)
+            if not self._is_live(entry):
+                continue
+            channel_id = entry[2]
+            del self._deadlines[channel_id]
+            self.metrics["fired"] += 1
+            task = asyncio.create_task(self.callback(channel_id))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+        self._arm(loop)
@@ -0,0 +1,219 @@
+"""
+Multi-process sharding: a supervisor running worker processes that each own a range of shards
+"""
+import asyncio
+import logging
+import multiprocessing
+import os
+import queue
+import signal
+import time
+
+import discord
+
+from utils.metrics import MetricsRegistry, MetricsServer
+
+
+def shard_ranges(shard_count, workers):
+    """Split shard IDs into contiguous, evenly sized ranges, one per worker"""
+    workers = max(1, min(workers, shard_count))
+    base, extra = divmod(shard_count, workers)
+    ranges = []
+    start = 0
+    for index in range(workers):
+        size = base + (1 if index < extra else 0)
+        ranges.append(list(range(start, start + size)))
+        start += size
+    return ranges
+
+
+def worker_path(path, worker_id):
+    """Derive a per-worker file name, e.g. bot.log -> bot.worker1.log"""
+    root, ext = os.path.splitext(path)
+    return f"{root}.worker{worker_id}{ext}"
+
+
+async def fetch_recommended_shards(token):
+    """Ask Discord how many shards the bot should run"""
+    http = discord.http.HTTPClient(asyncio.get_running_loop())
+    try:
+        await http.static_login(token)
+        shards, _, _ = await http.get_bot_gateway()
+        return shards
+    finally:
+        await http.close()
+
+
+def run_worker(worker_id, shard_ids, shard_count, token, stats_queue):
+    """Entry point of a worker process"""
+    # Each worker writes its own log file so rotation never races between processes
+    log_file = os.getenv("LOG_FILE")
+    if log_file:
+        os.environ["LOG_FILE"] = worker_path(log_file, worker_id)
+
+    from bot import create_bot
+
+    bot = create_bot(
+        "processes",
+        worker_id=worker_id,
+        stats_queue=stats_queue,
+        shard_ids=shard_ids,
+        shard_count=shard_count,
+    )
+    bot.logger.info("Worker %s starting shards %d-%d of %d", worker_id, shard_ids[0], shard_ids[-1], shard_count)
+    bot.run(token)
+
+
+class _Worker:
+    __slots__ = ("worker_id", "shard_ids", "process", "restarts", "started_at", "restart_at")
+
+    def __init__(self, worker_id, shard_ids):
+        self.worker_id = worker_id
+        self.shard_ids = shard_ids
+        self.process = None
+        self.restarts = 0
+        self.started_at = 0.0
+        self.restart_at = None
+
+
+class ShardSupervisor:
+    """Runs one worker process per shard range and restarts the ones that crash.
+
+    Workers push metric snapshots through a queue; the supervisor serves them
+    on the metrics endpoint with a worker label, alongside fleet-wide totals.
+    """
+
+    MAX_BACKOFF = 60
+    STABLE_AFTER = 300  # Seconds a worker must stay up before its backoff resets
+
+    def __init__(self, token, config, logger=None):
+        self.token = token
+        self.config = config
+        self.logger = logger or logging.getLogger(__name__)
+        self.context = multiprocessing.get_context("spawn")
+        self.stats_queue = self.context.Queue()
+        self.workers = []
+        self.snapshots = {}  # {worker_id: latest stats snapshot}
+        self.metrics = MetricsRegistry()
+        self.metrics.add_collector(self._collect)
+        self._stopping = False
+
+    async def run(self):
+        shard_count = self.config.SHARD_COUNT or await fetch_recommended_shards(self.token)
+        ranges = shard_ranges(shard_count, self.config.WORKER_PROCESSES)
+        self.logger.info("Running %d shards across %d worker processes", shard_count, len(ranges))
+        self.workers = [_Worker(worker_id, shard_ids) for worker_id, shard_ids in enumerate(ranges)]
+        self.shard_count = shard_count
+
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self.stop)
+            except (NotImplementedError, RuntimeError):
+                pass  # Not supported on this platform
+        try:
+            loop.add_signal_handler(signal.SIGHUP, self.reload)
+        except (AttributeError, NotImplementedError, RuntimeError):
+            pass
+
+        metrics_server = None
+        if self.config.METRICS_PORT:
+            metrics_server = MetricsServer(
+                self.metrics, self.config.METRICS_HOST, self.config.METRICS_PORT, logger=self.logger
+            )
+            await metrics_server.start()
+
+        try:
+            for worker in self.workers:
+                self._start(worker)
+            while not self._stopping:
+                self._drain_stats()
+                self._check_workers()
+                await asyncio.sleep(1)
+        finally:
+            self._terminate_all()
+            if metrics_server:
+                await metrics_server.stop()
+
+    def stop(self):
+        self.logger.info("Stopping shard supervisor")
+        self._stopping = True
+
+    def reload(self):
+        """Forward SIGHUP so every worker reloads its config"""
+        self.logger.info("Reloading config of all workers")
+        for worker in self.workers:
+            if worker.process is not None and worker.process.is_alive():
+                os.kill(worker.process.pid, signal.SIGHUP)
+
+    def _start(self, worker):
+        worker.process = self.context.Process(
+            target=run_worker,
+            args=(worker.worker_id, worker.shard_ids, self.shard_count, self.token, self.stats_queue),
+            name=f"voice-bot-worker-{worker.worker_id}",
+            daemon=True,
+        )
+        worker.process.start()
+        worker.started_at = time.monotonic()
+        worker.restart_at = None
+
+    def _check_workers(self):
+        now = time.monotonic()
+        for worker in self.workers:
+            if worker.restart_at is not None:
+                if now >= worker.restart_at:
+                    self.logger.info("Restarting worker %s (restart #%d)", worker.worker_id, worker.restarts)
+                    self._start(worker)
+                continue
+
+            if worker.process.is_alive():
+                continue
+
+            # Crashed: back off exponentially, unless it had been running stably
+            if now - worker.started_at >= self.STABLE_AFTER:
+                worker.restarts = 0
+            worker.restarts += 1
+            delay = min(self.MAX_BACKOFF, 2 ** (worker.restarts - 1))
+            worker.restart_at = now + delay
+            self.snapshots.pop(worker.worker_id, None)
+            self.logger.error(
+                "Worker %s exited with code %s, restarting in %ss",
+                worker.worker_id, worker.process.exitcode, delay
+            )
+
+    def _terminate_all(self):
+        for worker in self.workers:
+            if worker.process is not None and worker.process.is_alive():
+                worker.process.terminate()
+        for worker in self.workers:
+            if worker.process is not None:
+                worker.process.join(timeout=10)
+
+    def _drain_stats(self):
+        while True:
+            try:
+                snapshot = self.stats_queue.get_nowait()
+            except queue.Empty:
+                return
+            self.snapshots[snapshot["worker_id"]] = snapshot
+
+    def _collect(self):
+        """Export worker samples with a worker label plus fleet totals"""
+        families = {}
+        for worker_id, snapshot in sorted(self.snapshots.items()):
+            for (name, labels), value in snapshot["samples"].items():
+                families.setdefault(name, []).append(((("worker", worker_id),) + tuple(labels), value))
+        for name, values in families.items():
+            yield name, "untyped", "Worker metric", values
+
+        alive = sum(1 for worker in self.workers if worker.process is not None and worker.process.is_alive())
+        yield "vcb_fleet_workers_alive", "gauge", "Worker processes currently running", [((), alive)]
+        yield "vcb_fleet_worker_restarts", "gauge", "Consecutive restarts per worker", [
+            ((("worker", worker.worker_id),), worker.restarts) for worker in self.workers
+        ]
+        yield "vcb_fleet_guilds", "gauge", "Guilds across all workers", [
+            ((), sum(snapshot["guilds"] for snapshot in self.snapshots.values()))
+        ]
+        yield "vcb_fleet_temp_channels", "gauge", "Temporary channels across all workers", [
+            ((), sum(snapshot["temp_channels"] for snapshot in self.snapshots.values()))
+        ]
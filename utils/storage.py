@@ -0,0 +1,195 @@
+"""
+Persistent storage backends for the temporary channel registry
+"""
+import asyncio
+import json
+import logging
+import sqlite3
+
+
+class RegistryBackend:
+    """Interface for registry storage backends.
+
+    State is stored as JSON values grouped by namespace, e.g.
+    ``{"channels": {"1234": {"guild_id": 1, "owner_id": 2}}}``.
+    """
+
+    def load(self):
+        """Return all stored state as {namespace: {key: value}}"""
+        raise NotImplementedError
+
+    def write(self, changes):
+        """Apply {(namespace, key): value} changes, a value of None deletes the key"""
+        raise NotImplementedError
+
+    def close(self):
+        """Release any resources held by the backend"""
+
+
+class MemoryBackend(RegistryBackend):
+    """Backend that keeps state in memory only (no persistence across restarts)"""
+
+    def __init__(self):
+        self.data = {}
+
+    def load(self):
+        return {namespace: dict(values) for namespace, values in self.data.items()}
+
+    def write(self, changes):
+        for (namespace, key), value in changes.items():
+            values = self.data.setdefault(namespace, {})
+            if value is None:
+                values.pop(key, None)
+            else:
+                values[key] = value
+
+
+class SQLiteBackend(RegistryBackend):
+    """Backend that stores state in a local SQLite database"""
+
+    def __init__(self, path):
+        self.path = path
+        self._conn = None
+
+    def _connect(self):
+        if self._conn is None:
+            # Only ever used from one worker thread at a time (see WriteBehindStore)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS state ("
+                "namespace TEXT NOT NULL, "
+                "key TEXT NOT NULL, "
+                "value TEXT NOT NULL, "
+                "PRIMARY KEY (namespace, key))"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def load(self):
+        state = {}
+        for namespace, key, value in self._connect().execute("SELECT namespace, key, value FROM state"):
+            state.setdefault(namespace, {})[key] = json.loads(value)
+        return state
+
+    def write(self, changes):
+        upserts = []
+        deletes = []
+        for (namespace, key), value in changes.items():
+            if value is None:
+                deletes.append((namespace, key))
+            else:
+                upserts.append((namespace, key, json.dumps(value)))
+
+        conn = self._connect()
+        with conn:
+            if upserts:
+                conn.executemany(
+                    "INSERT INTO state (namespace, key, value) VALUES (?, ?, ?) "
+                    "ON CONFLICT (namespace, key) DO UPDATE SET value = excluded.value",
+                    upserts
+                )
+            if deletes:
+                conn.executemany("DELETE FROM state WHERE namespace = ? AND key = ?", deletes)
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+            self._conn = None
+
+
+def create_backend(config):
+    """Create the registry backend selected in the bot configuration"""
+    backend = config.REGISTRY_BACKEND.lower()
+    if backend == "sqlite":
+        return SQLiteBackend(config.REGISTRY_PATH)
+    if backend == "memory":
+        return MemoryBackend()
+    raise ValueError(f"Unknown registry backend: {config.REGISTRY_BACKEND}")
+
+
+class WriteBehindStore:
+    """Buffers registry writes and flushes them to a backend in the background.
+
+    put() and delete() only touch an in-memory dict, so callers on the
+    event loop never wait for disk. Repeated writes to the same key between
+    flushes are coalesced into one.
+    """
+
+    def __init__(self, backend, flush_interval=2.0, max_batch=500, logger=None):
+        self.backend = backend
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.logger = logger or logging.getLogger(__name__)
+        self._pending = {}  # {(namespace, key): value or None}
+        self._wake = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task = None
+        self._closing = False
+        self.metrics = {"writes": 0, "flushes": 0, "flushed_keys": 0, "errors": 0}
+
+    def put(self, namespace, key, value):
+        """Queue a value to be stored"""
+        self._pending[(namespace, str(key))] = value
+        self.metrics["writes"] += 1
+        if len(self._pending) >= self.max_batch:
+            self._wake.set()
+
+    def delete(self, namespace, key):
+        """Queue a key to be removed"""
+        self.put(namespace, key, None)
+
+    @property
+    def pending(self):
+        """Number of keys waiting to be flushed"""
+        return len(self._pending)
+
+    async def load(self):
+        """Load all stored state without blocking the event loop"""
+        return await asyncio.to_thread(self.backend.load)
+
+    def start(self):
+        """Start the background flush task"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        while not self._closing:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
+
+    async def flush(self):
+        """Write all pending changes to the backend"""
+        async with self._flush_lock:
+            if not self._pending:
+                return
+            changes = self._pending
+            self._pending = {}
+            try:
+                await asyncio.to_thread(self.backend.write, changes)
+                self.metrics["flushes"] += 1
+                self.metrics["flushed_keys"] += len(changes)
+            except Exception as e:
+                self.metrics["errors"] += 1
+                self.logger.error("Failed to flush %d registry changes: %s", len(changes), e)
+                # Keep failed changes unless they were overwritten in the meantime
+                for key, value in changes.items():
+                    self._pending.setdefault(key, value)
+
+    async def close(self):
+        """Stop the flush task, write remaining changes and close the backend"""
+        # Let the flush loop finish its current write and exit instead of cancelling it:
+        # a cancelled to_thread() keeps writing in its thread and its changes would be lost
+        self._closing = True
+        self._wake.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+        await self.flush()
+        await asyncio.to_thread(self.backend.close)